@@ -0,0 +1,84 @@
+"""Cold-start import benchmark for the GengoWatcher entry points.
+
+Runs each entry point's imports in a fresh interpreter with ``-X importtime``
+and reports the median total import time, plus the slowest modules. The
+``interpreter`` row is a bare ``python -c pass`` for reference.
+
+    python benchmarks/bench_import.py [--runs 7] [--top 5] [--budget cli=250]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# What each start-up path imports before it can do useful work.
+TARGETS = {
+    "interpreter": "pass",
+    "cli": "import gengowatcher.main, gengowatcher.ui",
+    "headless": "import gengowatcher.main, gengowatcher.headless",
+    "notify-test": "import gengowatcher.main, gengowatcher.watcher",
+}
+
+
+def measure(code):
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(self_us)
+    return sum(modules.values()), modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="TARGET=MS",
+        help="Fail if the median import time of TARGET exceeds MS.",
+    )
+    args = parser.parse_args(argv)
+    budgets = {k: float(v) for k, v in (b.split("=", 1) for b in args.budget)}
+
+    failed = False
+    for target, code in TARGETS.items():
+        totals = []
+        slowest = {}
+        for _ in range(args.runs):
+            total, modules = measure(code)
+            totals.append(total)
+            for name, self_us in modules.items():
+                slowest[name] = max(slowest.get(name, 0), self_us)
+        median_ms = statistics.median(totals) / 1000
+        print(
+            f"{target:<12} median {median_ms:7.1f} ms  "
+            f"min {min(totals) / 1000:7.1f} ms  max {max(totals) / 1000:7.1f} ms"
+        )
+        for name, self_us in sorted(slowest.items(), key=lambda i: -i[1])[: args.top]:
+            print(f"{'':<14}{self_us / 1000:6.1f} ms  {name}")
+        budget = budgets.get(target)
+        if budget is not None and median_ms > budget:
+            print(f"{'':<14}over budget ({budget:.0f} ms)")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
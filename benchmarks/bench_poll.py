@@ -0,0 +1,287 @@
+"""Poll pipeline benchmark against a local synthetic Gengo feed server.
+
+Serves Gengo-like RSS feeds of several sizes from a local HTTP server and
+times each stage of a poll with a real GengoWatcher: ``fetch_rss`` (per
+parser backend), ``_extract_reward``, ``_process_feed_entries``,
+``_log_all_entries`` and a full ``_poll_feeds`` cycle. Each row reports
+p50/p99 latency and entry throughput.
+
+    python benchmarks/bench_poll.py [--sizes 10,100,1000] [--runs 30]
+        [--json results.json] [--baseline old.json --tolerance 0.25]
+
+With ``--baseline`` the exit status is 1 if any p50 is slower than the
+baseline by more than the tolerance.
+"""
+
+import argparse
+import concurrent.futures
+import configparser
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from gengowatcher.config import AppConfig  # noqa: E402
+from gengowatcher.parsing import PARSERS  # noqa: E402
+from gengowatcher.reward import RewardParser  # noqa: E402
+from gengowatcher.seen import SeenIndex, entry_key  # noqa: E402
+from gengowatcher.state import AppState  # noqa: E402
+from gengowatcher.watcher import GengoWatcher  # noqa: E402
+
+NEW_PER_POLL = 3
+SUMMARY = (
+    "&lt;p&gt;Language pair: Japanese &amp;gt; English&lt;br/&gt;"
+    + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 12
+    + "&lt;br/&gt;Reward: US$ {reward}&lt;/p&gt;"
+)
+
+
+def make_item(job_id):
+    reward = f"{(job_id % 40) * 1.25 + 1:.2f}"
+    return (
+        f"<item><title>Japanese to English | {job_id % 900 + 50} units | "
+        f"Reward: US$ {reward}</title>"
+        f"<link>https://gengo.com/t/jobs/details/{job_id}</link>"
+        f'<guid isPermaLink="false">gengo-job-{job_id}</guid>'
+        f"<description>{SUMMARY.format(reward=reward)}</description>"
+        "<pubDate>Sat, 21 Jun 2025 10:00:00 GMT</pubDate></item>"
+    )
+
+
+def make_feed(size, top_id=1_000_000):
+    items = "".join(make_item(job_id) for job_id in range(top_id, top_id - size, -1))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        "<title>Gengo available jobs</title><link>https://gengo.com</link>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    # /feed?size=N&new=K serves N items; each request to the same URL pushes
+    # K new jobs onto the top of the feed.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        size = int(query.get("size", ["100"])[0])
+        new = int(query.get("new", ["0"])[0])
+        with self.server.lock:
+            count = self.server.requests.get(self.path, 0)
+            self.server.requests[self.path] = count + 1
+        body = make_feed(size, top_id=1_000_000 + count * new)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Streaming fetches hang up once they have what they need.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FeedServer:
+    def __enter__(self):
+        self.server = QuietServer(("127.0.0.1", 0), FeedHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def url(self, size, new=0):
+        port = self.server.server_address[1]
+        return f"http://127.0.0.1:{port}/feed?size={size}&new={new}"
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def build_watcher(workdir, url, parser):
+    class BenchConfig(AppConfig):
+        CONFIG_FILE = str(workdir / "config.ini")
+
+    overrides = {
+        "Watcher": {
+            "feed_url": url,
+            "enable_notifications": False,
+            "enable_sound": False,
+        },
+        "Paths": {
+            "sound_file": "",
+            "log_file": str(workdir / "gengowatcher.log"),
+            "all_entries_log": str(workdir / "all_entries.csv"),
+            "job_store_db": str(workdir / "jobs.sqlite3"),
+        },
+        "Logging": {"job_store_enabled": True},
+        "Parsing": {"parser": parser},
+    }
+    ini = configparser.ConfigParser()
+    for section, settings in AppConfig.DEFAULT_CONFIG.items():
+        ini[section] = {
+            key: str(overrides.get(section, {}).get(key, value))
+            for key, value in settings.items()
+        }
+    with open(BenchConfig.CONFIG_FILE, "w", encoding="utf-8") as f:
+        ini.write(f)
+
+    logger = logging.getLogger("bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    config = BenchConfig()
+    state = AppState(logger, state_file_path=workdir / "state.json")
+    watcher = GengoWatcher(config, state, logger)
+    watcher.open_in_browser = lambda url: None
+    return watcher
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(fn, runs, setup=None, warmup=2):
+    samples = []
+    for i in range(warmup + runs):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def report(results, name, size, samples, entries):
+    p50 = percentile(samples, 50) * 1000
+    p99 = percentile(samples, 99) * 1000
+    throughput = entries * len(samples) / sum(samples)
+    results[f"{name}[{size}]"] = {"p50_ms": p50, "p99_ms": p99, "per_s": throughput}
+    print(
+        f"{name:<28}{size:>6}  p50 {p50:9.3f} ms  p99 {p99:9.3f} ms  "
+        f"{throughput:12,.0f} entries/s"
+    )
+
+
+def bench_size(server, workdir, size, runs, parsers, results):
+    watcher = build_watcher(workdir, server.url(size), PARSERS[0])
+    feed = watcher.feeds[0]
+    entries = watcher.fetch_rss(feed).entries
+    try:
+        for parser in parsers:
+            watcher.parser = parser
+            # Unprimed feeds are always read to the end, even when streaming.
+            samples = measure(lambda: watcher.fetch_rss(feed), runs)
+            report(results, f"fetch_rss/{parser}", size, samples, size)
+
+        def fresh_parser():
+            watcher.reward_parser = RewardParser(cache_size=size)
+            return ()
+
+        samples = measure(
+            lambda: [watcher._extract_reward(e) for e in entries], runs, fresh_parser
+        )
+        report(results, "_extract_reward/cold", size, samples, size)
+        samples = measure(lambda: [watcher._extract_reward(e) for e in entries], runs)
+        report(results, "_extract_reward/cached", size, samples, size)
+
+        def seen_all_but_new():
+            seen = SeenIndex(max_size=size * 2)
+            for entry in reversed(entries[NEW_PER_POLL:]):
+                seen.add(entry_key(entry))
+            watcher.state.seen = seen
+            return ()
+
+        watcher.notifier.submit = lambda notifications: True
+        samples = measure(
+            lambda: watcher._process_feed_entries(entries, feed.name),
+            runs,
+            seen_all_but_new,
+        )
+        report(results, "_process_feed_entries", size, samples, size)
+
+        new_entries = entries[:NEW_PER_POLL]
+        samples = measure(
+            lambda: watcher._log_all_entries(feed.name, entries, new_entries), runs
+        )
+        report(results, "_log_all_entries", size, samples, size)
+    finally:
+        watcher.handle_exit()
+
+    for parser in parsers:
+        watcher = build_watcher(workdir, server.url(size, new=NEW_PER_POLL), parser)
+        watcher.notifier.submit = lambda notifications: True
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                watcher._poll_feeds(executor, watcher.feeds)  # primes the feed
+                samples = measure(
+                    lambda: watcher._poll_feeds(executor, watcher.feeds), runs
+                )
+            report(results, f"poll_cycle/{parser}", size, samples, size)
+        finally:
+            watcher.handle_exit()
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before and result["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p50 {before['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--parsers", default=",".join(PARSERS))
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON.")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare with a --json.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    parsers = args.parsers.split(",")
+
+    results = {}
+    with FeedServer() as server, tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            workdir = Path(tmp) / str(size)
+            workdir.mkdir()
+            bench_size(server, workdir, size, args.runs, parsers, results)
+            print()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,39 @@
+import collections
 import configparser
+import os
 from pathlib import Path
 import sys
 import threading
 
+FeedSpec = collections.namedtuple("FeedSpec", ["name", "url", "interval"])
+
+
+class ConfigError(Exception):
+    pass
+
 
 class AppConfig:
     CONFIG_FILE = "config.ini"
+    FEEDS_SECTION = "Feeds"
+    DEFAULT_FEED_NAME = "default"
     DEFAULT_CONFIG = {
         "Watcher": {
             "feed_url": "https://www.theguardian.com/uk/rss",
             "check_interval": 31,
             "min_reward": 0.0,
+            "reward_currency_symbols": "US$, $",
             "enable_notifications": True,
             "enable_sound": True,
             "use_custom_user_agent": False,
+            "seen_index_size": 2000,
+            "seen_index_max_age_days": 7.0,
+            "state_flush_interval": 2.0,
+            "notification_workers": 2,
+            "notification_queue_size": 50,
+            "notification_coalesce_threshold": 3,
+            "timing_history": 100,
+            "config_watch_interval": 2.0,
+            "persist_pause": True,
         },
         "Paths": {
             "sound_file": "C:\\Windows\\Media\\chimes.wav",
@@ -22,20 +42,63 @@ class AppConfig:
             "browser_path": "",
             "browser_args": "--new-window {url}",
             "all_entries_log": "logs/all_entries.csv",
+            "job_store_db": "logs/jobs.sqlite3",
+            "profile_dir": "logs/profiles",
         },
         "Logging": {
             "log_max_bytes": 1000000,
             "log_backup_count": 3,
             "log_main_enabled": True,
             "log_all_entries_enabled": True,
+            "all_entries_mode": "new",
+            "job_store_enabled": False,
+        },
+        "Scheduler": {
+            "adaptive": False,
+            "min_interval": 15,
+            "max_interval": 300,
+            "jitter": 0.1,
+            "target_jobs_per_poll": 0.5,
+            "smoothing": 0.3,
+        },
+        "Parsing": {
+            "parser": "feedparser",
+            "stop_after_seen": 3,
+        },
+        "Metrics": {
+            "enabled": False,
+            "host": "127.0.0.1",
+            "port": 9108,
+        },
+        "Control": {
+            "enabled": False,
+            "socket_path": "gengowatcher.sock",
+        },
+        "Filters": {
+            "language_pairs": "",
+            "include_keywords": "",
+            "exclude_keywords": "",
+            "min_units": 0,
+            "max_units": 0,
+            "min_reward_per_unit": 0.0,
+        },
+        "Network": {
+            "max_backoff": 300,
+            "user_agent_email": "your_email@example.com",
+            "connect_timeout": 5.0,
+            "read_timeout": 15.0,
+            "pool_size": 4,
         },
-        "Network": {"max_backoff": 300, "user_agent_email": "your_email@example.com"},
     }
 
     def __init__(self):
         self._config_parser = configparser.ConfigParser()
+        # Serializes writers only. Readers take `snapshot`, an immutable view
+        # that is replaced as a whole whenever the configuration changes.
         self._lock = threading.Lock()
-        self.config = {}
+        self.snapshot = make_snapshot()
+        self._known_stamp = None
+        self._pending_stamp = None
 
         if not Path(self.CONFIG_FILE).is_file():
             self._create_default_config()
@@ -61,50 +124,130 @@ class AppConfig:
         sys.exit(0)
 
     def load_config(self):
-        with open(self.CONFIG_FILE, "r", encoding="utf-8") as f:
-            self._config_parser.read_file(f)
+        try:
+            self.reload()
+        except ConfigError as e:
+            print(f"CRITICAL: {e}. Please fix or delete the file.")
+            sys.exit(1)
+
+    def reload(self):
+        # Reads into a fresh parser so a bad edit leaves the current settings,
+        # and the parser that save_config writes back, untouched.
+        stamp = self._file_stamp()
+        parser = configparser.ConfigParser()
+        values = {}
+        try:
+            with open(self.CONFIG_FILE, "r", encoding="utf-8") as f:
+                parser.read_file(f)
+            for section, defaults in self.DEFAULT_CONFIG.items():
+                if not parser.has_section(section):
+                    parser.add_section(section)
+                values[section] = {}
+                for key, default_val in defaults.items():
+                    if isinstance(default_val, bool):
+                        method = parser.getboolean
+                    elif isinstance(default_val, int):
+                        method = parser.getint
+                    elif isinstance(default_val, float):
+                        method = parser.getfloat
+                    else:
+                        method = parser.get
+                    values[section][key] = method(section, key, fallback=default_val)
+            feeds = self._parse_feeds(parser, values["Watcher"]["feed_url"])
+        except (OSError, configparser.Error, ValueError) as e:
+            # Report a broken file once, not on every check until it is fixed.
+            self._known_stamp = stamp
+            raise ConfigError(f"Error reading '{self.CONFIG_FILE}': {e}") from e
         with self._lock:
-            try:
-                for section, defaults in self.DEFAULT_CONFIG.items():
-                    if not self._config_parser.has_section(section):
-                        self._config_parser.add_section(section)
-                    self.config[section] = {}
-                    for key, default_val in defaults.items():
-                        if isinstance(default_val, bool):
-                            method = self._config_parser.getboolean
-                        elif isinstance(default_val, int):
-                            method = self._config_parser.getint
-                        elif isinstance(default_val, float):
-                            method = self._config_parser.getfloat
-                        else:
-                            method = self._config_parser.get
-                        self.config[section][key] = method(
-                            section, key, fallback=default_val
-                        )
-            except (configparser.Error, ValueError) as e:
-                print(
-                    f"CRITICAL: Error reading '{self.CONFIG_FILE}': {e}. "
-                    "Please fix or delete the file."
-                )
-                sys.exit(1)
+            self._config_parser = parser
+            self.snapshot = make_snapshot(values, feeds)
+            self._known_stamp = stamp
+            self._pending_stamp = None
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.CONFIG_FILE)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def file_changed(self):
+        # True once the file differs from what was last read or saved and
+        # has looked the same on two calls in a row, so a file an editor is
+        # still writing is not picked up half-written.
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._known_stamp:
+            self._pending_stamp = None
+            return False
+        if stamp != self._pending_stamp:
+            self._pending_stamp = stamp
+            return False
+        return True
+
+    def _parse_feeds(self, parser, feed_url):
+        feeds = []
+        feed_url = feed_url.strip()
+        if feed_url:
+            feeds.append(FeedSpec(self.DEFAULT_FEED_NAME, feed_url, None))
+        if parser.has_section(self.FEEDS_SECTION):
+            for name, value in parser.items(self.FEEDS_SECTION):
+                parts = value.split()
+                if not parts:
+                    continue
+                if any(feed.name == name for feed in feeds):
+                    raise ValueError(f"Duplicate feed name '{name}' in [Feeds]")
+                interval = int(parts[1]) if len(parts) > 1 else None
+                feeds.append(FeedSpec(name, parts[0], interval))
+        return feeds
+
+    def get_feeds(self):
+        return list(self.snapshot.feeds)
 
     def save_config(self):
         with self._lock:
-            for section, settings in self.config.items():
+            snapshot = self.snapshot
+            for section in self.DEFAULT_CONFIG:
                 if not self._config_parser.has_section(section):
                     self._config_parser.add_section(section)
-                for key, value in settings.items():
+                for key, value in getattr(snapshot, section)._asdict().items():
                     self._config_parser.set(section, key, str(value))
             try:
                 with open(self.CONFIG_FILE, "w", encoding="utf-8") as f:
                     self._config_parser.write(f)
             except IOError as e:
                 print(f"Error saving config: {e}")
+            # Our own write is not an external edit to reload.
+            self._known_stamp = self._file_stamp()
 
     def get(self, section, key):
-        with self._lock:
-            return self.config[section][key]
+        return getattr(getattr(self.snapshot, section), key)
 
     def set(self, section, key, value):
         with self._lock:
-            self.config[section][key] = value
+            snapshot = self.snapshot
+            settings = getattr(snapshot, section)._replace(**{key: value})
+            self.snapshot = snapshot._replace(**{section: settings})
+
+
+# One immutable namedtuple per section, e.g. `snapshot.Watcher.min_reward`.
+SECTION_TYPES = {
+    section: collections.namedtuple(f"{section}Settings", list(defaults))
+    for section, defaults in AppConfig.DEFAULT_CONFIG.items()
+}
+ConfigSnapshot = collections.namedtuple(
+    "ConfigSnapshot", list(SECTION_TYPES) + ["feeds"]
+)
+
+
+def make_snapshot(values=None, feeds=()):
+    # Sections and keys missing from `values` take their defaults.
+    values = values or {}
+    return ConfigSnapshot(
+        feeds=tuple(feeds),
+        **{
+            section: SECTION_TYPES[section](
+                **{**AppConfig.DEFAULT_CONFIG[section], **values.get(section, {})}
+            )
+            for section in SECTION_TYPES
+        },
+    )
@@ -0,0 +1,182 @@
+import argparse
+import json
+import math
+import os
+import socket
+import stat
+import sys
+import threading
+
+DEFAULT_SOCKET = "gengowatcher.sock"
+COMMANDS = ("pause", "resume", "check", "setminreward", "stats", "reload")
+
+
+class ControlError(Exception):
+    pass
+
+
+def supported():
+    return hasattr(socket, "AF_UNIX")
+
+
+def execute(watcher, request):
+    command = request.get("command")
+    if command == "pause":
+        return {"paused": True, "changed": watcher.pause()}
+    if command == "resume":
+        return {"paused": False, "changed": watcher.resume()}
+    if command == "check":
+        watcher.request_check()
+        return {}
+    if command == "setminreward":
+        try:
+            amount = float(request["amount"])
+        except (KeyError, TypeError, ValueError):
+            raise ControlError("setminreward needs a numeric 'amount'") from None
+        if not math.isfinite(amount) or amount < 0:
+            raise ControlError("setminreward needs a finite, non-negative 'amount'")
+        watcher.set_min_reward(amount)
+        return {"min_reward": amount}
+    if command == "stats":
+        return watcher.stats()
+    if command == "reload":
+        watcher.request_reload()
+        return {}
+    raise ControlError(f"unknown command {command!r}; expected one of {COMMANDS}")
+
+
+def _handler_class():
+    from socketserver import StreamRequestHandler
+
+    class ControlHandler(StreamRequestHandler):
+        # One JSON object per line in each direction; a connection may send
+        # any number of requests.
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ControlError("request must be a JSON object")
+                    response = {
+                        "ok": True,
+                        "result": execute(self.server.watcher, request),
+                    }
+                except (json.JSONDecodeError, ControlError) as e:
+                    response = {"ok": False, "error": str(e)}
+                except Exception as e:
+                    self.server.watcher.logger.error(f"Control request failed: {e}")
+                    response = {"ok": False, "error": str(e)}
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    return ControlHandler
+
+
+def _remove_stale_socket(path):
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)  # left behind by a process that did not exit cleanly
+            return
+    raise OSError(f"another instance is already listening on {path}")
+
+
+class ControlServer:
+    def __init__(self, watcher, path=DEFAULT_SOCKET):
+        from socketserver import ThreadingUnixStreamServer
+
+        self.path = str(path)
+        _remove_stale_socket(self.path)
+        self._server = ThreadingUnixStreamServer(
+            self.path, _handler_class(), bind_and_activate=False
+        )
+        self._server.daemon_threads = True
+        self._server.watcher = watcher
+        try:
+            self._server.server_bind()
+            # Only the owning user may control the watcher.
+            os.chmod(self.path, 0o600)
+            self._server.server_activate()
+        except OSError:
+            self._server.server_close()
+            raise
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True, name="ControlServer"
+        )
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def send(request, path=DEFAULT_SOCKET, timeout=5.0):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("the watcher closed the connection")
+    return json.loads(line)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gengowatcher.control",
+        description="Control a running GengoWatcher.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET,
+        help=f"Path to the control socket (default {DEFAULT_SOCKET}).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("pause", help="Pause feed checks.")
+    commands.add_parser("resume", help="Resume feed checks.")
+    commands.add_parser("check", help="Check all feeds now.")
+    commands.add_parser("stats", help="Print session and feed statistics as JSON.")
+    commands.add_parser("reload", help="Reload config.ini.")
+    min_reward = commands.add_parser("setminreward", help="Set the minimum reward.")
+    min_reward.add_argument("amount", type=float)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not supported():
+        print("The control socket needs Unix domain sockets.", file=sys.stderr)
+        return 1
+    request = {"command": args.command}
+    if args.command == "setminreward":
+        request["amount"] = args.amount
+    try:
+        response = send(request, args.socket)
+    except (OSError, ValueError) as e:
+        print(f"Could not reach the watcher at {args.socket}: {e}", file=sys.stderr)
+        return 1
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}", file=sys.stderr)
+        return 1
+    print(json.dumps(response["result"], indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+import re
+
+WILDCARD = "*"
+# Language names as Gengo spells them. A title is only read as a language pair
+# when both sides are one of these or a language named in `language_pairs`.
+GENGO_LANGUAGES = frozenset(
+    (
+        "arabic",
+        "bulgarian",
+        "chinese (simplified)",
+        "chinese (traditional)",
+        "czech",
+        "danish",
+        "dutch",
+        "english",
+        "english (british)",
+        "finnish",
+        "french",
+        "french (canada)",
+        "german",
+        "greek",
+        "hebrew",
+        "hindi",
+        "hungarian",
+        "indonesian",
+        "italian",
+        "japanese",
+        "korean",
+        "malay",
+        "norwegian",
+        "polish",
+        "portuguese (brazil)",
+        "portuguese (europe)",
+        "romanian",
+        "russian",
+        "serbian",
+        "slovak",
+        "spanish (latin america)",
+        "spanish (spain)",
+        "swedish",
+        "tagalog",
+        "thai",
+        "turkish",
+        "ukrainian",
+        "vietnamese",
+    )
+)
+# Gengo titles read "Japanese to English | ... | 120 units | Reward: US$ 4.80";
+# summaries carry "Language pair: Japanese &gt; English".
+_TITLE_PAIR = re.compile(r"^\s*([^|]+?)\s+(?:to|>)\s+([^|]+?)\s*(?:\||$)")
+_SUMMARY_PAIR = re.compile(
+    r"language pair:\s*([^<>&|.,;\n]+?)\s*(?:>|&gt;|\bto\b)\s*"
+    r"([^<>&|.,;\n]+?)\s*(?:[<&|.,;\n]|$)"
+)
+_UNITS = re.compile(r"(\d[\d,]*)\s*units?\b")
+
+
+def split_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_language_pair(text):
+    for separator in (">", " to "):
+        source, found, target = text.lower().partition(separator)
+        if found and source.strip() and target.strip():
+            return source.strip(), target.strip()
+    raise ValueError(f"language pair {text!r} should look like 'Japanese > English'")
+
+
+class KeywordSet:
+    # All keywords are matched as whole words by one combined alternation.
+    # Python's regex engine scans long summaries slowly, so a plain substring
+    # check runs first and the pattern only confirms a likely hit.
+    def __init__(self, keywords):
+        self.words = tuple(
+            sorted({keyword.lower() for keyword in keywords}, key=len, reverse=True)
+        )
+        self._pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(map(re.escape, self.words)) + r")(?!\w)"
+        )
+
+    def __bool__(self):
+        return bool(self.words)
+
+    def search(self, text):
+        # `text` must already be lower-cased.
+        return any(word in text for word in self.words) and bool(
+            self._pattern.search(text)
+        )
+
+
+class JobFilter:
+    # A job whose title and summary do not show its language pair or unit
+    # count is not dropped by the rules that need them.
+    def __init__(
+        self,
+        language_pairs=(),
+        include_keywords=(),
+        exclude_keywords=(),
+        min_units=0,
+        max_units=0,
+        min_reward_per_unit=0.0,
+    ):
+        if max_units and max_units < min_units:
+            raise ValueError("max_units is smaller than min_units")
+        self.language_pairs = frozenset(
+            parse_language_pair(pair) for pair in language_pairs
+        )
+        self._languages = GENGO_LANGUAGES.union(
+            side for pair in self.language_pairs for side in pair if side != WILDCARD
+        )
+        self._include = KeywordSet(include_keywords)
+        self._exclude = KeywordSet(exclude_keywords)
+        self.min_units = min_units
+        self.max_units = max_units
+        self.min_reward_per_unit = min_reward_per_unit
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            language_pairs=split_list(config.get("Filters", "language_pairs")),
+            include_keywords=split_list(config.get("Filters", "include_keywords")),
+            exclude_keywords=split_list(config.get("Filters", "exclude_keywords")),
+            min_units=config.get("Filters", "min_units"),
+            max_units=config.get("Filters", "max_units"),
+            min_reward_per_unit=config.get("Filters", "min_reward_per_unit"),
+        )
+
+    @property
+    def active(self):
+        return bool(
+            self.language_pairs
+            or self._include
+            or self._exclude
+            or self.min_units
+            or self.max_units
+            or self.min_reward_per_unit
+        )
+
+    def _find_pair(self, title, summary):
+        # The summary's label is explicit, so it wins over the title. Either
+        # way, anything but two known language names counts as unknown.
+        for match in (_SUMMARY_PAIR.search(summary), _TITLE_PAIR.search(title)):
+            if match:
+                pair = match.group(1).strip(), match.group(2).strip()
+                if all(side in self._languages for side in pair):
+                    return pair
+        return None
+
+    def _pair_allowed(self, title, summary):
+        pair = self._find_pair(title, summary)
+        if pair is None:
+            return True
+        source, target = pair
+        pairs = self.language_pairs
+        return (
+            (source, target) in pairs
+            or (WILDCARD, target) in pairs
+            or (source, WILDCARD) in pairs
+        )
+
+    def _units_allowed(self, title, summary, reward):
+        match = _UNITS.search(title) or _UNITS.search(summary)
+        if match is None:
+            return True
+        units = int(match.group(1).replace(",", ""))
+        if units < self.min_units or (self.max_units and units > self.max_units):
+            return False
+        return not (units and reward / units < self.min_reward_per_unit)
+
+    def matches(self, entry, reward):
+        # Cheapest checks first; everything works on lower-cased text.
+        title = (entry.get("title") or "").lower()
+        summary = (entry.get("summary") or "").lower()
+        if self.language_pairs and not self._pair_allowed(title, summary):
+            return False
+        if (
+            self.min_units or self.max_units or self.min_reward_per_unit
+        ) and not self._units_allowed(title, summary, reward):
+            return False
+        if self._exclude and (
+            self._exclude.search(title) or self._exclude.search(summary)
+        ):
+            return False
+        if self._include and not (
+            self._include.search(title) or self._include.search(summary)
+        ):
+            return False
+        return True
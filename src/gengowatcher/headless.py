@@ -0,0 +1,66 @@
+import datetime
+import json
+import logging
+import signal
+import sys
+
+from .config import AppConfig
+from .state import AppState
+from .watcher import GengoWatcher
+from .logsetup import create_file_handler
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "time": datetime.datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload)
+
+
+def main():
+    log = logging.getLogger("gengowatcher")
+    log.setLevel(logging.INFO)
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(JsonFormatter())
+    log.addHandler(stdout_handler)
+
+    try:
+        config = AppConfig()
+        if config.get("Logging", "log_main_enabled"):
+            try:
+                log.addHandler(create_file_handler(config))
+            except IOError as e:
+                log.error(f"Could not set up file logging: {e}")
+        state = AppState.from_config(config, logger=log)
+        watcher = GengoWatcher(config=config, state=state, logger=log)
+    except Exception as e:
+        log.critical(f"A critical error occurred during initialization: {e}")
+        sys.exit(1)
+
+    # Signal handlers only flag the shutdown; saving happens below, outside the
+    # handler, so it can never re-enter a lock held by the interrupted poll.
+    def request_shutdown(signum, frame):
+        log.info(f"Received {signal.Signals(signum).name}.")
+        watcher.stop()
+
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+
+    try:
+        watcher.run()
+    except Exception as e:
+        log.exception(f"Watcher crashed: {e}")
+    finally:
+        watcher.handle_exit()
+        log.info("GengoWatcher has shut down.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import csv
+import datetime
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from .seen import entry_key, merge_truncated
+
+
+class CsvJobLog:
+    MODES = ("new", "sightings")
+    HEADERS = {
+        "new": ["timestamp", "title", "reward", "link", "summary"],
+        "sightings": ["first_seen", "last_seen", "title", "reward", "link", "summary"],
+    }
+    # Only these fields of an open sighting are kept across restarts.
+    SAVED_FIELDS = ("id", "title", "link", "summary")
+
+    def __init__(self, path, reward_fn, mode="new", save_interval=60.0, logger=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown all_entries_mode '{mode}'")
+        self.mode = mode
+        self._reward_fn = reward_fn
+        self.save_interval = save_interval
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._active = {}
+        self._save_timer = None
+        log_path = Path(path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(log_path, "a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        if log_path.stat().st_size == 0:
+            self._writer.writerow(self.HEADERS[mode])
+            self._file.flush()
+        # Jobs still listed are not written on exit; their sightings are saved
+        # here and picked up again by the next run.
+        self.open_path = log_path.with_suffix(".sightings.json")
+        if mode == "sightings":
+            self._load_open()
+
+    def _row(self, entry):
+        return [
+            entry.get("title", "N/A"),
+            self._reward_fn(entry),
+            entry.get("link", "N/A"),
+            entry.get("summary", "N/A"),
+        ]
+
+    def log_new(self, entries):
+        if self.mode != "new" or not entries:
+            return
+        timestamp = datetime.datetime.now().isoformat()
+        with self._lock:
+            if self._file.closed:
+                return
+            for entry in entries:
+                self._writer.writerow([timestamp] + self._row(entry))
+            self._file.flush()
+
+    def log_sightings(self, feed_name, entries, partial=False):
+        # A partial list only covers the top of the feed, so jobs below the
+        # point where reading stopped are still assumed to be listed.
+        if self.mode != "sightings":
+            return
+        timestamp = datetime.datetime.now().isoformat()
+        with self._lock:
+            if self._file.closed:
+                return
+            previous = self._active.get(feed_name, {})
+            listed = {entry_key(entry): entry for entry in entries}
+            if partial:
+                order, gone = merge_truncated(list(previous), list(listed))
+            else:
+                order = list(listed)
+                gone = [key for key in previous if key not in listed]
+            current = {}
+            for key in order:
+                sighting = previous.get(key) or [timestamp, None, listed[key]]
+                sighting[1] = timestamp
+                current[key] = sighting
+            self._active[feed_name] = current
+            self._write_sightings(previous[key] for key in gone)
+            self._schedule_save()
+
+    def touch(self, feed_name):
+        if self.mode != "sightings":
+            return
+        timestamp = datetime.datetime.now().isoformat()
+        with self._lock:
+            for sighting in self._active.get(feed_name, {}).values():
+                sighting[1] = timestamp
+
+    def _write_sightings(self, sightings):
+        wrote = False
+        for first_seen, last_seen, entry in sightings:
+            self._writer.writerow([first_seen, last_seen] + self._row(entry))
+            wrote = True
+        if wrote:
+            self._file.flush()
+
+    def _load_open(self):
+        try:
+            with open(self.open_path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            return  # a damaged file only loses the open sightings
+        for feed_name, sightings in saved.items():
+            self._active[feed_name] = {
+                entry_key(entry): [first_seen, last_seen, entry]
+                for first_seen, last_seen, entry in sightings
+            }
+
+    def _schedule_save(self):
+        # Saves are batched off the polling thread; close() always saves.
+        if self._save_timer is not None or self.save_interval <= 0:
+            return
+        self._save_timer = threading.Timer(self.save_interval, self._save_later)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _save_later(self):
+        with self._lock:
+            self._save_timer = None
+            if self._file.closed:
+                return
+            try:
+                self._save_open()
+            except OSError as e:
+                if self.logger:
+                    self.logger.error(f"Could not save open job sightings: {e}")
+
+    def _save_open(self):
+        payload = json.dumps(
+            {
+                feed_name: [
+                    [
+                        first_seen,
+                        last_seen,
+                        {
+                            field: entry[field]
+                            for field in self.SAVED_FIELDS
+                            if entry.get(field) is not None
+                        },
+                    ]
+                    for first_seen, last_seen, entry in sightings.values()
+                ]
+                for feed_name, sightings in self._active.items()
+            }
+        )
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.open_path.name}.", suffix=".tmp", dir=self.open_path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.open_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self.mode == "sightings":
+                try:
+                    self._save_open()
+                except OSError:
+                    # Better a row with an early last_seen than a lost job.
+                    for feed_sightings in self._active.values():
+                        self._write_sightings(feed_sightings.values())
+            self._active = {}
+            self._file.close()
@@ -0,0 +1,194 @@
+import argparse
+import collections
+import datetime
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+from .seen import entry_key, merge_truncated
+
+Job = collections.namedtuple(
+    "Job",
+    ["key", "feed", "title", "reward", "link", "summary", "first_seen", "last_seen"],
+)
+HourlyRewards = collections.namedtuple("HourlyRewards", ["hour", "jobs", "total"])
+
+DEFAULT_DB = "logs/jobs.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    feed TEXT NOT NULL,
+    title TEXT,
+    reward REAL NOT NULL DEFAULT 0,
+    link TEXT,
+    summary TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_link ON jobs (link);
+CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS jobs_reward ON jobs (reward);
+"""
+
+UPSERT = """
+INSERT INTO jobs (key, feed, title, reward, link, summary, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+
+def _now():
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def _since(hours):
+    if hours is None:
+        return ""
+    since = datetime.datetime.now() - datetime.timedelta(hours=hours)
+    return since.isoformat(timespec="seconds")
+
+
+class JobStore:
+    def __init__(self, path, reward_fn=None):
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._reward_fn = reward_fn or (lambda entry: 0.0)
+        self._lock = threading.Lock()
+        self._active = {}
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def record(self, feed_name, entries, partial=False):
+        timestamp = _now()
+        rows = []
+        keys = []
+        for entry in entries:
+            key = entry_key(entry)
+            if not key:
+                continue
+            keys.append(key)
+            rows.append(
+                (
+                    key,
+                    feed_name,
+                    entry.get("title"),
+                    self._reward_fn(entry),
+                    entry.get("link"),
+                    entry.get("summary"),
+                    timestamp,
+                    timestamp,
+                )
+            )
+        with self._lock:
+            if self._conn is None:
+                return
+            previous = self._active.get(feed_name, [])
+            unreached = []
+            if partial:
+                # Jobs below the point where reading stopped are assumed to be
+                # still listed; those above it that are missing have left.
+                order, _ = merge_truncated(previous, list(dict.fromkeys(keys)))
+                unreached = order[len(set(keys)) :]
+                keys = order
+            self._active[feed_name] = keys
+            with self._conn:
+                self._conn.executemany(UPSERT, rows)
+                if unreached:
+                    self._conn.executemany(
+                        "UPDATE jobs SET last_seen = ? WHERE key = ?",
+                        [(timestamp, key) for key in unreached],
+                    )
+
+    def touch(self, feed_name):
+        timestamp = _now()
+        with self._lock:
+            keys = self._active.get(feed_name)
+            if self._conn is None or not keys:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE jobs SET last_seen = ? WHERE key = ?",
+                    [(timestamp, key) for key in keys],
+                )
+
+    def jobs(self, min_reward=0.0, hours=None, limit=None):
+        query = (
+            "SELECT key, feed, title, reward, link, summary, first_seen, last_seen"
+            " FROM jobs WHERE reward >= ? AND first_seen >= ?"
+            " ORDER BY first_seen DESC"
+        )
+        params = [min_reward, _since(hours)]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [Job(*row) for row in self._conn.execute(query, params)]
+
+    def rewards_by_hour(self, hours=None):
+        query = (
+            "SELECT CAST(substr(first_seen, 12, 2) AS INTEGER) AS hour,"
+            " COUNT(*), ROUND(SUM(reward), 2)"
+            " FROM jobs WHERE first_seen >= ? GROUP BY hour ORDER BY hour"
+        )
+        with self._lock:
+            return [
+                HourlyRewards(*row)
+                for row in self._conn.execute(query, (_since(hours),))
+            ]
+
+    def close(self):
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.close()
+            self._conn = None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gengowatcher.jobstore",
+        description="Query the GengoWatcher job store.",
+    )
+    parser.add_argument(
+        "--db",
+        default=DEFAULT_DB,
+        help=f"Path to the job store (default {DEFAULT_DB}).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    jobs = commands.add_parser("jobs", help="List jobs, newest first.")
+    jobs.add_argument("--min-reward", type=float, default=0.0)
+    jobs.add_argument("--hours", type=float, help="Only jobs first seen this recently.")
+    jobs.add_argument("--limit", type=int)
+    rewards = commands.add_parser(
+        "rewards-by-hour", help="Job count and total reward per hour of day."
+    )
+    rewards.add_argument(
+        "--hours", type=float, help="Only jobs first seen this recently."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not Path(args.db).is_file():
+        print(f"Job store not found: {args.db}", file=sys.stderr)
+        return 1
+    store = JobStore(args.db)
+    try:
+        if args.command == "jobs":
+            for job in store.jobs(args.min_reward, args.hours, args.limit):
+                print(f"{job.first_seen}\t{job.reward:.2f}\t{job.title}\t{job.link}")
+        else:
+            for row in store.rewards_by_hour(args.hours):
+                print(f"{row.hour:02d}:00\t{row.jobs}\t{row.total:.2f}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
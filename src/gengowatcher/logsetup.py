@@ -0,0 +1,32 @@
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+FILE_HANDLER_NAME = "gengowatcher-file"
+
+
+def create_file_handler(config) -> RotatingFileHandler:
+    log_file = Path(config.get("Paths", "log_file"))
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=config.get("Logging", "log_max_bytes"),
+        backupCount=config.get("Logging", "log_backup_count"),
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler.set_name(FILE_HANDLER_NAME)
+    return file_handler
+
+
+def replace_file_handler(logger, config):
+    # Swaps the log file handler for one matching the current settings.
+    for handler in list(logger.handlers):
+        if handler.get_name() == FILE_HANDLER_NAME:
+            logger.removeHandler(handler)
+            handler.close()
+    if config.get("Logging", "log_main_enabled"):
+        try:
+            logger.addHandler(create_file_handler(config))
+        except IOError as e:
+            logger.error(f"Could not set up file logging: {e}")
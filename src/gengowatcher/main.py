@@ -1,60 +1,55 @@
+import argparse
 import logging
 import threading
 import sys
-from pathlib import Path
-from logging.handlers import RotatingFileHandler
-import collections
-import datetime
-
-from rich.console import Console
-from rich.text import Text
-from rich.theme import Theme
 
 from .config import AppConfig
 from .state import AppState
 from .watcher import GengoWatcher
-from .ui import CommandLineInterface
-
-APP_THEME = Theme(
-    {
-        "info": "cyan",
-        "success": "bold green",
-        "warning": "yellow",
-        "error": "bold red",
-        "title": "bold magenta",
-        "header": "bold bright_white",
-        "label": "cyan",
-        "value": "white",
-        "path": "italic yellow",
-        "panel_border": "bright_blue",
-        "table_header": "bold magenta",
-        "prompt": "bold white",
-        "input": "white",
-    }
-)
-
-
-class UILoggingHandler(logging.Handler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.log_queue = collections.deque(maxlen=10)
-
-    def emit(self, record):
-        level_style_map = {
-            logging.INFO: "info",
-            logging.WARNING: "warning",
-            logging.ERROR: "error",
-            logging.CRITICAL: "bold red",
-        }
-        style = level_style_map.get(record.levelno, "default")
-        message = (
-            f"{datetime.datetime.fromtimestamp(record.created).strftime('%H:%M:%S')} - "
-            f"{record.getMessage()}"
-        )
-        self.log_queue.append(Text(message, style=style))
-
-
-def main():
+from .logsetup import LOG_FORMAT, create_file_handler
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="gengowatcher", description="Watch Gengo RSS feeds for new jobs."
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without the TUI and log JSON lines to stdout.",
+    )
+    mode.add_argument(
+        "--notify-test",
+        action="store_true",
+        help="Send a test notification and exit.",
+    )
+    return parser.parse_args(argv)
+
+
+def run_notify_test():
+    log = logging.getLogger("gengowatcher")
+    log.setLevel(logging.INFO)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log.addHandler(handler)
+    try:
+        config = AppConfig()
+        state = AppState.from_config(config, logger=log)
+        watcher = GengoWatcher(config=config, state=state, logger=log)
+    except Exception as e:
+        log.critical(f"A critical error occurred during initialization: {e}")
+        sys.exit(1)
+    watcher.run_notify_test()
+    watcher.notifier.stop()
+    watcher.sound.stop(timeout=10)
+
+
+def run_tui():
+    from rich.console import Console
+
+    from .ui import APP_THEME, CommandLineInterface, UILoggingHandler
+
     console = Console(theme=APP_THEME)
 
     log = logging.getLogger("gengowatcher")
@@ -67,21 +62,11 @@ def main():
 
         if config.get("Logging", "log_main_enabled"):
             try:
-                log_file = Path(config.get("Paths", "log_file"))
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-                file_handler = RotatingFileHandler(
-                    log_file,
-                    maxBytes=config.get("Logging", "log_max_bytes"),
-                    backupCount=config.get("Logging", "log_backup_count"),
-                )
-                file_handler.setFormatter(
-                    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-                )
-                log.addHandler(file_handler)
+                log.addHandler(create_file_handler(config))
             except IOError as e:
                 console.print(f"[error]Could not set up file logging: {e}[/]")
 
-        state = AppState(logger=log)
+        state = AppState.from_config(config, logger=log)
         watcher = GengoWatcher(config=config, state=state, logger=log)
 
     except Exception as e:
@@ -96,6 +81,7 @@ def main():
     cli = CommandLineInterface(
         watcher, config, state, console, log_queue=ui_handler.log_queue
     )
+    ui_handler.on_emit = cli.wake
 
     watcher_thread = threading.Thread(
         target=watcher.run, daemon=True, name="WatcherThread"
@@ -107,11 +93,22 @@ def main():
     except Exception as e:
         log.error(f"UI loop crashed: {e}")
     finally:
-        if not watcher.shutdown_event.is_set():
-            watcher.handle_exit()
+        watcher.handle_exit()
         watcher_thread.join(timeout=2)
         console.print("[info]GengoWatcher has shut down.[/]")
 
 
+def main(argv=None):
+    args = parse_args(argv)
+    if args.headless:
+        from .headless import main as run_headless
+
+        run_headless()
+    elif args.notify_test:
+        run_notify_test()
+    else:
+        run_tui()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,248 @@
+import bisect
+import threading
+import time
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def value(self, **labels):
+        with self._lock:
+            return self._samples.get(self._key(labels), 0)
+
+    def render(self):
+        with self._lock:
+            samples = sorted(
+                (key, self._snapshot(sample)) for key, sample in self._samples.items()
+            )
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, sample in samples:
+            lines.extend(self._render_sample(key, sample))
+        return lines
+
+    def _snapshot(self, sample):
+        return sample
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                # Per-bucket counts (the last one is +Inf), sum, count.
+                sample = self._samples[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            sample[0][index] += 1
+            sample[1] += value
+            sample[2] += 1
+
+    def value(self, **labels):
+        with self._lock:
+            sample = self._samples.get(self._key(labels))
+            return (sample[2], sample[1]) if sample else (0, 0.0)
+
+    def _snapshot(self, sample):
+        return [sample[0][:], sample[1], sample[2]]
+
+    def _render_sample(self, key, sample):
+        counts, total, count = sample
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            labels = _labels(self.labelnames, key, f'le="{_number(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_number(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class WatcherMetrics(MetricsRegistry):
+    def __init__(self):
+        super().__init__()
+        feed = ("feed",)
+        self.fetch_seconds = self.histogram(
+            "gengowatcher_fetch_seconds", "Time spent downloading a feed.", feed
+        )
+        self.parse_seconds = self.histogram(
+            "gengowatcher_parse_seconds", "Time spent parsing a feed.", feed
+        )
+        self.process_seconds = self.histogram(
+            "gengowatcher_process_seconds",
+            "Time spent deduplicating, logging and queueing a feed's entries.",
+            feed,
+        )
+        self.notification_seconds = self.histogram(
+            "gengowatcher_notification_dispatch_seconds",
+            "Time from queueing notifications to finishing their delivery.",
+        )
+        self.polls = self.counter(
+            "gengowatcher_polls_total", "Feed checks attempted.", feed
+        )
+        self.not_modified = self.counter(
+            "gengowatcher_not_modified_total", "Feed checks answered with 304.", feed
+        )
+        self.errors = self.counter(
+            "gengowatcher_fetch_errors_total", "Feed checks that failed.", feed
+        )
+        self.new_jobs = self.counter(
+            "gengowatcher_new_jobs_total", "Jobs seen for the first time.", feed
+        )
+        self.filtered_jobs = self.counter(
+            "gengowatcher_filtered_jobs_total",
+            "New jobs dropped by min_reward or [Filters] rules.",
+            feed,
+        )
+        self.notifications_dropped = self.counter(
+            "gengowatcher_notifications_dropped_total",
+            "Notifications merged into a summary because the queue was full.",
+        )
+        self.backoff_seconds = self.gauge(
+            "gengowatcher_backoff_seconds",
+            "Current backoff delay after failed checks (0 when healthy).",
+            feed,
+        )
+        self.consecutive_failures = self.gauge(
+            "gengowatcher_consecutive_failures", "Failed checks in a row.", feed
+        )
+        self.last_success = self.gauge(
+            "gengowatcher_last_success_timestamp_seconds",
+            "Unix time of the last successful check.",
+            feed,
+        )
+        self.start_time = self.gauge(
+            "gengowatcher_start_time_seconds", "Unix time the watcher started."
+        )
+        self.start_time.set(time.time())
+
+
+def _handler_class():
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = self.server.registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return MetricsHandler
+
+
+class MetricsServer:
+    # Serves the registry from its own threads; rendering only takes each
+    # metric's lock briefly, so a scrape never waits on a poll.
+    def __init__(self, registry, host="127.0.0.1", port=9108):
+        from http.server import ThreadingHTTPServer
+
+        self._server = ThreadingHTTPServer((host, port), _handler_class())
+        self._server.daemon_threads = True
+        self._server.registry = registry
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True, name="MetricsServer"
+        )
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,75 @@
+import collections
+import queue
+import threading
+import time
+
+Notification = collections.namedtuple(
+    "Notification", ["title", "message", "url", "play_sound", "open_link"]
+)
+
+
+class NotificationDispatcher:
+    def __init__(self, deliver, logger, workers=2, max_pending=50, observe=None):
+        self._deliver = deliver
+        self.logger = logger
+        self._observe = observe
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._workers = [
+            threading.Thread(target=self._run, daemon=True, name=f"Notifier-{i}")
+            for i in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, notifications):
+        notifications = list(notifications)
+        if not notifications:
+            return True
+        try:
+            self._queue.put_nowait((time.monotonic(), notifications))
+            return True
+        except queue.Full:
+            with self._lock:
+                self._dropped += len(notifications)
+            self.logger.warning(
+                f"Notification queue full, coalescing {len(notifications)} alert(s)."
+            )
+            return False
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            submitted, batch = item
+            stopping = False
+            while True:
+                try:
+                    more = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    stopping = True
+                    break
+                batch.extend(more[1])
+            with self._lock:
+                dropped, self._dropped = self._dropped, 0
+            try:
+                self._deliver(batch, dropped)
+            except Exception as e:
+                self.logger.error(f"Notify Error: {e}")
+            if self._observe:
+                self._observe(time.monotonic() - submitted)
+            if stopping:
+                return
+
+    def stop(self, timeout=2.0):
+        for _ in self._workers:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for worker in self._workers:
+            worker.join(timeout=timeout)
@@ -0,0 +1,89 @@
+import xml.etree.ElementTree as ET
+
+from .seen import entry_key
+
+PARSERS = ("feedparser", "fast", "streaming")
+ENTRY_TAGS = ("item", "entry")
+FEED_TAGS = ("rss", "feed", "RDF")
+ParseError = ET.ParseError
+
+
+class ParsedFeed(dict):
+    # Attribute access like feedparser.FeedParserDict, without importing it.
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _text(element):
+    return "".join(element.itertext()).strip()
+
+
+def entry_from_element(element):
+    entry = {}
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "title":
+            entry["title"] = _text(child)
+        elif name in ("guid", "id"):
+            entry["id"] = _text(child)
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                entry.setdefault("link", _text(child))
+            elif child.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", href.strip())
+        elif name in ("description", "summary", "content", "encoded"):
+            entry.setdefault("summary", _text(child))
+    return entry
+
+
+def iter_entries(chunks):
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _event, element in parser.read_events():
+            if _local_name(element.tag) in ENTRY_TAGS:
+                yield entry_from_element(element)
+                element.clear()
+    parser.close()
+    for _event, element in parser.read_events():
+        if _local_name(element.tag) in ENTRY_TAGS:
+            yield entry_from_element(element)
+
+
+def parse_document(content):
+    root = ET.fromstring(content)
+    if _local_name(root.tag) not in FEED_TAGS:
+        raise ParseError(f"not an RSS or Atom document: <{_local_name(root.tag)}>")
+    entries = [
+        entry_from_element(element)
+        for element in root.iter()
+        if _local_name(element.tag) in ENTRY_TAGS
+    ]
+    return ParsedFeed(bozo=False, entries=entries, truncated=False)
+
+
+def parse_stream(chunks, seen=None, stop_after=1):
+    # Stops reading once `stop_after` consecutive entries are already in
+    # `seen`; everything after them is older and has been processed before.
+    entries = []
+    run = 0
+    truncated = False
+    stream = iter_entries(chunks)
+    for entry in stream:
+        entries.append(entry)
+        if seen is None:
+            continue
+        run = run + 1 if entry_key(entry) in seen else 0
+        if run >= max(1, stop_after):
+            truncated = True
+            break
+    stream.close()
+    return ParsedFeed(bozo=False, entries=entries, truncated=truncated)
@@ -0,0 +1,147 @@
+import collections
+import contextlib
+import datetime
+import threading
+import time
+from pathlib import Path
+
+PHASES = ("fetch", "parse", "dedup", "log", "reward", "filter", "notify", "save")
+
+PhaseSummary = collections.namedtuple(
+    "PhaseSummary", ["phase", "mean_ms", "p95_ms", "max_ms", "share"]
+)
+
+
+class PhaseTimer:
+    # Phase times are summed across feeds, so with several feeds fetched in
+    # parallel a cycle's phases can add up to more than its wall time.
+    def __init__(self, history=100):
+        self._lock = threading.Lock()
+        self._cycles = collections.deque(maxlen=history)
+        self._current = None
+
+    def begin_cycle(self):
+        with self._lock:
+            self._current = dict.fromkeys(PHASES, 0.0)
+            self._current_start = time.perf_counter()
+
+    def end_cycle(self):
+        with self._lock:
+            if self._current is None:
+                return
+            self._current["total"] = time.perf_counter() - self._current_start
+            self._cycles.append(self._current)
+            self._current = None
+
+    def add(self, phase, seconds):
+        with self._lock:
+            if self._current is not None:
+                self._current[phase] = self._current.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def span(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def __len__(self):
+        return len(self._cycles)
+
+    def summary(self):
+        with self._lock:
+            cycles = list(self._cycles)
+        if not cycles:
+            return []
+        wall = sum(cycle["total"] for cycle in cycles) or 1.0
+        rows = []
+        for phase in PHASES + ("total",):
+            values = sorted(cycle.get(phase, 0.0) for cycle in cycles)
+            p95 = values[min(len(values) - 1, int(0.95 * len(values)))]
+            rows.append(
+                PhaseSummary(
+                    phase,
+                    sum(values) / len(values) * 1000,
+                    p95 * 1000,
+                    values[-1] * 1000,
+                    sum(values) / wall,
+                )
+            )
+        return rows
+
+
+class CycleProfiler:
+    # cProfile only sees the thread it is enabled in, so the watcher thread
+    # and every fetch worker get their own profile; they are merged on dump.
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._profiles = []
+
+    @property
+    def active(self):
+        return self._remaining > 0
+
+    def start(self, cycles):
+        with self._lock:
+            self._remaining = max(1, cycles)
+            self._profiles = []
+
+    @contextlib.contextmanager
+    def profile(self):
+        if not self.active:
+            yield
+            return
+        import cProfile
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already running in this thread.
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.append(profile)
+
+    def wrap(self, fn):
+        def profiled(*args, **kwargs):
+            with self.profile():
+                return fn(*args, **kwargs)
+
+        return profiled
+
+    def cycle_done(self):
+        with self._lock:
+            if self._remaining <= 0:
+                return None
+            self._remaining -= 1
+            if self._remaining:
+                return None
+            profiles, self._profiles = self._profiles, []
+        return self._dump(profiles)
+
+    def _dump(self, profiles):
+        import io
+        import pstats
+
+        if not profiles:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.directory / f"gengowatcher-{stamp}.prof"
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(str(path))
+        report = io.StringIO()
+        stats.stream = report
+        stats.sort_stats("cumulative").print_stats(30)
+        path.with_suffix(".txt").write_text(report.getvalue(), encoding="utf-8")
+        return path
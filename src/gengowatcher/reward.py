@@ -0,0 +1,71 @@
+import collections
+import re
+import threading
+
+from .seen import entry_key
+
+DEFAULT_CURRENCY_SYMBOLS = ("US$", "$")
+
+
+def parse_currency_symbols(value):
+    symbols = [symbol.strip() for symbol in value.split(",")]
+    return tuple(symbol for symbol in symbols if symbol) or DEFAULT_CURRENCY_SYMBOLS
+
+
+class RewardParser:
+    def __init__(self, currency_symbols=DEFAULT_CURRENCY_SYMBOLS, cache_size=4096):
+        # Longest symbols first so "US$" wins over "$".
+        symbols = sorted(currency_symbols, key=len, reverse=True)
+        currency = "|".join(re.escape(symbol) for symbol in symbols)
+        self.currency_symbols = tuple(currency_symbols)
+        self.cache_size = cache_size
+        pattern = rf"Reward:\s*(?:{currency})?\s*(\d+\.?\d*)"
+        # A case-sensitive scan is an order of magnitude faster on long HTML
+        # summaries; the case-insensitive pattern only runs from the first
+        # "reward" found when the exact spelling is missing.
+        self._pattern = re.compile(pattern)
+        self._pattern_ci = re.compile(pattern, re.IGNORECASE)
+        self._lock = threading.Lock()
+        self._cache = collections.OrderedDict()
+
+    def _search(self, text):
+        if not text:
+            return None
+        match = self._pattern.search(text)
+        if match is None:
+            lowered = text.lower()
+            start = lowered.find("reward:")
+            if start < 0:
+                return None
+            if len(lowered) != len(text):
+                start = 0
+            match = self._pattern_ci.search(text, start)
+            if match is None:
+                return None
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+
+    def parse(self, entry):
+        key = entry_key(entry)
+        if key:
+            with self._lock:
+                reward = self._cache.get(key)
+                if reward is not None:
+                    self._cache.move_to_end(key)
+                    return reward
+        reward = self._search(entry.get("title"))
+        if reward is None:
+            reward = self._search(entry.get("summary"))
+        if reward is None:
+            reward = 0.0
+        if key:
+            with self._lock:
+                self._cache[key] = reward
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return reward
+
+    def __len__(self):
+        return len(self._cache)
@@ -0,0 +1,91 @@
+import random
+import time
+
+HOURS_PER_WEEK = 7 * 24
+
+
+def hour_of_week(now=None):
+    local = time.localtime(now)
+    return local.tm_wday * 24 + local.tm_hour
+
+
+class AdaptiveScheduler:
+    def __init__(
+        self,
+        min_interval=15,
+        max_interval=300,
+        jitter=0.1,
+        target_jobs_per_poll=0.5,
+        smoothing=0.3,
+        rng=None,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.jitter = jitter
+        self.target_jobs_per_poll = target_jobs_per_poll
+        self.smoothing = smoothing
+        self._rng = rng or random.Random()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            min_interval=config.get("Scheduler", "min_interval"),
+            max_interval=config.get("Scheduler", "max_interval"),
+            jitter=config.get("Scheduler", "jitter"),
+            target_jobs_per_poll=config.get("Scheduler", "target_jobs_per_poll"),
+            smoothing=config.get("Scheduler", "smoothing"),
+        )
+
+    @staticmethod
+    def _arrivals(feed_state):
+        arrivals = feed_state.get("arrivals")
+        if not arrivals or len(arrivals.get("rates", ())) != HOURS_PER_WEEK:
+            arrivals = feed_state["arrivals"] = {
+                "rates": [None] * HOURS_PER_WEEK,
+                "bucket": None,
+                "count": 0,
+            }
+        return arrivals
+
+    def record(self, feed_state, new_jobs, now=None):
+        # Jobs are counted per hour of the week; when the hour rolls over its
+        # count is folded into an exponentially weighted jobs-per-hour rate.
+        arrivals = self._arrivals(feed_state)
+        bucket = hour_of_week(now)
+        folded = False
+        if arrivals["bucket"] != bucket:
+            previous = arrivals["bucket"]
+            if previous is not None:
+                rate = arrivals["rates"][previous]
+                count = arrivals["count"]
+                arrivals["rates"][previous] = (
+                    count
+                    if rate is None
+                    else (1 - self.smoothing) * rate + self.smoothing * count
+                )
+                folded = True
+            arrivals["bucket"] = bucket
+            arrivals["count"] = 0
+        arrivals["count"] += new_jobs
+        return folded or new_jobs > 0
+
+    def rate(self, feed_state, now=None):
+        arrivals = self._arrivals(feed_state)
+        bucket = hour_of_week(now)
+        learned = arrivals["rates"][bucket]
+        current = arrivals["count"] if arrivals["bucket"] == bucket else 0
+        if learned is None:
+            return current or None
+        return max(learned, current)
+
+    def interval(self, feed_state, base_interval, now=None):
+        rate = self.rate(feed_state, now)
+        if rate is None:
+            interval = base_interval
+        elif rate <= 0:
+            interval = self.max_interval
+        else:
+            interval = 3600 * self.target_jobs_per_poll / rate
+        if self.jitter:
+            interval *= self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(max(interval, self.min_interval), self.max_interval)
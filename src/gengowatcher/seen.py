@@ -0,0 +1,72 @@
+import collections
+import threading
+import time
+
+MAX_OPEN_PER_FEED = 1000
+
+
+def entry_key(entry):
+    return entry.get("id") or entry.get("link")
+
+
+def merge_truncated(previous, keys, limit=MAX_OPEN_PER_FEED):
+    # `keys` is the top of the feed, newest first, down to the point where
+    # reading stopped. Earlier keys above the last one still listed have left
+    # the feed; those below it were not reached and are assumed still listed.
+    # Returns the merged key order and the keys that are gone.
+    listed = set(keys)
+    cut = max((i for i, key in enumerate(previous) if key in listed), default=-1)
+    gone = [key for key in previous[:cut] if key not in listed]
+    order = list(keys) + [key for key in previous[cut + 1 :] if key not in listed]
+    # Without a key in common nothing can be closed, so the list is capped.
+    return order[:limit], gone + order[limit:]
+
+
+class SeenIndex:
+    def __init__(self, max_size=2000, max_age=7 * 86400):
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key, now=None):
+        if not key:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            self._entries[key] = now
+            self._entries.move_to_end(key)
+            self._evict(now)
+
+    def _evict(self, now):
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        cutoff = now - self.max_age
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if oldest >= cutoff:
+                break
+            self._entries.popitem(last=False)
+
+    def resize(self, max_size, max_age):
+        with self._lock:
+            self.max_size = max_size
+            self.max_age = max_age
+            self._evict(time.time())
+
+    def to_list(self):
+        with self._lock:
+            return [[key, seen_at] for key, seen_at in self._entries.items()]
+
+    def load(self, items):
+        with self._lock:
+            self._entries = collections.OrderedDict(
+                (key, float(seen_at)) for key, seen_at in items
+            )
+            self._evict(time.time())
@@ -0,0 +1,126 @@
+import functools
+import importlib
+import io
+import sys
+import threading
+import wave
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def detect_backend():
+    if sys.platform == "win32":
+        candidates = ["winsound"]
+    else:
+        candidates = ["simpleaudio", "playsound"]
+    for name in candidates:
+        try:
+            importlib.import_module(name)
+            return name
+        except ImportError:
+            continue
+    return "none"
+
+
+class SoundPlayer:
+    def __init__(self, logger, backend=None):
+        self.logger = logger
+        self._backend = backend
+        self.path = None
+        self._data = None
+        self._wave = None
+        self._lock = threading.Lock()
+        self._request = threading.Event()
+        self._playing = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="SoundPlayer"
+        )
+        self._thread.start()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = detect_backend()
+        return self._backend
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def load(self, sound_file):
+        path = Path(sound_file)
+        try:
+            data = path.read_bytes()
+        except (IOError, OSError):
+            self.logger.warning(f"Sound file not found at: {sound_file}")
+            data = None
+        wave_params = None
+        if data is not None:
+            try:
+                with wave.open(io.BytesIO(data), "rb") as wav:
+                    wave_params = (
+                        wav.readframes(wav.getnframes()),
+                        wav.getnchannels(),
+                        wav.getsampwidth(),
+                        wav.getframerate(),
+                    )
+            except (wave.Error, EOFError) as e:
+                if self.backend != "playsound":
+                    self.logger.warning(f"Invalid WAV file {sound_file}: {e}")
+                    data = None
+        with self._lock:
+            self.path = str(path)
+            self._data = data
+            self._wave = wave_params
+        return data is not None
+
+    def play(self):
+        with self._lock:
+            if self._data is None or self._playing:
+                return False
+            self._playing = True
+        self._request.set()
+        return True
+
+    def _run(self):
+        while True:
+            self._request.wait()
+            self._request.clear()
+            with self._lock:
+                pending = self._playing
+            if pending:
+                try:
+                    self._play_now()
+                except Exception as e:
+                    self.logger.error(f"Sound playback error: {e}")
+                finally:
+                    with self._lock:
+                        self._playing = False
+            if self._stopped:
+                return
+
+    def _play_now(self):
+        with self._lock:
+            data, wave_params, path = self._data, self._wave, self.path
+        backend = self.backend
+        if backend == "winsound":
+            import winsound
+
+            winsound.PlaySound(data, winsound.SND_MEMORY)
+        elif backend == "simpleaudio" and wave_params:
+            import simpleaudio
+
+            simpleaudio.WaveObject(*wave_params).play().wait_done()
+        elif backend == "playsound":
+            from playsound import playsound
+
+            playsound(path)
+        else:
+            self.logger.warning("No sound library available. Skipping sound.")
+
+    def stop(self, timeout=0):
+        self._stopped = True
+        self._request.set()
+        if timeout:
+            self._thread.join(timeout=timeout)
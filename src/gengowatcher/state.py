@@ -1,48 +1,179 @@
 import json
+import os
+import tempfile
 import threading
+import time
 import pathlib
 from typing import Union
 import logging
 
+from .seen import SeenIndex
+
 
 class AppState:
     STATE_FILE = "state.json"
+    LEGACY_FEED_NAME = "default"
 
     def __init__(
         self,
         logger: logging.Logger,
         state_file_path: Union[str, pathlib.Path, None] = None,
+        seen_max_size: int = 2000,
+        seen_max_age: float = 7 * 86400,
+        flush_interval: float = 2.0,
     ):
         self.logger = logger
         self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self.state_file_path = pathlib.Path(state_file_path or self.STATE_FILE)
+        self.flush_interval = flush_interval
+        self._dirty = False
+        self._flush_timer = None
+        self._closed = False
 
-        self.last_seen_link = None
         self.total_new_entries_found = 0
+        self.feeds = {}
+        self.seen = SeenIndex(max_size=seen_max_size, max_age=seen_max_age)
 
         self._load_state()
 
+    @classmethod
+    def from_config(cls, config, logger: logging.Logger) -> "AppState":
+        return cls(
+            logger=logger,
+            seen_max_size=config.get("Watcher", "seen_index_size"),
+            seen_max_age=config.get("Watcher", "seen_index_max_age_days") * 86400,
+            flush_interval=config.get("Watcher", "state_flush_interval"),
+        )
+
     def _load_state(self):
         try:
             if self.state_file_path.is_file():
                 with open(self.state_file_path, "r", encoding="utf-8") as f:
                     state_data = json.load(f)
                     with self._lock:
-                        self.last_seen_link = state_data.get("last_seen_link")
                         self.total_new_entries_found = int(
                             state_data.get("total_new_entries_found", 0)
                         )
+                        if "feeds" in state_data:
+                            self.feeds = state_data["feeds"]
+                        elif state_data.get("last_seen_link"):
+                            self.feeds = {
+                                self.LEGACY_FEED_NAME: {
+                                    "last_seen_link": state_data["last_seen_link"],
+                                    "etag": state_data.get("etag"),
+                                    "modified": state_data.get("modified"),
+                                }
+                            }
+                        self.seen.load(state_data.get("seen", []))
+                        # After a longer downtime every seen key has expired,
+                        # so feeds are primed again instead of reporting all
+                        # listed jobs as new.
+                        age = time.time() - self.state_file_path.stat().st_mtime
+                        if age > self.seen.max_age:
+                            for feed in self.feeds.values():
+                                feed.update(primed=False, etag=None, modified=None)
         except (json.JSONDecodeError, IOError) as e:
             self.logger.error(f"Could not load state file. Starting fresh. Error: {e}")
 
+    def feed_state(self, name: str) -> dict:
+        with self._lock:
+            feed = self.feeds.setdefault(name, {})
+            feed.setdefault("primed", False)
+            feed.setdefault("etag", None)
+            feed.setdefault("modified", None)
+            feed.setdefault("failure_count", 0)
+            return feed
+
+    def mark_dirty(self):
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                return
+            # After close() a daemon timer could die with the process, so
+            # late changes from a poll still in flight are written at once.
+            if self.flush_interval <= 0 or self._closed:
+                timer = None
+            else:
+                timer = self._flush_timer = threading.Timer(
+                    self.flush_interval, self.flush
+                )
+                timer.daemon = True
+        if timer is None:
+            self.flush()
+        else:
+            timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush_timer = None
+            if not self._dirty:
+                return
+        self.save_state()
+
     def save_state(self):
-        try:
+        with self._write_lock:
             with self._lock:
-                state_data = {
-                    "last_seen_link": self.last_seen_link,
-                    "total_new_entries_found": self.total_new_entries_found,
-                }
-                with open(self.state_file_path, "w", encoding="utf-8") as f:
-                    json.dump(state_data, f, indent=4)
-        except IOError as e:
-            self.logger.error(f"Error saving state to {self.STATE_FILE}: {e}")
+                self._dirty = False
+                # The watcher thread updates feed dicts without the lock. The
+                # C encoder (no indent) walks them without letting it run.
+                try:
+                    payload = json.dumps(
+                        {
+                            "total_new_entries_found": self.total_new_entries_found,
+                            "feeds": self.feeds,
+                            "seen": self.seen.to_list(),
+                        }
+                    )
+                except RuntimeError as e:
+                    payload = None
+                    error = e
+            if payload is None:
+                self.logger.error(f"Could not serialize state: {error}")
+                if self.flush_interval > 0 and not self._closed:
+                    self.mark_dirty()  # try again on the next timer
+                else:
+                    with self._lock:
+                        self._dirty = True
+                return
+            try:
+                self._write_atomic(payload)
+            except OSError as e:
+                with self._lock:
+                    self._dirty = True
+                self.logger.error(f"Error saving state to {self.state_file_path}: {e}")
+
+    def _write_atomic(self, payload):
+        directory = self.state_file_path.parent
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.state_file_path.name}.", suffix=".tmp", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        if hasattr(os, "O_DIRECTORY"):
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                return
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        self.save_state()
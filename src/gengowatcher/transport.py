@@ -0,0 +1,112 @@
+import collections
+import contextlib
+import threading
+
+FetchResult = collections.namedtuple(
+    "FetchResult", ["status", "content", "etag", "modified", "content_type"]
+)
+
+
+class TransportError(Exception):
+    pass
+
+
+class FeedTransport:
+    CHUNK_SIZE = 16 * 1024
+    # Unread bodies up to this size are drained after a streamed fetch stops
+    # early so the keep-alive connection can go back to the pool.
+    DRAIN_LIMIT = 256 * 1024
+
+    def __init__(self, connect_timeout=5.0, read_timeout=15.0, pool_size=4):
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._session = None
+
+    def _get_session(self):
+        # requests is only imported once the first feed is fetched.
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    @staticmethod
+    def _request_headers(etag, modified, headers):
+        request_headers = dict(headers or {})
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if modified:
+            request_headers["If-Modified-Since"] = modified
+        return request_headers
+
+    def fetch(self, url, etag=None, modified=None, headers=None) -> FetchResult:
+        import requests
+
+        request_headers = self._request_headers(etag, modified, headers)
+        try:
+            response = self._get_session().get(
+                url, headers=request_headers, timeout=self.timeout
+            )
+            if response.status_code == 304:
+                return FetchResult(304, b"", etag, modified, None)
+            response.raise_for_status()
+            return FetchResult(
+                response.status_code,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                response.headers.get("Content-Type"),
+            )
+        except requests.RequestException as e:
+            raise TransportError(str(e)) from e
+
+    @contextlib.contextmanager
+    def stream(self, url, etag=None, modified=None, headers=None):
+        # Like fetch(), but FetchResult.content is an iterator over the body
+        # chunks, which the caller may stop consuming at any point.
+        import requests
+
+        request_headers = self._request_headers(etag, modified, headers)
+        try:
+            response = self._get_session().get(
+                url, headers=request_headers, timeout=self.timeout, stream=True
+            )
+        except requests.RequestException as e:
+            raise TransportError(str(e)) from e
+        try:
+            if response.status_code == 304:
+                yield FetchResult(304, iter(()), etag, modified, None)
+                return
+            response.raise_for_status()
+            chunks = response.iter_content(self.CHUNK_SIZE)
+            yield FetchResult(
+                response.status_code,
+                chunks,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                response.headers.get("Content-Type"),
+            )
+            drained = 0
+            for chunk in chunks:
+                drained += len(chunk)
+                if drained > self.DRAIN_LIMIT:
+                    break
+        except requests.RequestException as e:
+            raise TransportError(str(e)) from e
+        finally:
+            response.close()
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -1,10 +1,12 @@
 import time
 import collections
 import datetime
+import logging
 import os
 import signal
 import inspect
 import sys
+import threading
 
 from rich.console import Console, Group
 from rich.live import Live
@@ -12,6 +14,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.layout import Layout
+from rich.theme import Theme
 
 from .watcher import GengoWatcher, __version__
 from .config import AppConfig
@@ -25,6 +28,56 @@ else:
     import termios
 
 
+APP_THEME = Theme(
+    {
+        "info": "cyan",
+        "success": "bold green",
+        "warning": "yellow",
+        "error": "bold red",
+        "title": "bold magenta",
+        "header": "bold bright_white",
+        "label": "cyan",
+        "value": "white",
+        "path": "italic yellow",
+        "panel_border": "bright_blue",
+        "table_header": "bold magenta",
+        "prompt": "bold white",
+        "input": "white",
+    }
+)
+
+
+LEVEL_STYLES = {
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "bold red",
+}
+
+
+def render_record(record):
+    timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+    return Text(
+        f"{timestamp} - {record.getMessage()}",
+        style=LEVEL_STYLES.get(record.levelno, "default"),
+    )
+
+
+class UILoggingHandler(logging.Handler):
+    # Works like logging.handlers.QueueHandler: emit only queues the record,
+    # and the TUI renders it when the Recent Activity panel is next drawn, so
+    # logging from the watcher thread never builds Rich objects.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log_queue = collections.deque(maxlen=10)
+        self.on_emit = None
+
+    def emit(self, record):
+        self.log_queue.append(record)
+        if self.on_emit:
+            self.on_emit()
+
+
 class CommandLineInterface:
     def __init__(
         self,
@@ -39,11 +92,34 @@ class CommandLineInterface:
         self.state = state
         self.console = console
         self.log_queue = log_queue
+        self._log_texts = {}
         self.input_buffer = ""
         self.command_output = collections.deque(maxlen=20)
+        self._output_version = 0
+        self._region_keys = {}
+        self._wake_event = threading.Event()
+        self._wake_pending = False
+        if sys.platform != "win32":
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
         self._init_commands()
         signal.signal(signal.SIGINT, self._handle_exit)
         self.layout = self._build_layout()
+        self.watcher.add_listener(self.wake)
+
+    def wake(self):
+        self._wake_event.set()
+        if sys.platform != "win32":
+            # One byte in the pipe is enough to wake the loop; skip the write
+            # while one is still unread.
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+            try:
+                os.write(self._wake_w, b"\0")
+            except BlockingIOError:
+                pass
 
     def _init_commands(self):
         self.commands = {
@@ -100,6 +176,16 @@ class CommandLineInterface:
                 "aliases": ["nt"],
                 "help": "Send a test notification.",
             },
+            "timings": {
+                "handler": self._handle_timings,
+                "aliases": ["tm"],
+                "help": "Show where recent poll cycles spent their time.",
+            },
+            "profile": {
+                "handler": self._handle_profile,
+                "aliases": ["prof"],
+                "help": "Profile the next poll cycles (e.g., `profile 5`).",
+            },
             "clear": {
                 "handler": self._handle_clear,
                 "help": "Clear the command output panel.",
@@ -129,23 +215,27 @@ class CommandLineInterface:
         return layout
 
     def _get_header_panel(self) -> Panel:
+        settings = self.config.snapshot.Watcher
         config_table = Table.grid(expand=True, padding=(0, 1))
         config_table.add_column(style="label", justify="right", width=24)
         config_table.add_column(style="value", justify="left")
-        config_table.add_row(
-            "Feed URL:", f"[path]{self.config.get('Watcher', 'feed_url')}[/]"
-        )
+        feeds = self.watcher.feeds
+        if len(feeds) == 1:
+            config_table.add_row("Feed URL:", f"[path]{feeds[0].url}[/]")
+        else:
+            names = ", ".join(feed.name for feed in feeds)
+            config_table.add_row("Feeds:", f" {len(feeds)} [path]({names})[/]")
         config_table.add_row(
             "Check Interval:",
-            f" {self.config.get('Watcher', 'check_interval')} seconds",
+            f" {settings.check_interval} seconds",
         )
         config_table.add_row()
         config_table.add_row(
             "Minimum Reward:",
-            f"[success]US$ {self.config.get('Watcher', 'min_reward'):.2f}[/]",
+            f"[success]US$ {settings.min_reward:.2f}[/]",
         )
-        notif_enabled = self.config.get("Watcher", "enable_notifications")
-        sound_enabled = self.config.get("Watcher", "enable_sound")
+        notif_enabled = settings.enable_notifications
+        sound_enabled = settings.enable_sound
         config_table.add_row(
             "Desktop Notifications:",
             (
@@ -170,6 +260,96 @@ class CommandLineInterface:
             border_style="panel_border",
         )
 
+    def _region_states(self):
+        watcher = self.watcher
+        now = time.time()
+        paused = watcher.paused
+        stopped = watcher.shutdown_event.is_set()
+        settings = self.config.snapshot.Watcher
+        return {
+            "header": (
+                (
+                    tuple((feed.name, feed.url) for feed in watcher.feeds),
+                    settings.check_interval,
+                    settings.min_reward,
+                    settings.enable_notifications,
+                    settings.enable_sound,
+                ),
+                self._get_header_panel,
+            ),
+            "runtime_status": (
+                (
+                    int(now - watcher.start_time),
+                    watcher.session_new_entries,
+                    watcher.session_total_value,
+                    self.state.total_new_entries_found,
+                    watcher.failure_count,
+                    paused,
+                    stopped,
+                    int(max(0, watcher.next_check_time - now)),
+                ),
+                self._get_runtime_status_panel,
+            ),
+            "recent_activity": (
+                (len(self.log_queue), id(self.log_queue[-1]) if self.log_queue else 0),
+                self._get_recent_activity_panel,
+            ),
+            "right": (self._output_version, self._get_output_panel),
+            "footer": (
+                (
+                    paused,
+                    stopped,
+                    watcher.current_action,
+                    self.state.total_new_entries_found,
+                ),
+                self._get_status_bar,
+            ),
+            "input": (
+                self.input_buffer,
+                lambda: Text(f"> {self.input_buffer}", no_wrap=True),
+            ),
+        }
+
+    def _refresh_layout(self):
+        changed = set()
+        for region, (key, build) in self._region_states().items():
+            if self._region_keys.get(region, self) != key:
+                self.layout[region].update(build())
+                self._region_keys[region] = key
+                changed.add(region)
+        return changed
+
+    def _seconds_to_next_tick(self):
+        # Uptime and the countdown are shown in whole seconds, so the screen
+        # only needs to change when one of them crosses a second boundary.
+        now = time.time()
+        uptime_tick = 1.0 - (now - self.watcher.start_time) % 1.0
+        countdown_tick = (self.watcher.next_check_time - now) % 1.0 or 1.0
+        return min(uptime_tick, countdown_tick) + 0.01
+
+    def _wait_for_input(self, timeout):
+        if sys.platform == "win32":
+            deadline = time.time() + timeout
+            while not msvcrt.kbhit():
+                remaining = deadline - time.time()
+                if remaining <= 0 or self._wake_event.wait(min(0.05, remaining)):
+                    break
+            self._wake_event.clear()
+            if msvcrt.kbhit():
+                self._process_char(msvcrt.getch())
+            return
+        ready = select.select([sys.stdin, self._wake_r], [], [], timeout)[0]
+        if self._wake_r in ready:
+            self._wake_pending = False
+            try:
+                os.read(self._wake_r, 4096)
+            except BlockingIOError:
+                pass
+        if sys.stdin in ready:
+            data = os.read(sys.stdin.fileno(), 1024)
+            for char in data.decode(errors="ignore"):
+                self._process_char(char)
+
     def run(self):
         if sys.platform != "win32":
             old_settings = termios.tcgetattr(sys.stdin)
@@ -182,25 +362,9 @@ class CommandLineInterface:
             vertical_overflow="visible",
         ) as live:
             while not self.watcher.shutdown_event.is_set():
-                self.layout["header"].update(self._get_header_panel())
-                self.layout["runtime_status"].update(self._get_runtime_status_panel())
-                self.layout["recent_activity"].update(self._get_recent_activity_panel())
-                self.layout["right"].update(self._get_output_panel())
-                self.layout["footer"].update(self._get_status_bar())
-                self.layout["input"].update(
-                    Text(f"> {self.input_buffer}", no_wrap=True)
-                )
-                live.refresh()
-                if sys.platform == "win32":
-                    if msvcrt.kbhit():
-                        char = msvcrt.getch()
-                        self._process_char(char)
-                    else:
-                        time.sleep(0.5)
-                else:
-                    if select.select([sys.stdin], [], [], 0.5)[0]:
-                        char = sys.stdin.read(1)
-                        self._process_char(char)
+                if self._refresh_layout():
+                    live.refresh()
+                self._wait_for_input(self._seconds_to_next_tick())
         if sys.platform != "win32":
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
 
@@ -241,7 +405,7 @@ class CommandLineInterface:
             if self.watcher.session_new_entries > 0
             else 0.0
         )
-        if os.path.exists(self.watcher.PAUSE_FILE):
+        if self.watcher.paused:
             next_check_text = Text("Paused", "warning")
         elif self.watcher.shutdown_event.is_set():
             next_check_text = Text("N/A", "dim")
@@ -276,8 +440,14 @@ class CommandLineInterface:
         return Panel(table, title="[title]Runtime Status[/]", title_align="center")
 
     def _get_recent_activity_panel(self) -> Panel:
+        # Each record is rendered once; the cache only keeps what is on screen.
+        records = list(self.log_queue)
+        cache = self._log_texts
+        self._log_texts = {
+            record: cache.get(record) or render_record(record) for record in records
+        }
         return Panel(
-            Group(*self.log_queue),
+            Group(*self._log_texts.values()),
             title="[title]Recent Activity[/]",
             title_align="center",
         )
@@ -291,7 +461,7 @@ class CommandLineInterface:
         status, color = ("Running", "success")
         if self.watcher.shutdown_event.is_set():
             status, color = ("Stopped", "error")
-        elif os.path.exists(self.watcher.PAUSE_FILE):
+        elif self.watcher.paused:
             status, color = ("Paused", "warning")
         action = self.watcher.current_action
         return Panel(
@@ -327,6 +497,7 @@ class CommandLineInterface:
             if output:
                 self.command_output.clear()
                 self.command_output.append(output)
+                self._output_version += 1
         except Exception as e:
             self.watcher.logger.error(f"Error executing '{command}': {e}")
 
@@ -343,27 +514,18 @@ class CommandLineInterface:
         self.watcher.handle_exit()
 
     def _handle_check(self, args=None):
-        self.watcher.check_now_event.set()
-        self.watcher.logger.info("Manual check triggered.")
+        self.watcher.request_check()
 
     def _handle_clear(self, args=None):
         self.command_output.clear()
+        self._output_version += 1
         self.watcher.logger.info("Command output cleared.")
 
     def _handle_pause(self, args=None):
-        if not os.path.exists(self.watcher.PAUSE_FILE):
-            with open(self.watcher.PAUSE_FILE, "w") as f:
-                f.write("Paused.")
-            self.watcher.logger.warning("Watcher paused.")
-        else:
-            self.watcher.logger.warning("Watcher is already paused.")
+        self.watcher.pause()
 
     def _handle_resume(self, args=None):
-        if os.path.exists(self.watcher.PAUSE_FILE):
-            os.remove(self.watcher.PAUSE_FILE)
-            self.watcher.logger.info("Watcher resumed.")
-        else:
-            self.watcher.logger.warning("Watcher is not paused.")
+        self.watcher.resume()
 
     def _handle_toggle_sound(self, args=None):
         current_state = self.config.get("Watcher", "enable_sound")
@@ -387,12 +549,42 @@ class CommandLineInterface:
             return
         try:
             amount = float(args[0])
-            self.config.set("Watcher", "min_reward", amount)
-            self.config.save_config()
-            self.watcher.logger.info(f"Minimum reward set to US$ {amount:.2f}")
         except ValueError:
             self.watcher.logger.error("Invalid amount. Please enter a number.")
+            return
+        self.watcher.set_min_reward(amount)
+
+    def _handle_timings(self, args=None):
+        rows = self.watcher.timings.summary()
+        if not rows:
+            self.watcher.logger.info("No poll cycles timed yet.")
+            return
+        table = Table(box=None, padding=(0, 1))
+        table.add_column("Phase", style="label")
+        for column in ("Mean ms", "p95 ms", "Max ms", "Share"):
+            table.add_column(column, style="value", justify="right")
+        for row in rows:
+            table.add_row(
+                row.phase,
+                f"{row.mean_ms:.2f}",
+                f"{row.p95_ms:.2f}",
+                f"{row.max_ms:.2f}",
+                f"{row.share:.0%}",
+            )
+        return Panel(
+            table,
+            title=f"[title]Poll Timings (last {len(self.watcher.timings)})[/]",
+            border_style="panel_border",
+        )
+
+    def _handle_profile(self, args):
+        try:
+            cycles = int(args[0]) if args else 5
+        except ValueError:
+            self.watcher.logger.error("Usage: profile <cycles>")
+            return
+        self.watcher.profile_next(cycles)
 
     def _handle_reload_config(self, args=None):
-        self.config.load_config()
-        self.watcher.logger.info("Configuration reloaded from config.ini.")
+        self.watcher.request_reload()
+        self.watcher.logger.info("Reload of config.ini requested.")
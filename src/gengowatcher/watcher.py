@@ -1,36 +1,50 @@
 __version__ = "2.0.0"
 __release_date__ = "2025-06-21"
 
-import feedparser
 import time
-import webbrowser
-from plyer import notification
 import os
 import sys
 import threading
 import logging
 from pathlib import Path
 import datetime
-import subprocess
-import re
-import csv
-from .config import AppConfig
+import concurrent.futures
+from .config import AppConfig, ConfigError
+from .filters import JobFilter
 from .state import AppState
+from .transport import FeedTransport
+from .seen import entry_key, merge_truncated
+from .metrics import MetricsServer, WatcherMetrics
+from .parsing import PARSERS, ParsedFeed, ParseError, parse_document, parse_stream
+from .profiling import CycleProfiler, PhaseTimer
+from .joblog import CsvJobLog
+from .logsetup import replace_file_handler
+from .reward import RewardParser, parse_currency_symbols
+from .scheduler import AdaptiveScheduler
+from .notifier import Notification, NotificationDispatcher
+from .sound import SoundPlayer
 
-if sys.platform == "win32":
-    try:
-        import winsound
 
-        SOUND_PLAYER = "winsound"
-    except ImportError:
-        SOUND_PLAYER = "none"
-else:
-    try:
-        from playsound import playsound
+def _timed_chunks(chunks, elapsed):
+    # Adds the time spent waiting on the network for each chunk to elapsed[0].
+    chunks = iter(chunks)
+    while True:
+        start = time.perf_counter()
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        finally:
+            elapsed[0] += time.perf_counter() - start
+        yield chunk
 
-        SOUND_PLAYER = "playsound"
-    except ImportError:
-        SOUND_PLAYER = "none"
+
+class Feed:
+    def __init__(self, name, url, interval=None):
+        self.name = name
+        self.url = url
+        self.interval = interval
+        self.next_check_time = time.time()
 
 
 class GengoWatcher:
@@ -39,62 +53,255 @@ class GengoWatcher:
     def __init__(self, config: AppConfig, state: AppState, logger: logging.Logger):
         self.logger = logger
         self.config = config
+        # The configuration as of the start of the current poll cycle.
+        self.settings = config.snapshot
         self.state = state
         self.shutdown_event = threading.Event()
+        self._exited = False
+        self._poll_idle = threading.Event()
+        self._poll_idle.set()
         self.check_now_event = threading.Event()
+        self._wakeup = threading.Condition()
+        self._woken = False
+        self._reload_requested = False
+        self._executor = None
+        self._listed_keys = {}
+        self.paused = bool(
+            self.config.get("Watcher", "persist_pause")
+            and os.path.exists(self.PAUSE_FILE)
+        )
         self.last_check_time = None
         self.next_check_time = time.time()
-        self.failure_count = 0
-        self.current_action = "Initializing"
+        self.feeds = [
+            Feed(spec.name, spec.url, spec.interval) for spec in self.config.get_feeds()
+        ]
+        self._listeners = []
+        self._current_action = "Initializing"
         self.start_time = time.time()
         self.session_new_entries = 0
         self.session_total_value = 0.0
-        self._all_entries_log_file = None
-        self._csv_writer = None
+        self.job_log = None
+        self.job_store = None
+        self.reward_parser = self._build_reward_parser()
+        self.scheduler = self._build_scheduler()
+        self.parser = self._select_parser()
+        self.job_filter = self._build_job_filter()
+        self.sound = SoundPlayer(self.logger)
+        self.sound.load(self.config.get("Paths", "sound_file"))
+        self.metrics = WatcherMetrics()
+        self.metrics_server = None
+        self.control_server = None
+        self.timings = PhaseTimer(self.config.get("Watcher", "timing_history") or 100)
+        self.profiler = CycleProfiler(
+            self.config.get("Paths", "profile_dir") or "logs/profiles"
+        )
+        self.notifier = self._build_notifier()
+        self.transport = self._build_transport()
         if self.config.get("Logging", "log_all_entries_enabled"):
             self._setup_csv_logging()
+        if self.config.get("Logging", "job_store_enabled"):
+            self._setup_job_store()
         self.logger.info(f"GengoWatcher v{__version__} initialized.")
 
+    @property
+    def current_action(self):
+        return self._current_action
+
+    @current_action.setter
+    def current_action(self, value):
+        self._current_action = value
+        self._notify_listeners()
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def _notify_listeners(self):
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Listener error: {e}")
+
+    @property
+    def failure_count(self):
+        return sum(
+            self.state.feed_state(feed.name)["failure_count"] for feed in self.feeds
+        )
+
     def handle_exit(self, signum=None, frame=None):
-        if not self.shutdown_event.is_set():
+        if not self._exited:
+            self._exited = True
             self.logger.info("Shutdown initiated. Saving state...")
-            self.shutdown_event.set()
-            self.state.save_state()
+            self.stop()
+            # Let a poll in flight on the watcher thread record what it saw.
+            self._poll_idle.wait(timeout=5)
+            self.state.close()
+            if self.job_log:
+                self.job_log.close()
+            if self.job_store:
+                self.job_store.close()
+            self.notifier.stop()
+            self.sound.stop()
+            if self.metrics_server:
+                self.metrics_server.stop()
+                self.metrics_server = None
+            if self.control_server:
+                self.control_server.stop()
+                self.control_server = None
             self.config.save_config()
+            self._notify_listeners()
+
+    def _build_notifier(self):
+        return NotificationDispatcher(
+            self._deliver_notifications,
+            self.logger,
+            workers=self.config.get("Watcher", "notification_workers"),
+            max_pending=self.config.get("Watcher", "notification_queue_size"),
+            observe=self.metrics.notification_seconds.observe,
+        )
+
+    def _build_transport(self):
+        return FeedTransport(
+            connect_timeout=self.config.get("Network", "connect_timeout"),
+            read_timeout=self.config.get("Network", "read_timeout"),
+            pool_size=self.config.get("Network", "pool_size"),
+        )
+
+    def _fetch_executor(self):
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, self.settings.Network.pool_size),
+                thread_name_prefix="FeedFetch",
+            )
+        return self._executor
 
     def _setup_csv_logging(self):
         try:
-            log_path = Path(self.config.get("Paths", "all_entries_log"))
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            self._all_entries_log_file = open(
-                log_path, "a", newline="", encoding="utf-8"
+            self.job_log = CsvJobLog(
+                self.config.get("Paths", "all_entries_log"),
+                reward_fn=self._extract_reward,
+                mode=self.config.get("Logging", "all_entries_mode"),
+                logger=self.logger,
             )
-            self._csv_writer = csv.writer(self._all_entries_log_file)
-            if log_path.stat().st_size == 0:
-                self._csv_writer.writerow(
-                    ["timestamp", "title", "reward", "link", "summary"]
-                )
-        except IOError as e:
+        except (IOError, ValueError) as e:
             self.logger.error(f"Could not open all_entries_log file: {e}")
-            self._all_entries_log_file = None
-            self._csv_writer = None
+            self.job_log = None
 
-    def play_sound(self):
-        sound_file_path = self.config.get("Paths", "sound_file")
-        if not Path(sound_file_path).is_file():
-            self.logger.warning(f"Sound file not found at: {sound_file_path}")
+    def _setup_job_store(self):
+        import sqlite3
+
+        from .jobstore import JobStore
+
+        try:
+            self.job_store = JobStore(
+                self.config.get("Paths", "job_store_db"),
+                reward_fn=self._extract_reward,
+            )
+        except (OSError, sqlite3.Error) as e:
+            self.logger.error(f"Could not open job store: {e}")
+            self.job_store = None
+
+    def start_metrics_server(self):
+        if not self.config.get("Metrics", "enabled"):
             return
-        if SOUND_PLAYER == "playsound":
+        host = self.config.get("Metrics", "host")
+        port = self.config.get("Metrics", "port")
+        try:
+            self.metrics_server = MetricsServer(self.metrics, host, port).start()
+        except OSError as e:
+            self.logger.error(f"Could not start metrics server on {host}:{port}: {e}")
+            return
+        self.logger.info(f"Metrics available at http://{host}:{port}/metrics")
+
+    def start_control_server(self):
+        if not self.config.get("Control", "enabled"):
+            return
+        from . import control
+
+        if not control.supported():
+            self.logger.warning("Control socket needs Unix domain sockets; disabled.")
+            return
+        path = self.config.get("Control", "socket_path")
+        try:
+            self.control_server = control.ControlServer(self, path).start()
+        except OSError as e:
+            self.logger.error(f"Could not start control socket at {path}: {e}")
+            return
+        self.logger.info(f"Control socket listening at {path}")
+
+    def pause(self):
+        if self.paused:
+            self.logger.warning("Watcher is already paused.")
+            return False
+        self.paused = True
+        if self.config.get("Watcher", "persist_pause"):
             try:
-                playsound(sound_file_path)
-            except Exception as e:
-                self.logger.error(f"playsound error: {e}")
-        elif SOUND_PLAYER == "winsound":
-            winsound.PlaySound(sound_file_path, winsound.SND_FILENAME)
-        else:
-            self.logger.warning("No sound library available. Skipping sound.")
+                with open(self.PAUSE_FILE, "w") as f:
+                    f.write("Paused.")
+            except OSError as e:
+                self.logger.error(f"Could not write {self.PAUSE_FILE}: {e}")
+        self.logger.warning("Watcher paused.")
+        self._wake()
+        self._notify_listeners()
+        return True
+
+    def resume(self):
+        if not self.paused:
+            self.logger.warning("Watcher is not paused.")
+            return False
+        self.paused = False
+        try:
+            os.remove(self.PAUSE_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error(f"Could not remove {self.PAUSE_FILE}: {e}")
+        self.logger.info("Watcher resumed.")
+        self._wake()
+        self._notify_listeners()
+        return True
+
+    def request_check(self):
+        self.check_now_event.set()
+        self._wake()
+        self.logger.info("Manual check triggered.")
+
+    def set_min_reward(self, amount):
+        self.config.set("Watcher", "min_reward", amount)
+        self.config.save_config()
+        self.logger.info(f"Minimum reward set to US$ {amount:.2f}")
+
+    def stats(self):
+        now = time.time()
+        return {
+            "version": __version__,
+            "uptime_seconds": round(now - self.start_time, 1),
+            "paused": self.paused,
+            "current_action": self.current_action,
+            "min_reward": self.config.get("Watcher", "min_reward"),
+            "session_new_entries": self.session_new_entries,
+            "session_total_value": round(self.session_total_value, 2),
+            "total_new_entries_found": self.state.total_new_entries_found,
+            "failure_count": self.failure_count,
+            "next_check_in": round(max(0.0, self.next_check_time - now), 1),
+            "feeds": [
+                {
+                    "name": feed.name,
+                    "url": feed.url,
+                    "failure_count": self.state.feed_state(feed.name)["failure_count"],
+                    "next_check_in": round(max(0.0, feed.next_check_time - now), 1),
+                }
+                for feed in self.feeds
+            ],
+        }
+
+    def play_sound(self):
+        self.sound.play()
 
     def open_in_browser(self, url):
+        import subprocess
+        import webbrowser
+
         try:
             browser_path_str = self.config.get("Paths", "browser_path")
             if not browser_path_str or not Path(browser_path_str).is_file():
@@ -108,150 +315,547 @@ class GengoWatcher:
         except Exception as e:
             self.logger.error(f"Browser Error: {e}")
 
+    def _notify_desktop(self, title, message):
+        try:
+            from plyer import notification
+
+            icon_path = self.config.get("Paths", "notification_icon_path")
+            app_icon = str(icon_path) if Path(icon_path).is_file() else None
+            notification.notify(
+                title=title,
+                message=message,
+                app_name="GengoWatcher",
+                app_icon=app_icon,
+                timeout=8,
+            )
+        except Exception as e:
+            self.logger.error(f"Notify Error: {e}")
+
+    def _deliver_notifications(self, batch, dropped=0):
+        if dropped:
+            self.metrics.notifications_dropped.inc(dropped)
+        total = len(batch) + dropped
+        if self.config.get("Watcher", "enable_notifications"):
+            if total >= self.config.get("Watcher", "notification_coalesce_threshold"):
+                self._notify_desktop(
+                    f"{total} New Gengo Jobs Available!",
+                    "\n".join(n.message for n in batch[:3]),
+                )
+            else:
+                for n in batch:
+                    self._notify_desktop(n.title, n.message)
+        if any(n.play_sound for n in batch) and self.config.get(
+            "Watcher", "enable_sound"
+        ):
+            self.play_sound()
+        for n in batch:
+            if n.open_link and n.url:
+                self.open_in_browser(n.url)
+
     def show_notification(
         self, message, title="GengoWatcher", play_sound=False, open_link=False, url=None
     ):
-        if self.config.get("Watcher", "enable_notifications"):
-            try:
-                icon_path = self.config.get("Paths", "notification_icon_path")
-                app_icon = str(icon_path) if Path(icon_path).is_file() else None
-                notification.notify(
-                    title=title,
-                    message=message,
-                    app_name="GengoWatcher",
-                    app_icon=app_icon,
-                    timeout=8,
-                )
-            except Exception as e:
-                self.logger.error(f"Notify Error: {e}")
-        if play_sound and self.config.get("Watcher", "enable_sound"):
-            threading.Thread(target=self.play_sound, daemon=True).start()
-        if open_link and url:
-            self.open_in_browser(url)
+        self.notifier.submit([Notification(title, message, url, play_sound, open_link)])
 
-    def _extract_reward(self, entry) -> float:
-        text = entry.get("title", "") + " | " + entry.get("summary", "")
-        match = re.search(r"Reward:\s*(?:US\$|\$)?\s*(\d+\.?\d*)", text, re.IGNORECASE)
+    def _build_reward_parser(self):
+        return RewardParser(
+            parse_currency_symbols(
+                self.config.get("Watcher", "reward_currency_symbols") or ""
+            ),
+            cache_size=self.config.get("Watcher", "seen_index_size") or 2000,
+        )
+
+    def _build_scheduler(self):
+        if not self.config.get("Scheduler", "adaptive"):
+            return None
+        return AdaptiveScheduler.from_config(self.config)
+
+    def _select_parser(self):
+        parser = self.config.get("Parsing", "parser") or PARSERS[0]
+        if parser not in PARSERS:
+            self.logger.warning(f"Unknown parser '{parser}', using {PARSERS[0]}.")
+            parser = PARSERS[0]
+        return parser
+
+    def _build_job_filter(self):
         try:
-            return float(match.group(1)) if match else 0.0
-        except (ValueError, IndexError):
-            return 0.0
+            job_filter = JobFilter.from_config(self.config)
+        except ValueError as e:
+            self.logger.error(f"Invalid [Filters] settings, not filtering jobs: {e}")
+            return None
+        return job_filter if job_filter.active else None
 
-    def _log_all_entries(self, entries):
-        if not self._csv_writer:
+    def _extract_reward(self, entry) -> float:
+        return self.reward_parser.parse(entry)
+
+    def _log_all_entries(self, feed_name, entries, new_entries, partial=False):
+        if self.job_store:
+            try:
+                self.job_store.record(feed_name, entries, partial=partial)
+            except Exception as e:
+                self.logger.error(f"Job store error: {e}")
+        if not self.job_log:
             return
-        timestamp = datetime.datetime.now().isoformat()
-        for entry in entries:
-            self._csv_writer.writerow(
-                [
-                    timestamp,
-                    entry.get("title", "N/A"),
-                    self._extract_reward(entry),
-                    entry.get("link", "N/A"),
-                    entry.get("summary", "N/A"),
-                ]
-            )
-        self._all_entries_log_file.flush()
+        self.job_log.log_new(new_entries)
+        self.job_log.log_sightings(feed_name, entries, partial=partial)
 
-    def _process_feed_entries(self, entries):
+    def _process_feed_entries(self, entries, feed_name, partial=False):
         if not entries:
-            return
-        self._log_all_entries(entries)
-        new_entries = []
-        for entry in entries:
-            if entry.get("link") == self.state.last_seen_link:
-                break
-            new_entries.append(entry)
+            return 0
+        timings = self.timings
+        seen = self.state.seen
+        with timings.span("dedup"):
+            new_entries = [entry for entry in entries if entry_key(entry) not in seen]
+        with timings.span("log"):
+            self._log_all_entries(feed_name, entries, new_entries, partial=partial)
+        with timings.span("dedup"):
+            for entry in reversed(entries):
+                seen.add(entry_key(entry))
         if not new_entries:
-            return
-        min_reward = self.config.get("Watcher", "min_reward")
-        processed_count = 0
-        for entry in reversed(new_entries):
-            reward = self._extract_reward(entry)
-            if min_reward > 0.0 and reward < min_reward:
-                continue
-            processed_count += 1
-            self.state.total_new_entries_found += 1
-            self.session_new_entries += 1
-            self.session_total_value += reward
-            title = entry.get("title", "No Title")
-            self.logger.info(
-                f"New job: {title.split('|')[0].strip()} (US$ {reward:.2f})"
+            return 0
+        with timings.span("reward"):
+            rewards = [self._extract_reward(entry) for entry in new_entries]
+        min_reward = self.settings.Watcher.min_reward
+        job_filter = self.job_filter
+        with timings.span("filter"):
+            wanted = [
+                (entry, reward)
+                for entry, reward in zip(reversed(new_entries), reversed(rewards))
+                if not (min_reward > 0.0 and reward < min_reward)
+                and (job_filter is None or job_filter.matches(entry, reward))
+            ]
+        if len(wanted) < len(new_entries):
+            self.metrics.filtered_jobs.inc(
+                len(new_entries) - len(wanted), feed=feed_name
             )
-            self.show_notification(
-                message=title,
-                title="New Gengo Job Available!",
-                play_sound=True,
-                open_link=True,
-                url=entry.get("link"),
-            )
-        if processed_count > 0:
-            self.state.last_seen_link = new_entries[0].get("link")
-            self.state.save_state()
+        with timings.span("notify"):
+            notifications = []
+            for entry, reward in wanted:
+                self.state.total_new_entries_found += 1
+                self.session_new_entries += 1
+                self.session_total_value += reward
+                title = entry.get("title", "No Title")
+                self.logger.info(
+                    f"New job: {title.split('|')[0].strip()} (US$ {reward:.2f})"
+                )
+                notifications.append(
+                    Notification(
+                        title="New Gengo Job Available!",
+                        message=title,
+                        url=entry.get("link"),
+                        play_sound=True,
+                        open_link=True,
+                    )
+                )
+            self.notifier.submit(notifications)
+        with timings.span("save"):
+            self.state.mark_dirty()
+        return len(new_entries)
 
-    def fetch_rss(self):
+    def fetch_rss(self, feed: Feed):
         headers = {}
-        if self.config.get("Watcher", "use_custom_user_agent"):
-            email = self.config.get("Network", "user_agent_email")
+        settings = self.settings
+        if settings.Watcher.use_custom_user_agent:
+            email = settings.Network.user_agent_email
             headers["User-Agent"] = f"GengoWatcher/{__version__} ({email})"
+        feed_state = self.state.feed_state(feed.name)
         try:
-            feed = feedparser.parse(
-                self.config.get("Watcher", "feed_url"), request_headers=headers
+            if self.parser == "streaming":
+                parsed = self._fetch_streaming(feed, feed_state, headers)
+                if parsed is not None:
+                    return parsed
+            return self._fetch_document(
+                feed, feed_state, headers, fast=self.parser == "fast"
             )
-            if feed.bozo:
-                self.logger.error(f"Feed Error: {feed.bozo_exception}")
-                return None
-            return feed
         except Exception as e:
-            self.logger.error(f"RSS Error: {e}")
+            self.logger.error(f"RSS Error ({feed.name}): {e}")
+            return None
+
+    @staticmethod
+    def _not_modified(result):
+        return ParsedFeed(
+            status=304,
+            bozo=False,
+            entries=[],
+            etag=result.etag,
+            modified=result.modified,
+        )
+
+    def _fetch_document(self, feed: Feed, feed_state, headers, fast=False):
+        start = time.perf_counter()
+        result = self.transport.fetch(
+            feed.url,
+            etag=feed_state["etag"],
+            modified=feed_state["modified"],
+            headers=headers,
+        )
+        fetched = time.perf_counter()
+        self.metrics.fetch_seconds.observe(fetched - start, feed=feed.name)
+        self.timings.add("fetch", fetched - start)
+        if result.status == 304:
+            return self._not_modified(result)
+        parsed = None
+        if fast:
+            try:
+                parsed = parse_document(result.content)
+            except ParseError as e:
+                self.logger.warning(
+                    f"Fast parse failed ({feed.name}): {e}. Using feedparser."
+                )
+        if parsed is None:
+            parsed = self._parse_feedparser(feed, result)
+        parse_time = time.perf_counter() - fetched
+        self.metrics.parse_seconds.observe(parse_time, feed=feed.name)
+        self.timings.add("parse", parse_time)
+        if parsed is None:
+            return None
+        parsed["etag"] = result.etag
+        parsed["modified"] = result.modified
+        return parsed
+
+    def _parse_feedparser(self, feed: Feed, result):
+        import feedparser
+
+        response_headers = {}
+        if result.content_type:
+            response_headers["content-type"] = result.content_type
+        parsed = feedparser.parse(result.content, response_headers=response_headers)
+        if parsed.bozo:
+            self.logger.error(f"Feed Error ({feed.name}): {parsed.bozo_exception}")
             return None
+        return parsed
+
+    def _fetch_streaming(self, feed: Feed, feed_state, headers):
+        # Until a feed is primed every entry is needed, so nothing stops early.
+        seen = self.state.seen if feed_state["primed"] else None
+        start = time.perf_counter()
+        with self.transport.stream(
+            feed.url,
+            etag=feed_state["etag"],
+            modified=feed_state["modified"],
+            headers=headers,
+        ) as result:
+            network = [time.perf_counter() - start]
+            if result.status == 304:
+                self.metrics.fetch_seconds.observe(network[0], feed=feed.name)
+                self.timings.add("fetch", network[0])
+                return self._not_modified(result)
+            try:
+                parsed = parse_stream(
+                    _timed_chunks(result.content, network),
+                    seen=seen,
+                    stop_after=self.settings.Parsing.stop_after_seen,
+                )
+            except ParseError as e:
+                self.logger.warning(
+                    f"Streaming parse failed ({feed.name}): {e}. Using feedparser."
+                )
+                return None
+            finally:
+                # Download and parsing interleave; split them by time spent
+                # waiting for chunks.
+                parse_time = time.perf_counter() - start - network[0]
+                self.metrics.fetch_seconds.observe(network[0], feed=feed.name)
+                self.metrics.parse_seconds.observe(parse_time, feed=feed.name)
+                self.timings.add("fetch", network[0])
+                self.timings.add("parse", parse_time)
+        parsed["etag"] = result.etag
+        parsed["modified"] = result.modified
+        return parsed
+
+    def _prime_feed(self, feed: Feed, feed_state, entries):
+        # Entries newer than a cursor left by an older state file are still
+        # reported; everything else already in the feed is marked as seen.
+        legacy_cursor = feed_state.pop("last_seen_link", None)
+        links = [entry.get("link") for entry in entries]
+        start = links.index(legacy_cursor) if legacy_cursor in links else 0
+        for entry in entries[start:]:
+            self.state.seen.add(entry_key(entry))
+        if self.job_log:
+            self.job_log.log_new(entries[start:])
+        feed_state["primed"] = True
+        self.logger.info(f"Feed '{feed.name}' primed successfully.")
+
+    def _handle_fetch_result(self, feed: Feed, parsed):
+        feed_state = self.state.feed_state(feed.name)
+        settings = self.settings
+        interval = feed.interval or settings.Watcher.check_interval
+        metrics = self.metrics
+        metrics.polls.inc(feed=feed.name)
+        if parsed is None:
+            feed_state["failure_count"] += 1
+            wait_time = min(
+                interval * (2 ** feed_state["failure_count"]),
+                settings.Network.max_backoff,
+            )
+            self.current_action = f"Backoff ({int(wait_time)}s)"
+            metrics.errors.inc(feed=feed.name)
+            metrics.backoff_seconds.set(wait_time, feed=feed.name)
+        else:
+            if feed_state["failure_count"] > 0:
+                self.logger.info(f"Connection re-established ({feed.name}).")
+            feed_state["failure_count"] = 0
+            self.last_check_time = datetime.datetime.now()
+            changed = False
+            now = time.time()
+            refreshed = feed_state.get("refreshed")
+            if (
+                feed_state["primed"]
+                and refreshed
+                and (now - refreshed > self.state.seen.max_age)
+            ):
+                # The feed's seen keys have expired, so its listing would be
+                # reported as new. Prime again from a full response instead.
+                self.logger.info(f"Seen jobs for '{feed.name}' expired; re-priming.")
+                feed_state.update(primed=False, etag=None, modified=None)
+                changed = True
+            if not feed_state["primed"] and parsed.entries:
+                self._prime_feed(feed, feed_state, parsed.entries)
+                changed = True
+            if parsed.get("status") == 304:
+                metrics.not_modified.inc(feed=feed.name)
+                listed = self._listed_keys.get(feed.name)
+                if listed and feed_state["primed"]:
+                    # Still listed, so keep the keys from ageing out.
+                    for key in reversed(listed):
+                        self.state.seen.add(key, now)
+                    feed_state["refreshed"] = now
+                    changed = True
+                if self.job_log:
+                    self.job_log.touch(feed.name)
+                if self.job_store:
+                    self.job_store.touch(feed.name)
+            elif parsed.entries and feed_state["primed"]:
+                keys = [entry_key(entry) for entry in parsed.entries]
+                if parsed.get("truncated"):
+                    keys, _ = merge_truncated(
+                        self._listed_keys.get(feed.name, []), keys
+                    )
+                self._listed_keys[feed.name] = keys
+                feed_state["refreshed"] = now
+            start = time.perf_counter()
+            new_jobs = self._process_feed_entries(
+                parsed.entries, feed.name, partial=bool(parsed.get("truncated"))
+            )
+            metrics.process_seconds.observe(time.perf_counter() - start, feed=feed.name)
+            metrics.new_jobs.inc(new_jobs, feed=feed.name)
+            metrics.backoff_seconds.set(0, feed=feed.name)
+            metrics.last_success.set(time.time(), feed=feed.name)
+            validators = (parsed.get("etag"), parsed.get("modified"))
+            if validators != (feed_state["etag"], feed_state["modified"]):
+                feed_state["etag"], feed_state["modified"] = validators
+                changed = True
+            wait_time = interval
+            if self.scheduler:
+                changed |= self.scheduler.record(feed_state, new_jobs)
+                wait_time = self.scheduler.interval(feed_state, interval)
+            if changed:
+                with self.timings.span("save"):
+                    self.state.mark_dirty()
+        metrics.consecutive_failures.set(feed_state["failure_count"], feed=feed.name)
+        feed.next_check_time = time.time() + wait_time
+
+    def _poll_feeds(self, executor, due_feeds):
+        self.current_action = (
+            "Fetching" if len(due_feeds) == 1 else f"Fetching ({len(due_feeds)} feeds)"
+        )
+        self.settings = self.config.snapshot
+        self.timings.begin_cycle()
+        self._poll_idle.clear()
+        try:
+            with self.profiler.profile():
+                fetch = self.profiler.wrap(self.fetch_rss)
+                futures = {executor.submit(fetch, feed): feed for feed in due_feeds}
+                for future in concurrent.futures.as_completed(futures):
+                    self.current_action = "Processing"
+                    self._handle_fetch_result(futures[future], future.result())
+        finally:
+            self._poll_idle.set()
+        self.timings.end_cycle()
+        try:
+            path = self.profiler.cycle_done()
+        except OSError as e:
+            self.logger.error(f"Could not write profile: {e}")
+            path = None
+        if path:
+            self.logger.info(f"Profile written to {path} (summary in .txt).")
+        if self.failure_count == 0:
+            self.current_action = "Waiting"
+
+    def profile_next(self, cycles=5):
+        self.profiler.start(cycles)
+        self.logger.info(f"Profiling the next {max(1, cycles)} poll cycle(s)...")
 
     def run(self):
-        self.logger.info("Watcher thread started.")
-        if not self.state.last_seen_link:
-            self.current_action = "Priming feed"
-            initial_feed = self.fetch_rss()
-            if initial_feed and initial_feed.entries:
-                self.state.last_seen_link = initial_feed.entries[0].get("link")
-                self.logger.info("Initial feed primed successfully.")
-                self.state.save_state()
-
-        while not self.shutdown_event.is_set():
-            is_paused = os.path.exists(self.PAUSE_FILE)
-            time_to_next_check = self.next_check_time - time.time()
-            wait_duration = max(0, time_to_next_check)
-
-            triggered = self.shutdown_event.wait(timeout=wait_duration)
-            if triggered:
-                break
-
-            if self.check_now_event.is_set() or time.time() >= self.next_check_time:
+        self.logger.info(f"Watcher thread started ({len(self.feeds)} feed(s)).")
+        self.start_metrics_server()
+        self.start_control_server()
+        try:
+            while not self.shutdown_event.is_set():
+                watch_interval = self.settings.Watcher.config_watch_interval
+                # While paused only a wake-up (resume, check, reload, exit)
+                # or the config file check ends the wait.
+                timeouts = []
+                if not self.paused:
+                    timeouts.append(max(0, self.next_check_time - time.time()))
+                if watch_interval > 0:
+                    timeouts.append(watch_interval)
+                self._wait_for_wakeup(min(timeouts, default=None))
+                if self.shutdown_event.is_set():
+                    break
+
+                if self._reload_requested or (
+                    watch_interval > 0 and self.config.file_changed()
+                ):
+                    self._reload_requested = False
+                    self.reload_config()
+
+                check_now = self.check_now_event.is_set()
                 self.check_now_event.clear()
+                if self.paused:
+                    if self.current_action != "Paused":
+                        self.current_action = "Paused"
+                    continue
+                now = time.time()
+                due_feeds = [
+                    feed
+                    for feed in self.feeds
+                    if check_now or now >= feed.next_check_time
+                ]
+                if due_feeds:
+                    self._poll_feeds(self._fetch_executor(), due_feeds)
+                elif self.current_action == "Paused":
+                    self.current_action = "Waiting"
+                self.next_check_time = min(
+                    (feed.next_check_time for feed in self.feeds),
+                    default=time.time() + 5,
+                )
+                self._notify_listeners()
+        finally:
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+        self.transport.close()
+
+    def _wake(self):
+        # Every request that should end the run loop's wait comes through here;
+        # the flag keeps a wake-up sent while the loop is busy from being lost.
+        with self._wakeup:
+            self._woken = True
+            self._wakeup.notify_all()
+
+    def _wait_for_wakeup(self, timeout):
+        with self._wakeup:
+            if not self._woken:
+                self._wakeup.wait(timeout)
+            self._woken = False
+
+    def stop(self):
+        self.shutdown_event.set()
+        self._wake()
+
+    def request_reload(self):
+        # Applied by the watcher thread between polls, never mid-cycle.
+        self._reload_requested = True
+        self._wake()
+
+    def reload_config(self):
+        old = self.config.snapshot
+        try:
+            self.config.reload()
+        except ConfigError as e:
+            self.logger.error(f"{e}. Keeping the current settings.")
+            return False
+        self.apply_config(old, self.config.snapshot)
+        self.logger.info("Configuration reloaded from config.ini.")
+        return True
+
+    def apply_config(self, old, new):
+        # Rebuilds only the resources whose own settings changed.
+        def changed(section, *keys):
+            before, after = getattr(old, section), getattr(new, section)
+            if not keys:
+                return before != after
+            return any(getattr(before, key) != getattr(after, key) for key in keys)
+
+        self.settings = new
+        if changed("Watcher", "reward_currency_symbols", "seen_index_size"):
+            self.reward_parser = self._build_reward_parser()
+        if changed("Watcher", "seen_index_size", "seen_index_max_age_days"):
+            self.state.seen.resize(
+                new.Watcher.seen_index_size,
+                new.Watcher.seen_index_max_age_days * 86400,
+            )
+        if changed("Watcher", "notification_workers", "notification_queue_size"):
+            # The old workers deliver what is already queued before stopping.
+            old_notifier, self.notifier = self.notifier, self._build_notifier()
+            old_notifier.stop()
+        if changed("Watcher", "timing_history"):
+            self.timings = PhaseTimer(new.Watcher.timing_history or 100)
+        if changed("Paths", "profile_dir"):
+            self.profiler.directory = Path(new.Paths.profile_dir or "logs/profiles")
+        if changed("Scheduler"):
+            self.scheduler = self._build_scheduler()
+        if changed("Parsing", "parser"):
+            self.parser = self._select_parser()
+        if changed("Filters"):
+            self.job_filter = self._build_job_filter()
+        if changed("Paths", "sound_file"):
+            self.sound.load(new.Paths.sound_file)
+        if changed("Network", "connect_timeout", "read_timeout", "pool_size"):
+            self.transport.close()
+            self.transport = self._build_transport()
+            if self._executor and changed("Network", "pool_size"):
+                self._executor.shutdown()
+                self._executor = None
+        if changed("Paths", "all_entries_log") or changed(
+            "Logging", "log_all_entries_enabled", "all_entries_mode"
+        ):
+            if self.job_log:
+                self.job_log.close()
+                self.job_log = None
+            if new.Logging.log_all_entries_enabled:
+                self._setup_csv_logging()
+        if changed("Paths", "job_store_db") or changed("Logging", "job_store_enabled"):
+            if self.job_store:
+                self.job_store.close()
+                self.job_store = None
+            if new.Logging.job_store_enabled:
+                self._setup_job_store()
+        if changed("Paths", "log_file") or changed(
+            "Logging", "log_main_enabled", "log_max_bytes", "log_backup_count"
+        ):
+            replace_file_handler(self.logger, self.config)
+        if changed("Metrics"):
+            if self.metrics_server:
+                self.metrics_server.stop()
+                self.metrics_server = None
+            self.start_metrics_server()
+        if changed("Control"):
+            if self.control_server:
+                self.control_server.stop()
+                self.control_server = None
+            self.start_control_server()
+        if old.feeds != new.feeds:
+            self._apply_feeds(new.feeds)
+        self.state.flush_interval = new.Watcher.state_flush_interval
 
-                if is_paused:
-                    self.current_action = "Paused"
-                    wait_time = 5
-                else:
-                    self.current_action = "Fetching"
-                    feed = self.fetch_rss()
-                    if feed is None:
-                        self.failure_count += 1
-                        wait_time = min(
-                            self.config.get("Watcher", "check_interval")
-                            * (2**self.failure_count),
-                            self.config.get("Network", "max_backoff"),
-                        )
-                        self.current_action = f"Backoff ({int(wait_time)}s)"
-                    else:
-                        if self.failure_count > 0:
-                            self.logger.info("Connection re-established.")
-                        self.failure_count = 0
-                        self.last_check_time = datetime.datetime.now()
-                        self.current_action = "Processing"
-                        self._process_feed_entries(feed.entries)
-                        wait_time = self.config.get("Watcher", "check_interval")
-                        self.current_action = "Waiting"
-                self.next_check_time = time.time() + wait_time
+    def _apply_feeds(self, specs):
+        current = {feed.name: feed for feed in self.feeds}
+        feeds = []
+        for spec in specs:
+            feed = current.get(spec.name)
+            if feed is None or feed.url != spec.url:
+                if feed is not None:
+                    # Validators and priming belong to the old URL.
+                    self.state.feed_state(spec.name).update(
+                        primed=False, etag=None, modified=None, failure_count=0
+                    )
+                feed = Feed(spec.name, spec.url, spec.interval)
+            feed.interval = spec.interval
+            feeds.append(feed)
+        self.feeds = feeds
+        self.logger.info(f"Watching {len(feeds)} feed(s).")
 
     def run_notify_test(self):
         self.logger.info("Sending a test notification...")
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from unittest.mock import patch
 
-from gengowatcher.config import AppConfig
+from gengowatcher.config import AppConfig, ConfigError
 
 
 @pytest.fixture
@@ -38,3 +38,82 @@ def test_config_loads_default_values(test_dir):
     assert app_config.get("Watcher", "check_interval") == 31
     assert app_config.get("Watcher", "enable_notifications") is True
     assert app_config.get("Network", "user_agent_email") == "your_email@example.com"
+
+
+def test_config_parses_extra_feeds(test_dir):
+    """Test that [Feeds] entries are added alongside the primary feed_url."""
+    with patch("sys.exit"):
+        AppConfig()
+    with open("config.ini", "a", encoding="utf-8") as f:
+        f.write(
+            "\n[Feeds]\n"
+            "ja_en = https://example.com/ja-en.rss 20\n"
+            "dashboard = https://example.com/dashboard.rss\n"
+        )
+
+    feeds = AppConfig().get_feeds()
+
+    assert [feed.name for feed in feeds] == ["default", "ja_en", "dashboard"]
+    assert feeds[1].url == "https://example.com/ja-en.rss"
+    assert feeds[1].interval == 20
+    assert feeds[2].interval is None
+
+
+def test_config_set_publishes_new_snapshot(test_dir):
+    """Test that set() swaps in a new snapshot and leaves old ones untouched."""
+    with patch("sys.exit"):
+        AppConfig()
+    app_config = AppConfig()
+    before = app_config.snapshot
+
+    app_config.set("Watcher", "min_reward", 7.5)
+
+    assert before.Watcher.min_reward == 0.0
+    assert app_config.snapshot.Watcher.min_reward == 7.5
+    assert app_config.get("Watcher", "min_reward") == 7.5
+    assert app_config.snapshot.Network is before.Network
+    with pytest.raises(AttributeError):
+        app_config.snapshot.Watcher.min_reward = 1.0
+
+    app_config.save_config()
+    assert AppConfig().get("Watcher", "min_reward") == 7.5
+
+
+def test_config_file_changed_and_reload(test_dir):
+    """Test that an external edit is detected once stable and applied live."""
+    with patch("sys.exit"):
+        AppConfig()
+    with open("config.ini", "a", encoding="utf-8") as f:
+        f.write("\n[Feeds]\nja_en = https://example.com/ja-en.rss\n")
+    app_config = AppConfig()
+    assert not app_config.file_changed()
+
+    text = Path("config.ini").read_text(encoding="utf-8")
+    text = text.replace("check_interval = 31", "check_interval = 45")
+    Path("config.ini").write_text(text.split("[Feeds]")[0], encoding="utf-8")
+    os.utime("config.ini", ns=(0, 10**9))
+
+    assert not app_config.file_changed()  # might still be mid-write
+    assert app_config.file_changed()
+    app_config.reload()
+    assert app_config.get("Watcher", "check_interval") == 45
+    assert [feed.name for feed in app_config.get_feeds()] == ["default"]
+    assert not app_config.file_changed()
+
+    app_config.save_config()
+    assert not app_config.file_changed()
+
+
+def test_config_reload_error_keeps_current_settings(test_dir):
+    """Test that a broken edit raises ConfigError and changes nothing."""
+    with patch("sys.exit"):
+        AppConfig()
+    app_config = AppConfig()
+    before = app_config.snapshot
+    with open("config.ini", "a", encoding="utf-8") as f:
+        f.write("\n[Network]\npool_size = many\n")
+
+    with pytest.raises(ConfigError):
+        app_config.reload()
+
+    assert app_config.snapshot is before
@@ -0,0 +1,90 @@
+import os
+import socket
+import stat
+from unittest.mock import MagicMock
+
+import pytest
+
+from gengowatcher import control
+from gengowatcher.watcher import GengoWatcher
+
+pytestmark = pytest.mark.skipif(not control.supported(), reason="needs AF_UNIX")
+
+
+@pytest.fixture
+def server(tmp_path):
+    watcher = MagicMock(spec=GengoWatcher)
+    watcher.pause.return_value = True
+    watcher.stats.return_value = {"paused": True, "session_new_entries": 2}
+    path = tmp_path / "ctl.sock"
+    server = control.ControlServer(watcher, path).start()
+    yield watcher, path
+    server.stop()
+
+
+def test_commands_reach_the_watcher(server):
+    """Test the JSON protocol for each control command."""
+    watcher, path = server
+
+    assert control.send({"command": "pause"}, path) == {
+        "ok": True,
+        "result": {"paused": True, "changed": True},
+    }
+    assert control.send({"command": "setminreward", "amount": "7.5"}, path)["ok"]
+    assert control.send({"command": "stats"}, path)["result"]["paused"] is True
+    control.send({"command": "check"}, path)
+    control.send({"command": "reload"}, path)
+
+    watcher.pause.assert_called_once()
+    watcher.set_min_reward.assert_called_once_with(7.5)
+    watcher.request_check.assert_called_once()
+    watcher.request_reload.assert_called_once()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_bad_requests_get_errors(server):
+    """Test that malformed or unknown requests are answered, not dropped."""
+    watcher, path = server
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(b'not json\n["pause"]\n{"command": "explode"}\n')
+        with sock.makefile("rb") as f:
+            responses = [f.readline() for _ in range(3)]
+
+    assert all(b'"ok": false' in line for line in responses)
+    assert b"unknown command" in responses[2]
+    assert not control.send({"command": "setminreward"}, path)["ok"]
+    watcher.set_min_reward.assert_not_called()
+
+
+@pytest.mark.parametrize("amount", ["nan", "inf", "-inf", -1])
+def test_setminreward_rejects_non_finite_or_negative_amounts(amount):
+    """Test that NaN, infinite and negative minimum rewards are refused."""
+    watcher = MagicMock(spec=GengoWatcher)
+    with pytest.raises(control.ControlError):
+        control.execute(watcher, {"command": "setminreward", "amount": amount})
+    watcher.set_min_reward.assert_not_called()
+
+
+def test_stale_socket_is_replaced_and_removed_on_stop(tmp_path):
+    """Test that a leftover socket file is cleaned up, a live one is kept."""
+    path = tmp_path / "ctl.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+
+    server = control.ControlServer(MagicMock(spec=GengoWatcher), path).start()
+    with pytest.raises(OSError, match="already listening"):
+        control.ControlServer(MagicMock(spec=GengoWatcher), path)
+    server.stop()
+
+    assert not path.exists()
+
+
+def test_client_cli(server, capsys):
+    """Test the command-line client."""
+    _, path = server
+
+    assert control.main(["--socket", str(path), "stats"]) == 0
+    assert '"session_new_entries": 2' in capsys.readouterr().out
+    assert control.main(["--socket", str(path) + ".missing", "pause"]) == 1
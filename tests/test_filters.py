@@ -0,0 +1,102 @@
+import pytest
+
+from gengowatcher.filters import JobFilter, split_list
+
+JA_EN = {
+    "title": "Japanese to English | Business | 120 units | Reward: US$ 6.00",
+    "summary": "<p>Language pair: Japanese &gt; English<br/>Earnings call.</p>",
+}
+DE_EN = {
+    "title": "German to English | 2,400 units | Reward: US$ 48.00",
+    "summary": "<p>Language pair: German &gt; English<br/>Medical device manual.</p>",
+}
+UNLABELLED = {"title": "Job - Reward: $12.34", "summary": "Marketing copy"}
+
+
+def test_language_pairs_with_wildcards():
+    """Test pair rules from the title, the summary, or a wildcard side."""
+    only_ja = JobFilter(language_pairs=["Japanese > English"])
+    to_english = JobFilter(language_pairs=["* to English"])
+    from_summary = {"title": "Urgent job", "summary": JA_EN["summary"]}
+
+    assert only_ja.matches(JA_EN, 6.0)
+    assert only_ja.matches(from_summary, 6.0)
+    assert not only_ja.matches(DE_EN, 48.0)
+    assert to_english.matches(DE_EN, 48.0)
+    assert only_ja.matches(UNLABELLED, 12.34)  # pair unknown, not dropped
+    with pytest.raises(ValueError):
+        JobFilter(language_pairs=["Japanese"])
+
+
+def test_unrecognised_title_pairs_are_not_dropped():
+    """Test that only titles naming two known languages are read as a pair."""
+    only_ja = JobFilter(language_pairs=["Japanese > English"])
+    chinese = JobFilter(language_pairs=["Chinese (Simplified) > English"])
+    title_only = {"title": DE_EN["title"], "summary": ""}
+
+    assert only_ja.matches(
+        {"title": "Please translate this to English | 20 units", "summary": ""}, 1.0
+    )
+    assert chinese.matches({"title": "Simplified Chinese to English", "summary": ""}, 1)
+    assert not only_ja.matches(title_only, 48.0)
+    assert not chinese.matches(title_only, 48.0)
+    # Languages named in the rules are recognised in titles too.
+    assert not JobFilter(language_pairs=["Klingon > English"]).matches(
+        {"title": "Klingon to Japanese | 5 units", "summary": ""}, 1.0
+    )
+
+
+@pytest.mark.parametrize(
+    "summary",
+    [
+        "Language pair: Japanese &gt; English. Deadline 3h",
+        "Language pair: Japanese to English (120 units)",
+        "Language pair: Japanese &gt; English, tier: pro",
+    ],
+)
+def test_summary_pairs_with_trailing_text(summary):
+    """Test that text after the summary's pair does not drop the job."""
+    only_ja = JobFilter(language_pairs=["Japanese > English"])
+    assert only_ja.matches({"title": "Urgent job", "summary": summary}, 1.0)
+    assert not JobFilter(language_pairs=["German > English"]).matches(
+        {"title": "Urgent job", "summary": summary.replace("(120 units)", "")}, 1.0
+    )
+
+
+def test_unknown_summary_pair_is_not_dropped():
+    """Test that a summary pair naming an unknown language lets the job through."""
+    job = {"title": "Job", "summary": "Language pair: Japanese &gt; Englsh (US)"}
+    assert JobFilter(language_pairs=["German > English"]).matches(job, 1.0)
+
+
+def test_keyword_sets_match_whole_words_case_insensitively():
+    """Test include/exclude keyword sets against title and summary."""
+    job_filter = JobFilter(
+        include_keywords=split_list("earnings, manual, C++"),
+        exclude_keywords=split_list("medical"),
+    )
+
+    assert job_filter.matches(JA_EN, 6.0)
+    assert not job_filter.matches(DE_EN, 48.0)  # "Medical" is excluded
+    assert not job_filter.matches(UNLABELLED, 12.34)
+    assert job_filter.matches({"title": "Docs for C++ SDK", "summary": ""}, 1.0)
+    assert not job_filter.matches({"title": "Manuals", "summary": ""}, 1.0)
+
+
+def test_unit_count_and_reward_per_unit():
+    """Test unit bounds and reward-per-unit rules."""
+    assert not JobFilter(min_units=200).matches(JA_EN, 6.0)
+    assert not JobFilter(max_units=2000).matches(DE_EN, 48.0)
+    assert JobFilter(min_units=100, max_units=2400).matches(DE_EN, 48.0)
+    per_unit = JobFilter(min_reward_per_unit=0.03)
+    assert per_unit.matches(JA_EN, 6.0)  # 0.05 per unit
+    assert not per_unit.matches(DE_EN, 48.0)  # 0.02 per unit
+    assert per_unit.matches(UNLABELLED, 12.34)
+    with pytest.raises(ValueError):
+        JobFilter(min_units=10, max_units=5)
+
+
+def test_empty_filter_is_inactive():
+    """Test that a filter without rules is reported as inactive."""
+    assert not JobFilter().active
+    assert JobFilter(exclude_keywords=["proofreading"]).active
@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from gengowatcher.headless import JsonFormatter
+
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR
+    return env
+
+
+def test_json_formatter_emits_one_object_per_record():
+    """Test that log records are rendered as single-line JSON objects."""
+    record = logging.LogRecord(
+        "gengowatcher", logging.INFO, __file__, 1, "New job: %s", ("Job1",), None
+    )
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "gengowatcher"
+    assert payload["message"] == "New job: Job1"
+
+
+@pytest.mark.parametrize("module", ["gengowatcher.headless", "gengowatcher.main"])
+def test_headless_does_not_import_rich(module):
+    """Test that the headless entry points never load Rich or the TUI."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; "
+            "print(any(m == 'rich' or m.startswith(('rich.', 'gengowatcher.ui')) "
+            "for m in sys.modules))",
+        ],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="SIGTERM terminates the process on Windows"
+)
+def test_headless_shuts_down_on_sigterm(tmp_path):
+    """Test that SIGTERM stops the watcher cleanly and saves state."""
+    (tmp_path / "config.ini").write_text(
+        "[Watcher]\n"
+        "feed_url = http://127.0.0.1:9/feed\n"
+        "enable_notifications = False\n"
+        "enable_sound = False\n"
+        "[Logging]\n"
+        "log_main_enabled = False\n"
+        "log_all_entries_enabled = False\n",
+        encoding="utf-8",
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gengowatcher.headless"],
+        cwd=tmp_path,
+        env=_env(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        line = proc.stdout.readline()
+        while "Watcher thread started" not in line:
+            json.loads(line)
+            line = proc.stdout.readline()
+        time.sleep(0.2)
+        proc.send_signal(signal.SIGTERM)
+        out, _ = proc.communicate(timeout=10)
+    finally:
+        proc.kill()
+
+    messages = [json.loads(line)["message"] for line in out.splitlines()]
+    assert proc.returncode == 0
+    assert "Received SIGTERM." in messages
+    assert messages[-1] == "GengoWatcher has shut down."
+    assert (tmp_path / "state.json").is_file()
@@ -0,0 +1,157 @@
+import csv
+import time
+
+import pytest
+
+from gengowatcher.joblog import CsvJobLog
+from gengowatcher.seen import entry_key
+
+
+def _reward(entry):
+    return entry.get("reward", 0.0)
+
+
+def _read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_new_mode_writes_one_row_per_entry(tmp_path):
+    """Test that 'new' mode writes a header and one row per logged entry."""
+    path = tmp_path / "logs" / "all_entries.csv"
+    job_log = CsvJobLog(path, reward_fn=_reward)
+
+    job_log.log_new([{"title": "Job1", "link": "link1", "summary": "", "reward": 5}])
+    job_log.log_sightings("default", [{"link": "link1"}])
+    job_log.close()
+
+    rows = _read_rows(path)
+    assert rows[0] == CsvJobLog.HEADERS["new"]
+    assert len(rows) == 2
+    assert rows[1][1:4] == ["Job1", "5", "link1"]
+
+
+def test_sightings_mode_records_first_and_last_seen(tmp_path):
+    """Test that a job is written once, when it leaves the feed."""
+    path = tmp_path / "all_entries.csv"
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings")
+    job1 = {"title": "Job1", "link": "link1", "summary": ""}
+    job2 = {"title": "Job2", "link": "link2", "summary": ""}
+
+    job_log.log_sightings("default", [job1, job2])
+    job_log.log_sightings("default", [job1, job2])
+    assert len(_read_rows(path)) == 1
+
+    job_log.log_sightings("default", [job2])
+    rows = _read_rows(path)
+    assert rows[0] == CsvJobLog.HEADERS["sightings"]
+    assert len(rows) == 2
+    assert rows[1][2] == "Job1"
+    assert rows[1][0] <= rows[1][1]
+
+    job_log.close()
+    rows = _read_rows(path)
+    assert [row[2] for row in rows[1:]] == ["Job1"]
+
+
+def test_sightings_are_tracked_per_feed(tmp_path):
+    """Test that a job missing from one feed is not closed by another feed."""
+    path = tmp_path / "all_entries.csv"
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings")
+
+    job_log.log_sightings("a", [{"title": "Job1", "link": "link1"}])
+    job_log.log_sightings("b", [{"title": "Job2", "link": "link2"}])
+
+    assert len(_read_rows(path)) == 1
+    job_log.close()
+
+
+def test_partial_sightings_keep_unlisted_jobs(tmp_path):
+    """Test that a truncated entry list does not close jobs it did not reach."""
+    path = tmp_path / "all_entries.csv"
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings")
+    job1 = {"title": "Job1", "link": "link1", "summary": ""}
+    job2 = {"title": "Job2", "link": "link2", "summary": ""}
+
+    job_log.log_sightings("default", [job1, job2])
+    first_seen = job_log._active["default"][entry_key(job2)][0]
+    job_log.log_sightings("default", [job1], partial=True)
+    assert len(_read_rows(path)) == 1
+    assert job_log._active["default"][entry_key(job2)][0] == first_seen
+
+    job_log.log_sightings("default", [job1])
+    rows = _read_rows(path)
+    assert [row[2] for row in rows[1:]] == ["Job2"]
+    assert rows[1][0] == first_seen
+    job_log.close()
+
+
+def test_truncated_polls_close_jobs_that_left_the_feed(tmp_path):
+    """Test that jobs above the stop point are closed across truncated polls."""
+    path = tmp_path / "all_entries.csv"
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings")
+    jobs = [{"title": f"Job{i}", "link": f"link{i}"} for i in range(10)]
+    live = jobs[4::-1]  # newest first
+    job_log.log_sightings("default", live)
+
+    removed = []
+    for job in jobs[5:]:
+        # A new job arrives and an older one near the top is taken.
+        live.insert(0, job)
+        removed.append(live.pop(2))
+        # Reading stops after the first two already-seen jobs.
+        job_log.log_sightings("default", live[:3], partial=True)
+
+    rows = _read_rows(path)[1:]
+    assert [row[2] for row in rows] == [job["title"] for job in removed]
+    assert list(job_log._active["default"]) == [job["link"] for job in live]
+    job_log.close()
+
+
+def test_open_sightings_survive_a_restart(tmp_path):
+    """Test that reopening the log continues sightings instead of restarting them."""
+    path = tmp_path / "all_entries.csv"
+    job1 = {"title": "Job1 | Reward: 5", "link": "link1", "summary": ""}
+    job2 = {"title": "Job2", "link": "link2", "summary": ""}
+
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings")
+    job_log.log_sightings("default", [job1, job2])
+    first_seen = job_log._active["default"]["link1"][0]
+    job_log.close()
+    assert len(_read_rows(path)) == 1
+    assert job_log.open_path.is_file()
+
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings")
+    job_log.log_sightings("default", [job2])
+    rows = _read_rows(path)
+    assert len(rows) == 2
+    assert rows[1][0] == first_seen
+    assert rows[1][2] == "Job1 | Reward: 5"
+    job_log.close()
+    assert len(_read_rows(path)) == 2
+
+
+def test_open_sightings_are_saved_in_batches(tmp_path, monkeypatch):
+    """Test that polls do not write the sightings file themselves."""
+    path = tmp_path / "all_entries.csv"
+    job_log = CsvJobLog(path, reward_fn=_reward, mode="sightings", save_interval=0.1)
+    saves = []
+    original = job_log._save_open
+    monkeypatch.setattr(job_log, "_save_open", lambda: saves.append(original()))
+
+    for _ in range(5):
+        job_log.log_sightings("default", [{"title": "Job1", "link": "link1"}])
+    assert saves == [] and not job_log.open_path.exists()
+
+    deadline = time.time() + 2
+    while not saves and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(saves) == 1 and job_log.open_path.is_file()
+    job_log.close()
+    assert len(saves) == 2
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    """Test that an invalid mode raises a ValueError."""
+    with pytest.raises(ValueError):
+        CsvJobLog(tmp_path / "all_entries.csv", reward_fn=_reward, mode="bogus")
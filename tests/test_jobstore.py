@@ -0,0 +1,97 @@
+import sqlite3
+
+from gengowatcher import jobstore
+from gengowatcher.jobstore import JobStore
+
+
+def _reward(entry):
+    return entry.get("reward", 0.0)
+
+
+def _set_first_seen(path, key, first_seen):
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE jobs SET first_seen = ? WHERE key = ?", (first_seen, key))
+
+
+def test_record_upserts_one_row_per_job(tmp_path):
+    """Test that repeated sightings keep first_seen and advance last_seen."""
+    path = tmp_path / "logs" / "jobs.sqlite3"
+    store = JobStore(path, reward_fn=_reward)
+    job = {"id": "guid1", "title": "Job1", "link": "link1", "reward": 5.0}
+    store.record("default", [job])
+    _set_first_seen(path, "guid1", "2025-01-01T10:00:00")
+    store.record("default", [job, {"link": "link2", "reward": 1.0}])
+
+    jobs = {j.key: j for j in store.jobs()}
+    store.close()
+    assert set(jobs) == {"guid1", "link2"}
+    assert jobs["guid1"].first_seen == "2025-01-01T10:00:00"
+    assert jobs["guid1"].last_seen > jobs["guid1"].first_seen
+    assert jobs["guid1"].reward == 5.0
+
+
+def test_truncated_polls_stop_updating_jobs_that_left(tmp_path, monkeypatch):
+    """Test that truncated polls only keep jobs below the stop point open."""
+    ticks = iter(f"2025-01-01T10:00:{second:02d}" for second in range(60))
+    monkeypatch.setattr(jobstore, "_now", lambda: next(ticks))
+    store = JobStore(tmp_path / "jobs.sqlite3", reward_fn=_reward)
+    jobs = [{"link": f"link{i}"} for i in range(10)]
+    live = jobs[4::-1]
+    store.record("default", live)
+
+    removed = []
+    for job in jobs[5:]:
+        live.insert(0, job)
+        removed.append(live.pop(2))
+        store.record("default", live[:3], partial=True)
+
+    last_seen = {j.key: j.last_seen for j in store.jobs()}
+    store.close()
+    assert store._active["default"] == [job["link"] for job in live]
+    assert last_seen["link3"] == "2025-01-01T10:00:00"  # taken in the first poll
+    assert last_seen["link0"] == "2025-01-01T10:00:05"  # below every stop point
+
+
+def test_store_uses_wal_mode(tmp_path):
+    """Test that the database is opened in write-ahead-log mode."""
+    path = tmp_path / "jobs.sqlite3"
+    JobStore(path).close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_jobs_filters_by_reward_and_age(tmp_path):
+    """Test that jobs() filters on minimum reward and the look-back window."""
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path, reward_fn=_reward)
+    store.record(
+        "default",
+        [
+            {"link": "cheap", "reward": 2.0},
+            {"link": "rich", "reward": 20.0},
+            {"link": "old", "reward": 30.0},
+        ],
+    )
+    _set_first_seen(path, "old", "2000-01-01T10:00:00")
+
+    assert [j.key for j in store.jobs(min_reward=10, hours=24)] == ["rich"]
+    assert {j.key for j in store.jobs(min_reward=10)} == {"rich", "old"}
+    store.close()
+
+
+def test_rewards_by_hour_and_cli(tmp_path, capsys):
+    """Test the hourly aggregate and its command-line front end."""
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path, reward_fn=_reward)
+    store.record(
+        "default", [{"link": "a", "reward": 2.5}, {"link": "b", "reward": 4.0}]
+    )
+    _set_first_seen(path, "a", "2025-01-01T09:15:00")
+    _set_first_seen(path, "b", "2025-01-02T09:45:00")
+    assert store.rewards_by_hour() == [(9, 2, 6.5)]
+    store.close()
+
+    assert jobstore.main(["--db", str(path), "rewards-by-hour"]) == 0
+    assert capsys.readouterr().out == "09:00\t2\t6.50\n"
+    assert jobstore.main(["--db", str(path), "jobs", "--min-reward", "3"]) == 0
+    assert capsys.readouterr().out.split("\t")[1:] == ["4.00", "None", "b\n"]
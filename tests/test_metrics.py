@@ -0,0 +1,64 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from gengowatcher.metrics import MetricsRegistry, MetricsServer, WatcherMetrics
+
+
+def test_counters_and_gauges_render_in_text_format():
+    """Test the Prometheus text exposition of counters and gauges."""
+    registry = MetricsRegistry()
+    polls = registry.counter("polls_total", "Polls.", ("feed",))
+    backoff = registry.gauge("backoff_seconds", "Backoff.", ("feed",))
+    polls.inc(feed="a")
+    polls.inc(2, feed='b"c')
+    backoff.set(62, feed="a")
+
+    assert registry.render().splitlines() == [
+        "# HELP polls_total Polls.",
+        "# TYPE polls_total counter",
+        'polls_total{feed="a"} 1',
+        'polls_total{feed="b\\"c"} 2',
+        "# HELP backoff_seconds Backoff.",
+        "# TYPE backoff_seconds gauge",
+        'backoff_seconds{feed="a"} 62',
+    ]
+    with pytest.raises(ValueError):
+        polls.inc()
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that histogram buckets, sum and count are rendered correctly."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("fetch_seconds", "Fetch.", buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.5, 3):
+        latency.observe(value)
+
+    assert latency.value() == (4, 4.05)
+    assert registry.render().splitlines()[2:] == [
+        'fetch_seconds_bucket{le="0.1"} 1',
+        'fetch_seconds_bucket{le="1"} 3',
+        'fetch_seconds_bucket{le="+Inf"} 4',
+        "fetch_seconds_sum 4.05",
+        "fetch_seconds_count 4",
+    ]
+
+
+def test_metrics_server_serves_registry():
+    """Test that the HTTP endpoint serves /metrics and rejects other paths."""
+    metrics = WatcherMetrics()
+    metrics.new_jobs.inc(3, feed="default")
+    server = MetricsServer(metrics, port=0).start()
+    base = f"http://127.0.0.1:{server.address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/metrics", timeout=2) as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"].startswith("text/plain")
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=2)
+    finally:
+        server.stop()
+
+    assert 'gengowatcher_new_jobs_total{feed="default"} 3' in body
+    assert "# TYPE gengowatcher_fetch_seconds histogram" in body
@@ -0,0 +1,90 @@
+import logging
+import threading
+
+from gengowatcher.notifier import Notification, NotificationDispatcher
+
+
+def _notification(i):
+    return Notification("New Gengo Job Available!", f"Job{i}", f"link{i}", True, True)
+
+
+def test_dispatcher_delivers_off_thread():
+    """Test that submitted notifications are delivered by a worker thread."""
+    delivered = []
+    done = threading.Event()
+
+    def deliver(batch, dropped):
+        delivered.append((threading.current_thread().name, batch, dropped))
+        done.set()
+
+    dispatcher = NotificationDispatcher(deliver, logging.getLogger("test"), workers=1)
+    dispatcher.submit([_notification(1)])
+
+    assert done.wait(timeout=2)
+    dispatcher.stop()
+    name, batch, dropped = delivered[0]
+    assert name.startswith("Notifier-")
+    assert batch == [_notification(1)]
+    assert dropped == 0
+
+
+def test_dispatcher_coalesces_queued_batches():
+    """Test that batches queued behind a slow delivery are merged."""
+    release = threading.Event()
+    batches = []
+
+    def deliver(batch, dropped):
+        release.wait(timeout=2)
+        batches.append(list(batch))
+
+    dispatcher = NotificationDispatcher(deliver, logging.getLogger("test"), workers=1)
+    dispatcher.submit([_notification(0)])
+    for i in range(1, 4):
+        dispatcher.submit([_notification(i)])
+    release.set()
+    dispatcher.stop()
+
+    assert sum(len(batch) for batch in batches) == 4
+    assert len(batches) <= 2
+
+
+def test_dispatcher_backpressure_never_blocks():
+    """Test that a full queue drops alerts and reports them in the next batch."""
+    release = threading.Event()
+    started = threading.Event()
+    drops = []
+
+    def deliver(batch, dropped):
+        started.set()
+        release.wait(timeout=2)
+        drops.append(dropped)
+
+    dispatcher = NotificationDispatcher(
+        deliver, logging.getLogger("test"), workers=1, max_pending=1
+    )
+    dispatcher.submit([_notification(0)])
+    assert started.wait(timeout=2)
+    assert dispatcher.submit([_notification(1)]) is True
+    assert dispatcher.submit([_notification(2), _notification(3)]) is False
+    release.set()
+    dispatcher.stop()
+
+    assert drops == [0, 2]
+
+
+def test_dispatcher_reports_dispatch_latency():
+    """Test that the time from submit to delivery is passed to observe."""
+    latencies = []
+    done = threading.Event()
+    dispatcher = NotificationDispatcher(
+        lambda batch, dropped: None,
+        logging.getLogger("test"),
+        workers=1,
+        observe=lambda seconds: (latencies.append(seconds), done.set()),
+    )
+    dispatcher.submit([_notification(1)])
+
+    assert done.wait(timeout=2)
+    dispatcher.stop()
+    assert len(latencies) == 1
+    assert 0 <= latencies[0] < 2
@@ -0,0 +1,85 @@
+import feedparser
+import pytest
+
+from gengowatcher.parsing import ParseError, parse_document, parse_stream
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Jobs</title>
+<item><title> Job1 | Reward: US$ 1.50 </title><link>https://x/1</link>
+<guid isPermaLink="false">g1</guid>
+<description>&lt;p&gt;Reward: $1.50&lt;/p&gt;</description></item>
+<item><title>Job2</title><link>https://x/2</link></item>
+<item><title>Job3</title><link>https://x/3</link></item>
+<item><title>Job4</title><link>https://x/4</link></item>
+</channel></rss>"""
+
+ATOM = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>Jobs</title>
+<entry><title>A</title><id>urn:1</id><link rel="self" href="https://x/self"/>
+<link href="https://x/a"/><summary>Reward: $2</summary></entry></feed>"""
+
+
+def _chunks(data, size=40, consumed=None):
+    for start in range(0, len(data), size):
+        if consumed is not None:
+            consumed.append(start)
+        yield data[start : start + size]
+
+
+def test_parse_stream_extracts_rss_and_atom_fields():
+    """Test that entries carry the id, title, link and summary fields."""
+    rss = parse_stream(_chunks(RSS))
+    assert rss.truncated is False
+    assert rss.entries[0] == {
+        "title": "Job1 | Reward: US$ 1.50",
+        "link": "https://x/1",
+        "id": "g1",
+        "summary": "<p>Reward: $1.50</p>",
+    }
+    assert [e["link"] for e in rss.entries] == [f"https://x/{i}" for i in range(1, 5)]
+
+    atom = parse_stream(_chunks(ATOM))
+    assert atom.entries == [
+        {"title": "A", "id": "urn:1", "link": "https://x/a", "summary": "Reward: $2"}
+    ]
+
+
+def test_parse_stream_stops_after_seen_entries():
+    """Test that reading stops once enough consecutive entries are seen."""
+    consumed = []
+    parsed = parse_stream(
+        _chunks(RSS, consumed=consumed), seen={"https://x/2", "https://x/3"}
+    )
+    assert parsed.truncated is True
+    assert [e["link"] for e in parsed.entries] == ["https://x/1", "https://x/2"]
+    assert len(consumed) < len(range(0, len(RSS), 40))
+
+    parsed = parse_stream(_chunks(RSS), seen={"https://x/2"}, stop_after=2)
+    assert parsed.truncated is False
+    assert len(parsed.entries) == 4
+
+
+def test_parse_stream_rejects_malformed_xml():
+    """Test that broken documents raise ParseError."""
+    with pytest.raises(ParseError):
+        parse_stream([RSS[:-20]])
+
+
+@pytest.mark.parametrize("document", [RSS, ATOM])
+def test_parse_document_matches_feedparser_fields(document):
+    """Test that the fast parser agrees with feedparser on the fields we use."""
+    fields = ("id", "title", "link", "summary")
+    expected = [
+        {field: entry.get(field) for field in fields}
+        for entry in feedparser.parse(document).entries
+    ]
+    actual = [
+        {field: entry.get(field) for field in fields}
+        for entry in parse_document(document).entries
+    ]
+    assert actual == expected
+
+
+def test_parse_document_rejects_non_feeds():
+    """Test that well-formed XML that is not a feed raises ParseError."""
+    with pytest.raises(ParseError):
+        parse_document(b"<html><body><item>x</item></body></html>")
@@ -0,0 +1,53 @@
+import threading
+
+from gengowatcher.profiling import PHASES, CycleProfiler, PhaseTimer
+
+
+def test_phase_timer_summarizes_recent_cycles():
+    """Test per-phase mean, p95, max and share over the ring buffer."""
+    timer = PhaseTimer(history=3)
+    for fetch in (0.001, 0.002, 0.003, 0.004):
+        timer.begin_cycle()
+        timer.add("fetch", fetch)
+        timer.add("parse", 0.001)
+        timer.end_cycle()
+    timer.add("fetch", 1.0)  # outside a cycle, ignored
+
+    rows = {row.phase: row for row in timer.summary()}
+
+    assert len(timer) == 3
+    assert list(rows) == list(PHASES) + ["total"]
+    assert round(rows["fetch"].mean_ms, 6) == 3.0
+    assert round(rows["fetch"].max_ms, 6) == 4.0
+    assert rows["dedup"].mean_ms == 0.0
+    assert 0 < rows["fetch"].share
+
+
+def test_phase_timer_empty_summary():
+    """Test that no rows are reported before a cycle completes."""
+    timer = PhaseTimer()
+    timer.begin_cycle()
+    with timer.span("log"):
+        pass
+
+    assert timer.summary() == []
+
+
+def test_cycle_profiler_dumps_after_requested_cycles(tmp_path):
+    """Test that profiles from every thread are merged into one dump."""
+    profiler = CycleProfiler(tmp_path / "profiles")
+    assert profiler.cycle_done() is None
+
+    profiler.start(2)
+    paths = []
+    for _ in range(2):
+        with profiler.profile():
+            worker = threading.Thread(target=profiler.wrap(sorted), args=([3, 1],))
+            worker.start()
+            worker.join()
+        paths.append(profiler.cycle_done())
+
+    assert paths[0] is None
+    assert paths[1].suffix == ".prof" and paths[1].exists()
+    assert "sorted" in paths[1].with_suffix(".txt").read_text(encoding="utf-8")
+    assert not profiler.active
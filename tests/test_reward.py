@@ -0,0 +1,49 @@
+from gengowatcher.reward import RewardParser, parse_currency_symbols
+
+
+class RecordingEntry(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read = []
+
+    def get(self, key, default=None):
+        self.read.append(key)
+        return super().get(key, default)
+
+
+def test_title_is_parsed_before_summary():
+    """Test that the summary is not searched when the title has a reward."""
+    parser = RewardParser()
+    entry = RecordingEntry(link="l1", title="Job | Reward: US$ 3.50", summary="x")
+    assert parser.parse(entry) == 3.50
+    assert "summary" not in entry.read
+    entry = {"link": "l2", "title": "Job", "summary": "<p>Reward: $7</p>"}
+    assert parser.parse(entry) == 7.0
+
+
+def test_results_are_cached_per_key():
+    """Test that a reward is parsed once per GUID and the cache is bounded."""
+    parser = RewardParser(cache_size=2)
+    assert parser.parse({"id": "g1", "title": "Reward: $1"}) == 1.0
+    assert parser.parse({"id": "g1", "title": "Reward: $99"}) == 1.0
+    parser.parse({"id": "g2", "title": "Reward: $2"})
+    parser.parse({"id": "g3", "title": "Reward: $3"})
+    assert len(parser) == 2
+    assert parser.parse({"id": "g1", "title": "Reward: $99"}) == 99.0
+
+
+def test_configurable_currency_symbols():
+    """Test that extra currency symbols can be configured."""
+    symbols = parse_currency_symbols("US$, $, €")
+    assert symbols == ("US$", "$", "€")
+    parser = RewardParser(symbols)
+    assert parser.parse({"title": "Reward: € 4.20"}) == 4.20
+    assert RewardParser().parse({"title": "Reward: € 4.20"}) == 0.0
+    assert parse_currency_symbols(" , ") == ("US$", "$")
+
+
+def test_reward_label_is_case_insensitive():
+    """Test that the reward label matches regardless of case."""
+    parser = RewardParser()
+    assert parser.parse({"summary": "<b>REWARD:</b> reward: US$ 9.75"}) == 9.75
+    assert parser.parse({"summary": "no reward here"}) == 0.0
@@ -0,0 +1,56 @@
+import random
+
+from gengowatcher.scheduler import HOURS_PER_WEEK, AdaptiveScheduler, hour_of_week
+
+NOW = 1750500000.0  # Saturday, 21 June 2025
+HOUR = 3600
+
+
+def _scheduler(**kwargs):
+    kwargs.setdefault("jitter", 0)
+    return AdaptiveScheduler(min_interval=15, max_interval=300, **kwargs)
+
+
+def test_unlearned_hours_use_base_interval():
+    """Test that the configured interval is used until an hour has history."""
+    feed_state = {}
+    assert _scheduler().interval(feed_state, 31, now=NOW) == 31
+    assert len(feed_state["arrivals"]["rates"]) == HOURS_PER_WEEK
+
+
+def test_rates_are_learned_per_hour_of_week():
+    """Test that busy hours poll fast and quiet hours poll slowly."""
+    scheduler = _scheduler()
+    feed_state = {}
+    scheduler.record(feed_state, 30, now=NOW)
+    assert scheduler.record(feed_state, 0, now=NOW + HOUR) is True
+    scheduler.record(feed_state, 0, now=NOW + 2 * HOUR)
+
+    rates = feed_state["arrivals"]["rates"]
+    assert rates[hour_of_week(NOW)] == 30
+    assert rates[hour_of_week(NOW + HOUR)] == 0
+    # 30 jobs/hour at 0.5 jobs per poll -> one poll a minute.
+    assert scheduler.interval(feed_state, 31, now=NOW + 1 * 7 * 24 * HOUR) == 60
+    assert scheduler.interval(feed_state, 31, now=NOW + HOUR + 7 * 24 * HOUR) == 300
+
+
+def test_current_hour_activity_speeds_up_polling():
+    """Test that jobs seen in the current hour raise the rate immediately."""
+    scheduler = _scheduler()
+    feed_state = {}
+    scheduler.record(feed_state, 0, now=NOW)
+    scheduler.record(feed_state, 0, now=NOW + HOUR)
+    assert scheduler.interval(feed_state, 31, now=NOW + 7 * 24 * HOUR) == 300
+    scheduler.record(feed_state, 600, now=NOW + 7 * 24 * HOUR)
+    assert scheduler.interval(feed_state, 31, now=NOW + 7 * 24 * HOUR) == 15
+
+
+def test_jitter_stays_within_bounds():
+    """Test that jittered intervals stay within the configured limits."""
+    scheduler = AdaptiveScheduler(
+        min_interval=15, max_interval=300, jitter=0.2, rng=random.Random(1)
+    )
+    intervals = {scheduler.interval({}, 100, now=NOW) for _ in range(50)}
+    assert len(intervals) > 1
+    assert all(80 <= interval <= 120 for interval in intervals)
+    assert all(15 <= scheduler.interval({}, 299, now=NOW) <= 300 for _ in range(50))
@@ -0,0 +1,43 @@
+from gengowatcher.seen import SeenIndex, entry_key
+
+
+def test_entry_key_prefers_guid():
+    """Test that the GUID is used as the key, falling back to the link."""
+    assert entry_key({"id": "guid-1", "link": "link1"}) == "guid-1"
+    assert entry_key({"link": "link1"}) == "link1"
+
+
+def test_seen_index_evicts_least_recently_seen():
+    """Test that the index is bounded and evicts the least recently seen key."""
+    index = SeenIndex(max_size=2, max_age=1000)
+    index.add("a", now=1)
+    index.add("b", now=2)
+    index.add("a", now=3)
+    index.add("c", now=4)
+
+    assert "a" in index
+    assert "b" not in index
+    assert "c" in index
+    assert len(index) == 2
+
+
+def test_seen_index_evicts_expired_keys():
+    """Test that keys not seen within max_age are dropped."""
+    index = SeenIndex(max_size=10, max_age=100)
+    index.add("old", now=0)
+    index.add("new", now=150)
+
+    assert "old" not in index
+    assert "new" in index
+
+
+def test_seen_index_round_trip():
+    """Test that the index can be serialised and restored in order."""
+    index = SeenIndex()
+    index.add("a")
+    index.add("b")
+
+    restored = SeenIndex()
+    restored.load(index.to_list())
+
+    assert restored.to_list() == index.to_list()
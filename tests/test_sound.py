@@ -0,0 +1,76 @@
+import logging
+import threading
+import wave
+
+import pytest
+
+from gengowatcher import sound
+
+
+@pytest.fixture
+def wav_file(tmp_path):
+    path = tmp_path / "alert.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(b"\x00\x00" * 800)
+    return path
+
+
+class RecordingPlayer(sound.SoundPlayer):
+    def __init__(self, *args, **kwargs):
+        self.plays = []
+        self.release = threading.Event()
+        self.release.set()
+        self.played = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _play_now(self):
+        self.plays.append(self._wave)
+        self.played.set()
+        self.release.wait(timeout=2)
+
+
+def test_load_reads_and_decodes_once(wav_file):
+    """Test that the WAV is decoded at load time and played from memory."""
+    player = RecordingPlayer(logging.getLogger("test"), backend="simpleaudio")
+    assert player.load(wav_file) is True
+    wav_file.unlink()
+
+    assert player.play() is True
+    assert player.played.wait(timeout=2)
+    player.stop()
+
+    frames, channels, sample_width, rate = player.plays[0]
+    assert (channels, sample_width, rate) == (1, 2, 8000)
+    assert len(frames) == 1600
+
+
+def test_load_rejects_missing_and_invalid_files(tmp_path):
+    """Test that a missing or non-WAV file leaves the player unloaded."""
+    player = sound.SoundPlayer(logging.getLogger("test"), backend="simpleaudio")
+    assert player.load(tmp_path / "missing.wav") is False
+    assert player.play() is False
+
+    bogus = tmp_path / "bogus.wav"
+    bogus.write_bytes(b"not a wav file")
+    assert player.load(bogus) is False
+    assert not player.loaded
+    player.stop()
+
+
+def test_overlapping_plays_are_deduplicated(wav_file):
+    """Test that play requests made while a sound is playing are dropped."""
+    player = RecordingPlayer(logging.getLogger("test"), backend="simpleaudio")
+    player.load(wav_file)
+    player.release.clear()
+
+    assert player.play() is True
+    assert player.played.wait(timeout=2)
+    assert player.play() is False
+    assert player.play() is False
+    player.release.set()
+    player.stop()
+
+    assert len(player.plays) == 1
@@ -2,6 +2,8 @@ import pytest
 from gengowatcher import state
 import logging
 import os
+import json
+import time
 
 
 def pytest_configure(config):
@@ -34,7 +36,7 @@ def test_appstate_initialization(temp_state_file):
     )
     assert hasattr(app_state, "save_state")
     assert hasattr(app_state, "_load_state")
-    assert app_state.last_seen_link is None
+    assert app_state.feeds == {}
     assert app_state.total_new_entries_found == 0
 
 
@@ -42,21 +44,173 @@ def test_save_and_load_state(temp_state_file):
     """Test that state is correctly saved to and loaded from a file."""
     logger = logging.getLogger("test")
     app_state = state.AppState(logger=logger, state_file_path=temp_state_file)
-    app_state.last_seen_link = "http://example.com/job1"
+    feed = app_state.feed_state("default")
+    feed["primed"] = True
+    feed["etag"] = '"abc123"'
+    feed["modified"] = "Sat, 21 Jun 2025 10:00:00 GMT"
+    feed["failure_count"] = 2
+    app_state.seen.add("http://example.com/job1")
     app_state.total_new_entries_found = 42
     app_state.save_state()
 
     # Create a new instance to load the state from the file
     app_state2 = state.AppState(logger=logger, state_file_path=temp_state_file)
-    assert app_state2.last_seen_link == "http://example.com/job1"
+    feed2 = app_state2.feed_state("default")
+    assert feed2["primed"] is True
+    assert feed2["etag"] == '"abc123"'
+    assert feed2["modified"] == "Sat, 21 Jun 2025 10:00:00 GMT"
+    assert feed2["failure_count"] == 2
+    assert "http://example.com/job1" in app_state2.seen
     assert app_state2.total_new_entries_found == 42
 
 
+def test_legacy_state_file_is_migrated(temp_state_file):
+    """Test that a single-feed state file is loaded as the default feed."""
+    with open(temp_state_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "last_seen_link": "http://example.com/job1",
+                "total_new_entries_found": 7,
+                "etag": '"abc123"',
+            },
+            f,
+        )
+    app_state = state.AppState(
+        logger=logging.getLogger("test"), state_file_path=temp_state_file
+    )
+    feed = app_state.feed_state("default")
+    assert feed["last_seen_link"] == "http://example.com/job1"
+    assert feed["etag"] == '"abc123"'
+    assert feed["primed"] is False
+    assert feed["failure_count"] == 0
+    assert app_state.total_new_entries_found == 7
+
+
 def test_corrupted_state_file(temp_state_file):
     """Test that the app handles a corrupted or invalid state file gracefully."""
     with open(temp_state_file, "w", encoding="utf-8") as f:
         f.write("this is not valid json")
     logger = logging.getLogger("test")
     app_state = state.AppState(logger=logger, state_file_path=temp_state_file)
-    assert app_state.last_seen_link is None
+    assert app_state.feeds == {}
     assert app_state.total_new_entries_found == 0
+
+
+def test_save_state_is_atomic(temp_state_file, monkeypatch):
+    """Test that a failed write leaves the previous state file intact."""
+    logger = logging.getLogger("test")
+    app_state = state.AppState(logger=logger, state_file_path=temp_state_file)
+    app_state.total_new_entries_found = 1
+    app_state.save_state()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state.os, "replace", failing_replace)
+    app_state.total_new_entries_found = 2
+    app_state.save_state()
+
+    with open(temp_state_file, "r", encoding="utf-8") as f:
+        assert json.load(f)["total_new_entries_found"] == 1
+    assert os.listdir(temp_state_file.parent) == [temp_state_file.name]
+
+
+def test_mark_dirty_coalesces_writes(temp_state_file, monkeypatch):
+    """Test that rapid changes are flushed to disk once per interval."""
+    app_state = state.AppState(
+        logger=logging.getLogger("test"),
+        state_file_path=temp_state_file,
+        flush_interval=0.1,
+    )
+    writes = []
+    original = app_state._write_atomic
+    monkeypatch.setattr(
+        app_state, "_write_atomic", lambda payload: writes.append(original(payload))
+    )
+    for count in range(10):
+        app_state.total_new_entries_found = count
+        app_state.mark_dirty()
+    assert writes == []
+
+    deadline = time.time() + 2
+    while not writes and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)
+    assert len(writes) == 1
+    with open(temp_state_file, "r", encoding="utf-8") as f:
+        assert json.load(f)["total_new_entries_found"] == 9
+
+
+def test_close_flushes_pending_changes(temp_state_file):
+    """Test that close writes pending changes without waiting for the timer."""
+    app_state = state.AppState(
+        logger=logging.getLogger("test"),
+        state_file_path=temp_state_file,
+        flush_interval=60,
+    )
+    app_state.total_new_entries_found = 5
+    app_state.mark_dirty()
+    assert not temp_state_file.exists()
+    app_state.close()
+    with open(temp_state_file, "r", encoding="utf-8") as f:
+        assert json.load(f)["total_new_entries_found"] == 5
+
+
+def test_changes_after_close_are_written_at_once(temp_state_file):
+    """Test that a late change after close is saved without a daemon timer."""
+    app_state = state.AppState(
+        logger=logging.getLogger("test"),
+        state_file_path=temp_state_file,
+        flush_interval=60,
+    )
+    app_state.close()
+    app_state.seen.add("link1")
+    app_state.mark_dirty()
+
+    assert app_state._flush_timer is None
+    with open(temp_state_file, "r", encoding="utf-8") as f:
+        assert "link1" in json.dumps(json.load(f)["seen"])
+
+
+def test_stale_state_file_reprimes_feeds(temp_state_file):
+    """Test that feeds are primed again when every seen key has expired."""
+    logger = logging.getLogger("test")
+    app_state = state.AppState(logger=logger, state_file_path=temp_state_file)
+    app_state.feed_state("default").update(primed=True, etag='"abc"')
+    app_state.seen.add("link1")
+    app_state.save_state()
+    eight_days_ago = time.time() - 8 * 86400
+    os.utime(temp_state_file, (eight_days_ago, eight_days_ago))
+
+    reloaded = state.AppState(logger=logger, state_file_path=temp_state_file)
+    feed = reloaded.feed_state("default")
+    assert feed["primed"] is False
+    assert feed["etag"] is None
+
+
+def test_serialization_error_is_retried(temp_state_file, monkeypatch):
+    """Test that a failed serialization keeps the changes pending."""
+    app_state = state.AppState(
+        logger=logging.getLogger("test"),
+        state_file_path=temp_state_file,
+        flush_interval=0.05,
+    )
+    real_dumps = state.json.dumps
+    calls = []
+
+    def flaky_dumps(obj, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise RuntimeError("dictionary changed size during iteration")
+        return real_dumps(obj, **kwargs)
+
+    monkeypatch.setattr(state.json, "dumps", flaky_dumps)
+    app_state.total_new_entries_found = 3
+    app_state.mark_dirty()
+
+    deadline = time.time() + 2
+    while not temp_state_file.exists() and time.time() < deadline:
+        time.sleep(0.01)
+    with open(temp_state_file, "r", encoding="utf-8") as f:
+        assert json.load(f)["total_new_entries_found"] == 3
+    assert calls[-1] == {}  # no indent, so the C encoder is used
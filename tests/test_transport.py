@@ -0,0 +1,110 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gengowatcher.transport import FeedTransport, TransportError
+
+FEED_BODY = b"<rss version='2.0'><channel><title>Jobs</title></channel></rss>"
+LARGE_BODY = (
+    b"<rss><channel>" + b"<item><title>x</title></item>" * 5000 + b"</channel></rss>"
+)
+ETAG = '"v1"'
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        body = LARGE_BODY if self.path == "/large" else FEED_BODY
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", "Sat, 21 Jun 2025 10:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    server.client_ports = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport():
+    t = FeedTransport(connect_timeout=2.0, read_timeout=2.0, pool_size=1)
+    yield t
+    t.close()
+
+
+def _url(server, path="/feed"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_fetch_returns_raw_bytes_and_validators(feed_server, transport):
+    """Test that a 200 response yields the body and caching headers."""
+    result = transport.fetch(_url(feed_server))
+
+    assert result.status == 200
+    assert result.content == FEED_BODY
+    assert result.etag == ETAG
+    assert result.modified == "Sat, 21 Jun 2025 10:00:00 GMT"
+    assert result.content_type == "application/rss+xml"
+
+
+def test_fetch_sends_conditional_headers(feed_server, transport):
+    """Test that a matching ETag produces a 304 with no body."""
+    result = transport.fetch(_url(feed_server), etag=ETAG)
+
+    assert result.status == 304
+    assert result.content == b""
+    assert result.etag == ETAG
+
+
+def test_fetch_reuses_connection(feed_server, transport):
+    """Test that consecutive fetches share one keep-alive connection."""
+    transport.fetch(_url(feed_server))
+    transport.fetch(_url(feed_server))
+
+    assert len(feed_server.client_ports) == 2
+    assert len(set(feed_server.client_ports)) == 1
+
+
+def test_fetch_http_error_raises_transport_error(feed_server, transport):
+    """Test that HTTP errors are wrapped in TransportError."""
+    with pytest.raises(TransportError):
+        transport.fetch(_url(feed_server, "/missing"))
+
+
+def test_stream_stops_early_and_reuses_connection(feed_server, transport):
+    """Test that a partly read stream still returns its connection to the pool."""
+    with transport.stream(_url(feed_server, "/large")) as result:
+        assert result.status == 200
+        first = next(result.content)
+    assert len(first) < len(LARGE_BODY)
+    with transport.stream(_url(feed_server), etag=ETAG) as result:
+        assert result.status == 304
+        assert list(result.content) == []
+
+    assert len(set(feed_server.client_ports)) == 1
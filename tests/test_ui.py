@@ -1,12 +1,13 @@
 import pytest
 import logging
 import collections
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
 # Correctly import from the gengowatcher package
 from gengowatcher import ui
 from gengowatcher.watcher import GengoWatcher
-from gengowatcher.config import AppConfig
+from gengowatcher.config import AppConfig, make_snapshot
 from gengowatcher.state import AppState
 
 
@@ -58,3 +59,103 @@ def test_handle_command_unknown(tui_instance):
 
     # Now this assertion will work because we are calling it on a MagicMock object
     mock_watcher.logger.error.assert_called_once_with("Unknown command: 'unknowncmd'")
+
+
+def test_profile_command_starts_profiler(tui_instance):
+    """Tests that `profile K` profiles the next K cycles."""
+    tui, mock_watcher = tui_instance
+
+    tui.handle_command("prof 3")
+    tui.handle_command("profile")
+
+    assert mock_watcher.profile_next.call_args_list == [((3,),), ((5,),)]
+
+
+@pytest.fixture
+def render_tui(tui_instance, tmp_path, monkeypatch):
+    """A TUI whose watcher/config mocks carry enough state to render panels."""
+    tui, mock_watcher = tui_instance
+    monkeypatch.chdir(tmp_path)
+    mock_watcher.feeds = [MagicMock(url="https://example.com/feed")]
+    mock_watcher.feeds[0].name = "default"
+    mock_watcher.start_time = 0.0
+    mock_watcher.next_check_time = 0.0
+    mock_watcher.session_new_entries = 0
+    mock_watcher.session_total_value = 0.0
+    mock_watcher.failure_count = 0
+    mock_watcher.paused = False
+    mock_watcher.current_action = "Waiting"
+    mock_watcher.shutdown_event = threading.Event()
+    tui.state.total_new_entries_found = 0
+    tui.config.snapshot = make_snapshot(
+        {"Watcher": {"check_interval": 31, "min_reward": 0.0, "enable_sound": False}}
+    )
+    return tui, mock_watcher
+
+
+def test_refresh_layout_only_updates_changed_regions(render_tui):
+    """Tests that unchanged panels are not rebuilt between frames."""
+    tui, _ = render_tui
+    with patch("gengowatcher.ui.time.time", return_value=100.0):
+        assert tui._refresh_layout() == {
+            "header",
+            "runtime_status",
+            "recent_activity",
+            "right",
+            "footer",
+            "input",
+        }
+        assert tui._refresh_layout() == set()
+
+        tui._process_char("c")
+        assert tui._refresh_layout() == {"input"}
+
+        tui.log_queue.append(
+            logging.makeLogRecord({"msg": "Manual check triggered.", "levelno": 20})
+        )
+        assert tui._refresh_layout() == {"recent_activity"}
+
+        tui.config.snapshot = make_snapshot({"Watcher": {"min_reward": 5.0}})
+        assert tui._refresh_layout() == {"header"}
+
+
+def test_refresh_layout_ticks_runtime_status(render_tui):
+    """Tests that the clock only invalidates the runtime status panel."""
+    tui, _ = render_tui
+    with patch("gengowatcher.ui.time.time", return_value=100.0):
+        tui._refresh_layout()
+    with patch("gengowatcher.ui.time.time", return_value=101.0):
+        assert tui._refresh_layout() == {"runtime_status"}
+
+
+def test_logging_handler_defers_rendering(tui_instance):
+    """Tests that records are queued raw and rendered once when drawn."""
+    tui, _ = tui_instance
+    handler = ui.UILoggingHandler()
+    handler.on_emit = MagicMock()
+    tui.log_queue = handler.log_queue
+    logger = logging.getLogger("test.ui.deferred")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        with patch.object(ui, "Text") as text:
+            logger.warning("Fetch slow")
+            text.assert_not_called()
+    finally:
+        logger.removeHandler(handler)
+
+    assert isinstance(handler.log_queue[0], logging.LogRecord)
+    handler.on_emit.assert_called_once()
+    first = tui._get_recent_activity_panel().renderable.renderables[0]
+    again = tui._get_recent_activity_panel().renderable.renderables[0]
+    assert first is again
+    assert first.plain.endswith(" - Fetch slow")
+    assert first.style == "warning"
+
+
+def test_wake_registers_with_watcher(tui_instance):
+    """Tests that the TUI subscribes to watcher change notifications."""
+    tui, mock_watcher = tui_instance
+    mock_watcher.add_listener.assert_called_once_with(tui.wake)
+    tui.wake()
+    assert tui._wake_event.is_set()
@@ -1,11 +1,27 @@
 import pytest
 import logging
+import time
+import threading
+import os
+import concurrent.futures
+import contextlib
+import subprocess
+import sys
+import webbrowser
+from pathlib import Path
+
+import feedparser
 from unittest.mock import MagicMock, patch
 
 # Correctly import from the gengowatcher package
 from gengowatcher import watcher
-from gengowatcher.config import AppConfig
+from gengowatcher.config import AppConfig, FeedSpec, make_snapshot
 from gengowatcher.state import AppState
+from gengowatcher.transport import FetchResult, TransportError
+from gengowatcher.seen import SeenIndex
+from gengowatcher.notifier import Notification
+from gengowatcher.parsing import ParsedFeed
+from gengowatcher.profiling import CycleProfiler
 
 
 # A fixture to create a mocked watcher instance for tests
@@ -15,20 +31,50 @@ def watcher_instance():
     # Use MagicMock for dependencies to isolate the watcher for testing
     mock_config = MagicMock(spec=AppConfig)
     mock_state = MagicMock(spec=AppState)
+    mock_state.seen = SeenIndex()
+    mock_state.total_new_entries_found = 0
+    feed_states = {}
+    mock_state.feed_state.side_effect = lambda name: feed_states.setdefault(
+        name,
+        {"primed": False, "etag": None, "modified": None, "failure_count": 0},
+    )
+    mock_config.get_feeds.return_value = [
+        FeedSpec("default", "https://example.com/feed", None)
+    ]
 
-    # Configure the mock to return default values
-    mock_config.get.side_effect = (
-        lambda section, key, **kwargs: {
+    # Configure the mock with a real snapshot of test values
+    mock_config.snapshot = make_snapshot(
+        {
             "Watcher": {
                 "min_reward": 0.0,
                 "use_custom_user_agent": False,
                 "feed_url": "https://example.com/feed",
+                "check_interval": 31,
+                "enable_notifications": True,
+                "enable_sound": False,
+                "notification_workers": 1,
+                "notification_queue_size": 10,
+                "notification_coalesce_threshold": 3,
             },
-            "Paths": {"browser_path": "", "browser_args": "{url}"},
-            "Network": {"user_agent_email": "test@example.com"},
-        }
-        .get(section, {})
-        .get(key)
+            "Paths": {
+                "browser_path": "",
+                "browser_args": "{url}",
+                "notification_icon_path": "",
+                "sound_file": "",
+            },
+            "Logging": {"log_all_entries_enabled": False},
+            "Network": {
+                "user_agent_email": "test@example.com",
+                "connect_timeout": 1.0,
+                "read_timeout": 1.0,
+                "pool_size": 1,
+                "max_backoff": 300,
+            },
+        },
+        mock_config.get_feeds.return_value,
+    )
+    mock_config.get.side_effect = lambda section, key: getattr(
+        getattr(mock_config.snapshot, section), key
     )
 
     # Use the real GengoWatcher class but with mocked dependencies
@@ -52,8 +98,8 @@ def test_extract_reward(watcher_instance, entry, expected_reward):
 def test_open_in_browser_default(monkeypatch, watcher_instance):
     """Test that the default system browser is used when no path is configured."""
     mock_webbrowser_open = MagicMock()
-    # The path to the object to patch must now include the package name
-    monkeypatch.setattr(watcher.webbrowser, "open", mock_webbrowser_open)
+    # webbrowser is imported lazily, so patch the module itself
+    monkeypatch.setattr(webbrowser, "open", mock_webbrowser_open)
 
     watcher_instance.open_in_browser("http://example.com")
     mock_webbrowser_open.assert_called_once_with("http://example.com")
@@ -64,30 +110,209 @@ def test_handle_exit(watcher_instance):
     watcher_instance.handle_exit()
 
     # Assert that the save methods on the mocked dependencies were called
-    watcher_instance.state.save_state.assert_called_once()
+    watcher_instance.state.close.assert_called_once()
     watcher_instance.config.save_config.assert_called_once()
 
 
-# Use @patch decorator with the corrected path
-@patch("gengowatcher.watcher.feedparser.parse")
+def test_handle_exit_waits_for_poll_in_flight(watcher_instance):
+    """Test that state is closed only after a running poll has finished."""
+    watcher_instance.notifier = MagicMock()
+    events = []
+    watcher_instance.state.close.side_effect = lambda: events.append("close")
+    fetching = threading.Event()
+
+    def slow_fetch(feed):
+        fetching.set()
+        time.sleep(0.3)
+        events.append("fetched")
+        return MagicMock(entries=[])
+
+    watcher_instance.fetch_rss = slow_fetch
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        poll = threading.Thread(
+            target=watcher_instance._poll_feeds,
+            args=(executor, watcher_instance.feeds),
+        )
+        poll.start()
+        fetching.wait(1)
+        watcher_instance.handle_exit()
+        poll.join()
+
+    assert events == ["fetched", "close"]
+
+
+def _notified(w):
+    """Return every notification handed to the dispatcher."""
+    return [n for call in w.notifier.submit.call_args_list for n in call.args[0]]
+
+
+SAMPLE_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Jobs</title>
+<item><title>Job1 - Reward: $10.00</title><link>link1</link></item>
+</channel></rss>"""
+
+
+@patch("feedparser.parse", wraps=feedparser.parse)
 def test_fetch_rss(mock_parse, watcher_instance):
-    """Test the RSS fetching logic."""
+    """Test that fetched bytes are handed to feedparser as a buffer."""
+    watcher_instance.transport.fetch = MagicMock(
+        return_value=FetchResult(200, SAMPLE_RSS, None, None, "application/rss+xml")
+    )
+
+    feed = watcher_instance.fetch_rss(watcher_instance.feeds[0])
+
+    assert [e.link for e in feed.entries] == ["link1"]
+    watcher_instance.transport.fetch.assert_called_once_with(
+        "https://example.com/feed", etag=None, modified=None, headers={}
+    )
+    mock_parse.assert_called_once_with(
+        SAMPLE_RSS, response_headers={"content-type": "application/rss+xml"}
+    )
+
+
+def test_fetch_rss_conditional_get(watcher_instance):
+    """Test that cached validators are sent and refreshed from the response."""
+    feed = watcher_instance.feeds[0]
+    feed_state = watcher_instance.state.feed_state(feed.name)
+    feed_state["primed"] = True
+    feed_state["etag"] = '"old-etag"'
+    feed_state["modified"] = "Fri, 20 Jun 2025 10:00:00 GMT"
+    watcher_instance.transport.fetch = MagicMock(
+        return_value=FetchResult(
+            200, SAMPLE_RSS, '"new-etag"', "Sat, 21 Jun 2025 10:00:00 GMT", None
+        )
+    )
+
+    parsed = watcher_instance.fetch_rss(feed)
+
+    watcher_instance.transport.fetch.assert_called_once_with(
+        "https://example.com/feed",
+        etag='"old-etag"',
+        modified="Fri, 20 Jun 2025 10:00:00 GMT",
+        headers={},
+    )
+    # Validators are only committed once the entries have been processed.
+    assert feed_state["etag"] == '"old-etag"'
+    watcher_instance.notifier = MagicMock()
+    watcher_instance._handle_fetch_result(feed, parsed)
+    assert feed_state["etag"] == '"new-etag"'
+    assert feed_state["modified"] == "Sat, 21 Jun 2025 10:00:00 GMT"
+    watcher_instance.state.mark_dirty.assert_called()
+
+
+@patch("feedparser.parse")
+def test_fetch_rss_not_modified(mock_parse, watcher_instance):
+    """Test that a 304 response skips parsing and keeps the old validators."""
+    feed = watcher_instance.feeds[0]
+    feed_state = watcher_instance.state.feed_state(feed.name)
+    feed_state["etag"] = '"old-etag"'
+    watcher_instance.transport.fetch = MagicMock(
+        return_value=FetchResult(304, b"", '"old-etag"', None, None)
+    )
+
+    parsed = watcher_instance.fetch_rss(feed)
+    watcher_instance._handle_fetch_result(feed, parsed)
+
+    assert parsed.status == 304
+    assert parsed.entries == []
+    mock_parse.assert_not_called()
+    assert feed_state["etag"] == '"old-etag"'
+
+
+def _use_parser(w, parser):
+    """Select a [Parsing] parser on the mocked config."""
+    snapshot = w.config.snapshot
+    parsing = snapshot.Parsing._replace(parser=parser, stop_after_seen=1)
+    w.config.snapshot = w.settings = snapshot._replace(Parsing=parsing)
+    w.parser = parser
+
+
+def _stream_of(result):
+    """Return a stand-in for FeedTransport.stream yielding `result`."""
+
+    @contextlib.contextmanager
+    def stream(url, etag=None, modified=None, headers=None):
+        yield result
+
+    return stream
+
+
+def test_streaming_parser_stops_at_seen_entry(watcher_instance):
+    """Test that streaming mode stops at a seen entry and flags the result."""
+    _use_parser(watcher_instance, "streaming")
+    feed = watcher_instance.feeds[0]
+    watcher_instance.state.feed_state(feed.name)["primed"] = True
+    watcher_instance.state.seen.add("link1")
+    body = SAMPLE_RSS.replace(
+        b"<item>", b"<item><title>Job0</title><link>link0</link></item><item>"
+    )
+    watcher_instance.transport.stream = _stream_of(
+        FetchResult(200, iter([body]), '"v2"', None, None)
+    )
+    watcher_instance.notifier = MagicMock()
+    watcher_instance.job_log = MagicMock()
+
+    parsed = watcher_instance.fetch_rss(feed)
+    watcher_instance._handle_fetch_result(feed, parsed)
+
+    assert [e["link"] for e in parsed.entries] == ["link0", "link1"]
+    assert parsed.truncated is True
+    assert parsed.etag == '"v2"'
+    watcher_instance.job_log.log_sightings.assert_called_once_with(
+        "default", parsed.entries, partial=True
+    )
+    assert [n.url for n in _notified(watcher_instance)] == ["link0"]
+
+
+def test_streaming_parser_falls_back_to_feedparser(watcher_instance):
+    """Test that a malformed streamed document is re-fetched for feedparser."""
+    _use_parser(watcher_instance, "streaming")
+    watcher_instance.transport.stream = _stream_of(
+        FetchResult(200, iter([b"<rss><channel><item>"]), None, None, None)
+    )
+    watcher_instance.transport.fetch = MagicMock(
+        return_value=FetchResult(200, SAMPLE_RSS, None, None, None)
+    )
 
-    class DummyFeed:
-        bozo = False
-        entries = []
+    parsed = watcher_instance.fetch_rss(watcher_instance.feeds[0])
 
-    mock_parse.return_value = DummyFeed()
-    feed = watcher_instance.fetch_rss()
+    assert [e.link for e in parsed.entries] == ["link1"]
+    watcher_instance.transport.fetch.assert_called_once()
 
-    assert isinstance(feed, DummyFeed)
-    mock_parse.assert_called_once_with("https://example.com/feed", request_headers={})
+
+@patch("feedparser.parse", wraps=feedparser.parse)
+def test_fast_parser_skips_feedparser(mock_parse, watcher_instance):
+    """Test that the fast parser only falls back to feedparser when needed."""
+    _use_parser(watcher_instance, "fast")
+    watcher_instance.transport.fetch = MagicMock(
+        return_value=FetchResult(200, SAMPLE_RSS, '"v1"', None, None)
+    )
+    parsed = watcher_instance.fetch_rss(watcher_instance.feeds[0])
+    assert [e["link"] for e in parsed.entries] == ["link1"]
+    assert parsed.etag == '"v1"'
+    mock_parse.assert_not_called()
+
+    body = SAMPLE_RSS.replace(b"Job1", b"Job1 &nbsp;")
+    watcher_instance.transport.fetch.return_value = FetchResult(
+        200, body, None, None, None
+    )
+    # Malformed XML goes to feedparser, which flags it as bozo as before.
+    assert watcher_instance.fetch_rss(watcher_instance.feeds[0]) is None
+    mock_parse.assert_called_once()
+    assert watcher_instance.transport.fetch.call_count == 2
+
+
+def test_fetch_rss_transport_error(watcher_instance):
+    """Test that network failures are reported as a failed fetch."""
+    watcher_instance.transport.fetch = MagicMock(side_effect=TransportError("boom"))
+
+    assert watcher_instance.fetch_rss(watcher_instance.feeds[0]) is None
 
 
 def test_process_feed_entries(watcher_instance):
     """Test the logic for processing new entries from the feed."""
     # Mock the notification method on the instance to avoid side effects
-    watcher_instance.show_notification = MagicMock()
+    watcher_instance.notifier = MagicMock()
 
     entries = [
         {"title": "Job1 - Reward: $10.00", "link": "link1", "summary": ""},
@@ -95,13 +320,517 @@ def test_process_feed_entries(watcher_instance):
     ]
 
     # Set the state on the mocked state object
-    watcher_instance.state.last_seen_link = "link2"
+    watcher_instance.state.seen.add("link2")
     watcher_instance.state.total_new_entries_found = 1
 
-    watcher_instance._process_feed_entries(entries)
+    watcher_instance._process_feed_entries(entries, "default")
 
     # Assert the test outcome
-    watcher_instance.show_notification.assert_called_once()
-    watcher_instance.state.save_state.assert_called_once()
-    assert watcher_instance.state.last_seen_link == "link1"
+    assert len(_notified(watcher_instance)) == 1
+    watcher_instance.state.mark_dirty.assert_called_once()
+    assert "link1" in watcher_instance.state.seen
     assert watcher_instance.state.total_new_entries_found == 2
+
+
+def test_process_feed_entries_survives_reordering(watcher_instance):
+    """Test that removing or reordering seen jobs does not re-notify them."""
+    watcher_instance.notifier = MagicMock()
+    for link in ("link1", "link2", "link3"):
+        watcher_instance.state.seen.add(link)
+
+    # link1 was taken (removed) and the remaining jobs were shuffled.
+    entries = [
+        {"title": "Job3", "link": "link3", "summary": ""},
+        {"title": "Job4", "link": "link4", "summary": ""},
+        {"title": "Job2", "link": "link2", "summary": ""},
+    ]
+    watcher_instance._process_feed_entries(entries, "default")
+
+    assert len(_notified(watcher_instance)) == 1
+    assert _notified(watcher_instance)[0].url == "link4"
+
+
+def test_process_feed_entries_prefers_guid(watcher_instance):
+    """Test that entries are keyed by GUID when the feed provides one."""
+    watcher_instance.notifier = MagicMock()
+    watcher_instance.state.seen.add("guid-1")
+
+    watcher_instance._process_feed_entries(
+        [{"id": "guid-1", "title": "Job1", "link": "link1-changed", "summary": ""}],
+        "default",
+    )
+
+    assert _notified(watcher_instance) == []
+
+
+def test_first_fetch_primes_feed_without_notifying(watcher_instance):
+    """Test that a feed that was never primed marks its entries as seen."""
+    watcher_instance.notifier = MagicMock()
+    feed = watcher_instance.feeds[0]
+    parsed = {"entries": [{"link": "link1"}, {"link": "link2"}]}
+
+    watcher_instance._handle_fetch_result(feed, MagicMock(**parsed))
+
+    assert _notified(watcher_instance) == []
+    assert watcher_instance.state.feed_state(feed.name)["primed"] is True
+    assert "link1" in watcher_instance.state.seen
+    assert "link2" in watcher_instance.state.seen
+
+
+def test_priming_honours_legacy_cursor(watcher_instance):
+    """Test that jobs above a migrated last_seen_link are still reported."""
+    watcher_instance.notifier = MagicMock()
+    feed = watcher_instance.feeds[0]
+    watcher_instance.state.feed_state(feed.name)["last_seen_link"] = "link2"
+    entries = [{"link": "link1"}, {"link": "link2"}, {"link": "link3"}]
+
+    watcher_instance._handle_fetch_result(feed, MagicMock(entries=entries))
+
+    assert len(_notified(watcher_instance)) == 1
+    assert _notified(watcher_instance)[0].url == "link1"
+    assert "last_seen_link" not in watcher_instance.state.feed_state(feed.name)
+
+
+def test_feed_backoff_is_per_feed(watcher_instance):
+    """Test that a failing feed backs off without delaying the others."""
+    watcher_instance.feeds = [
+        watcher.Feed("a", "https://example.com/a", 10),
+        watcher.Feed("b", "https://example.com/b", 10),
+    ]
+    before = time.time()
+
+    watcher_instance._handle_fetch_result(watcher_instance.feeds[0], None)
+    watcher_instance._handle_fetch_result(
+        watcher_instance.feeds[1], MagicMock(entries=[])
+    )
+
+    assert watcher_instance.state.feed_state("a")["failure_count"] == 1
+    assert watcher_instance.state.feed_state("b")["failure_count"] == 0
+    assert watcher_instance.feeds[0].next_check_time >= before + 20
+    assert watcher_instance.feeds[1].next_check_time < before + 11
+    assert watcher_instance.failure_count == 1
+
+
+def test_adaptive_scheduler_sets_next_check(watcher_instance):
+    """Test that the adaptive scheduler picks the interval after a check."""
+    watcher_instance.notifier = MagicMock()
+    watcher_instance.scheduler = MagicMock()
+    watcher_instance.scheduler.record.return_value = True
+    watcher_instance.scheduler.interval.return_value = 123
+    feed = watcher_instance.feeds[0]
+    watcher_instance.state.feed_state(feed.name)["primed"] = True
+    parsed = feedparser.FeedParserDict(
+        entries=[{"title": "Job1", "link": "link1", "summary": ""}]
+    )
+
+    before = time.time()
+    watcher_instance._handle_fetch_result(feed, parsed)
+
+    feed_state = watcher_instance.state.feed_state(feed.name)
+    watcher_instance.scheduler.record.assert_called_once_with(feed_state, 1)
+    watcher_instance.scheduler.interval.assert_called_once_with(feed_state, 31)
+    assert before + 123 <= feed.next_check_time < before + 124
+    watcher_instance.state.mark_dirty.assert_called()
+
+
+def test_not_modified_keeps_listed_jobs_seen(watcher_instance):
+    """Test that 304s refresh listed keys and expired feeds are re-primed."""
+    w = watcher_instance
+    w.notifier = MagicMock()
+    w.state.seen.max_age = 100
+    feed = w.feeds[0]
+    feed_state = w.state.feed_state(feed.name)
+    feed_state["primed"] = True
+    job = {"title": "Job1", "link": "l1"}
+    w._handle_fetch_result(feed, feedparser.FeedParserDict(entries=[job]))
+    w.notifier.submit.reset_mock()
+
+    with patch.object(watcher.time, "time", return_value=time.time() + 60):
+        w._handle_fetch_result(feed, feedparser.FeedParserDict(status=304, entries=[]))
+    with patch.object(watcher.time, "time", return_value=time.time() + 120):
+        w._handle_fetch_result(feed, feedparser.FeedParserDict(status=304, entries=[]))
+    assert w.state.seen.to_list()[0][1] > time.time()  # refreshed, not expired
+
+    # Without a refresh for longer than max_age the feed is primed again,
+    # so the jobs still listed are not reported as new.
+    feed_state["refreshed"] = time.time() - 200
+    feed_state["etag"] = '"old"'
+    w.state.seen.load([])
+    w._handle_fetch_result(feed, feedparser.FeedParserDict(entries=[job]))
+    assert feed_state["primed"] is True and feed_state["etag"] is None
+    assert "l1" in w.state.seen
+    assert _notified(w) == []
+
+
+def test_fetch_results_update_metrics(watcher_instance):
+    """Test that checks, failures, 304s and new jobs are counted per feed."""
+    watcher_instance.notifier = MagicMock()
+    feed = watcher_instance.feeds[0]
+    metrics = watcher_instance.metrics
+    watcher_instance.state.feed_state(feed.name)["primed"] = True
+
+    watcher_instance._handle_fetch_result(feed, None)
+    assert metrics.errors.value(feed="default") == 1
+    assert metrics.backoff_seconds.value(feed="default") == 62
+    assert metrics.consecutive_failures.value(feed="default") == 1
+
+    watcher_instance._handle_fetch_result(
+        feed, feedparser.FeedParserDict(entries=[{"title": "Job1", "link": "l1"}])
+    )
+    watcher_instance._handle_fetch_result(
+        feed, feedparser.FeedParserDict(status=304, entries=[])
+    )
+    assert metrics.polls.value(feed="default") == 3
+    assert metrics.not_modified.value(feed="default") == 1
+    assert metrics.new_jobs.value(feed="default") == 1
+    assert metrics.backoff_seconds.value(feed="default") == 0
+    assert metrics.process_seconds.value(feed="default")[0] == 2
+
+
+def test_poll_feeds_fetches_concurrently(watcher_instance):
+    """Test that due feeds are fetched in parallel, not one after another."""
+    watcher_instance.feeds = [
+        watcher.Feed(name, f"https://example.com/{name}", 10) for name in "abc"
+    ]
+
+    def slow_fetch(feed):
+        time.sleep(0.2)
+        return MagicMock(entries=[])
+
+    watcher_instance.fetch_rss = slow_fetch
+    start = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        watcher_instance._poll_feeds(executor, watcher_instance.feeds)
+
+    assert time.time() - start < 0.5
+    assert watcher_instance.current_action == "Waiting"
+
+
+def test_poll_feeds_records_phase_timings(watcher_instance):
+    """Test that a poll cycle is timed phase by phase."""
+    watcher_instance.notifier = MagicMock()
+    watcher_instance.state.feed_state("default")["primed"] = True
+    watcher_instance.fetch_rss = lambda feed: MagicMock(
+        entries=[{"title": "Job - Reward: $5", "link": "link1"}],
+        get=lambda key, default=None: default,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        watcher_instance._poll_feeds(executor, watcher_instance.feeds)
+
+    rows = {row.phase: row for row in watcher_instance.timings.summary()}
+    assert len(watcher_instance.timings) == 1
+    assert rows["total"].max_ms > 0
+    for phase in ("dedup", "reward", "notify", "save"):
+        assert rows[phase].max_ms > 0
+
+
+def test_profile_write_failure_does_not_stop_polling(watcher_instance, tmp_path):
+    """Test that an unwritable profile directory is logged, not raised."""
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    watcher_instance.profiler = CycleProfiler(blocker / "profiles")
+    watcher_instance.logger = MagicMock()
+    watcher_instance.fetch_rss = lambda feed: MagicMock(entries=[])
+    watcher_instance.profile_next(1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        watcher_instance._poll_feeds(executor, watcher_instance.feeds)
+
+    watcher_instance.logger.error.assert_called_once()
+    assert "Could not write profile" in watcher_instance.logger.error.call_args[0][0]
+    assert not watcher_instance.profiler.active
+    assert watcher_instance.current_action == "Waiting"
+
+
+def test_only_unseen_entries_are_logged(watcher_instance):
+    """Test that entries already seen are not written to the CSV again."""
+    watcher_instance.notifier = MagicMock()
+    watcher_instance.job_log = MagicMock()
+    watcher_instance.state.seen.add("link2")
+    entries = [
+        {"title": "Job1", "link": "link1", "summary": ""},
+        {"title": "Job2", "link": "link2", "summary": ""},
+    ]
+
+    watcher_instance._process_feed_entries(entries, "default")
+
+    watcher_instance.job_log.log_new.assert_called_once_with([entries[0]])
+    watcher_instance.job_log.log_sightings.assert_called_once_with(
+        "default", entries, partial=False
+    )
+
+
+def test_job_store_records_each_poll_once(watcher_instance):
+    """Test that every entry of a poll is upserted into the job store."""
+    watcher_instance.notifier = MagicMock()
+    watcher_instance.job_store = MagicMock()
+    watcher_instance.state.seen.add("link2")
+    entries = [
+        {"title": "Job1", "link": "link1", "summary": ""},
+        {"title": "Job2", "link": "link2", "summary": ""},
+    ]
+
+    watcher_instance._process_feed_entries(entries, "default")
+
+    watcher_instance.job_store.record.assert_called_once_with(
+        "default", entries, partial=False
+    )
+
+
+def test_process_feed_entries_submits_one_batch(watcher_instance):
+    """Test that all new jobs from a poll are queued as a single batch."""
+    watcher_instance.notifier = MagicMock()
+    entries = [
+        {"title": f"Job{i}", "link": f"link{i}", "summary": ""} for i in range(5)
+    ]
+
+    watcher_instance._process_feed_entries(entries, "default")
+
+    watcher_instance.notifier.submit.assert_called_once()
+    assert [n.url for n in _notified(watcher_instance)] == [
+        f"link{i}" for i in reversed(range(5))
+    ]
+
+
+@patch("plyer.notification.notify")
+def test_deliver_notifications_coalesces_bursts(mock_notify, watcher_instance):
+    """Test that a burst of jobs produces one summary toast."""
+    watcher_instance.open_in_browser = MagicMock()
+    batch = [
+        Notification("New Gengo Job Available!", f"Job{i}", f"link{i}", True, True)
+        for i in range(12)
+    ]
+
+    watcher_instance._deliver_notifications(batch)
+
+    mock_notify.assert_called_once()
+    assert mock_notify.call_args.kwargs["title"] == "12 New Gengo Jobs Available!"
+    assert watcher_instance.open_in_browser.call_count == 12
+
+
+@patch("plyer.notification.notify")
+def test_deliver_notifications_small_batch(mock_notify, watcher_instance):
+    """Test that a couple of jobs still get individual toasts."""
+    batch = [
+        Notification("New Gengo Job Available!", f"Job{i}", None, False, False)
+        for i in range(2)
+    ]
+
+    watcher_instance._deliver_notifications(batch)
+
+    assert mock_notify.call_count == 2
+
+
+def test_importing_watcher_defers_heavy_backends():
+    """Test that feed, HTTP and notification libraries load on first use."""
+    heavy = ["feedparser", "requests", "plyer", "webbrowser", "subprocess"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, gengowatcher.watcher; "
+            f"print([m for m in {heavy!r} if m in sys.modules])",
+        ],
+        env={"PYTHONPATH": str(Path(__file__).parent.parent / "src")},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_apply_config_rebuilds_only_changed_resources(watcher_instance, tmp_path):
+    """Test that a live reload only replaces what its settings touch."""
+    w = watcher_instance
+    old = w.config.snapshot
+    transport, sound, job_log = w.transport, MagicMock(), MagicMock()
+    w.sound, w.job_log = sound, job_log
+    feed_state = w.state.feed_state("default")
+    feed_state.update(primed=True, etag='"old"')
+    default_feed = w.feeds[0]
+
+    w.config.snapshot = new = old._replace(
+        Watcher=old.Watcher._replace(min_reward=5.0),
+        feeds=old.feeds + (FeedSpec("ja_en", "https://example.com/ja-en", 20),),
+    )
+    w.apply_config(old, new)
+
+    assert w.settings is new
+    assert w.transport is transport
+    assert w.job_log is job_log
+    sound.load.assert_not_called()
+    assert w.feeds[0] is default_feed
+    assert [(f.name, f.interval) for f in w.feeds] == [("default", None), ("ja_en", 20)]
+    assert feed_state["etag"] == '"old"'
+
+    w.config.snapshot = newer = new._replace(
+        Network=new.Network._replace(read_timeout=30.0),
+        Paths=new.Paths._replace(
+            sound_file="alert.wav", all_entries_log=str(tmp_path / "jobs.csv")
+        ),
+        Logging=new.Logging._replace(log_all_entries_enabled=True),
+        feeds=(FeedSpec("default", "https://example.com/other", None),),
+    )
+    w.apply_config(new, newer)
+
+    assert w.transport is not transport
+    sound.load.assert_called_once_with("alert.wav")
+    job_log.close.assert_called_once()
+    assert w.job_log is not None and w.job_log is not job_log
+    assert [f.url for f in w.feeds] == ["https://example.com/other"]
+    assert feed_state["primed"] is False and feed_state["etag"] is None
+    w.job_log.close()
+
+
+def test_apply_config_updates_watcher_limits(watcher_instance, tmp_path):
+    """Test that seen index, notifier, timing and profile settings apply live."""
+    w = watcher_instance
+    old = w.config.snapshot
+    notifier, timings = w.notifier, w.timings
+    for key in ("a", "b", "c"):
+        w.state.seen.add(key)
+
+    w.config.snapshot = new = old._replace(
+        Watcher=old.Watcher._replace(
+            seen_index_size=2,
+            seen_index_max_age_days=1,
+            notification_workers=2,
+            timing_history=5,
+        ),
+        Paths=old.Paths._replace(profile_dir=str(tmp_path)),
+    )
+    w.apply_config(old, new)
+
+    assert (w.state.seen.max_size, w.state.seen.max_age) == (2, 86400)
+    assert "a" not in w.state.seen and len(w.state.seen) == 2
+    assert w.notifier is not notifier
+    assert w.timings is not timings and w.timings._cycles.maxlen == 5
+    assert w.profiler.directory == tmp_path
+    w.notifier.stop()
+
+
+def test_run_reloads_when_config_file_changes(watcher_instance):
+    """Test that the run loop picks up config.ini edits between polls."""
+    w = watcher_instance
+    w.settings = w.settings._replace(
+        Watcher=w.settings.Watcher._replace(config_watch_interval=0.01)
+    )
+    w.next_check_time = w.feeds[0].next_check_time = time.time() + 60
+    w.config.file_changed.side_effect = [False, True]
+    w.reload_config = MagicMock(side_effect=w.shutdown_event.set)
+
+    thread = threading.Thread(target=w.run, daemon=True)
+    thread.start()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+    w.reload_config.assert_called_once()
+
+
+def test_pause_state_is_kept_in_memory(watcher_instance, tmp_path, monkeypatch):
+    """Test pause/resume, with the pause file only as optional persistence."""
+    monkeypatch.chdir(tmp_path)
+    w = watcher_instance
+
+    assert w.pause() is True
+    assert w.pause() is False
+    assert w.paused and os.path.exists(w.PAUSE_FILE)
+    assert w.stats()["paused"] is True
+    assert w.resume() is True
+    assert not w.paused and not os.path.exists(w.PAUSE_FILE)
+
+    w.settings = w.config.snapshot = w.config.snapshot._replace(
+        Watcher=w.config.snapshot.Watcher._replace(persist_pause=False)
+    )
+    w.pause()
+    assert w.paused and not os.path.exists(w.PAUSE_FILE)
+
+
+def _wait_until(predicate, timeout=2.0):
+    """Return how long it took for `predicate` to become true."""
+    start = time.perf_counter()
+    while not predicate():
+        assert time.perf_counter() - start < timeout, "timed out"
+        time.sleep(0.001)
+    return time.perf_counter() - start
+
+
+@pytest.fixture
+def running_watcher(watcher_instance):
+    """A watcher running its loop with a 300 s interval and no config polling."""
+    w = watcher_instance
+    w.settings = w.settings._replace(
+        Watcher=w.settings.Watcher._replace(config_watch_interval=0.0)
+    )
+    w.feeds[0].interval = 300
+    polls = []
+    w.fetch_rss = lambda feed: polls.append(time.time()) or ParsedFeed(
+        bozo=False, entries=[]
+    )
+    thread = threading.Thread(target=w.run, daemon=True)
+    thread.start()
+    _wait_until(lambda: polls and w.current_action == "Waiting")
+    yield w, polls, thread
+    w.stop()
+    thread.join(timeout=2)
+
+
+def test_check_now_wakes_the_loop_immediately(running_watcher):
+    """Test that a manual check runs at once, not after the interval."""
+    w, polls, _ = running_watcher
+
+    w.request_check()
+
+    assert _wait_until(lambda: len(polls) == 2) < 0.2
+
+
+def test_pause_and_resume_wake_the_loop_immediately(running_watcher):
+    """Test that pausing and resuming take effect without waiting."""
+    w, polls, _ = running_watcher
+    w.config.snapshot = w.settings = w.settings._replace(
+        Watcher=w.settings.Watcher._replace(persist_pause=False)
+    )
+
+    w.pause()
+    assert _wait_until(lambda: w.current_action == "Paused") < 0.2
+    w.resume()
+    assert _wait_until(lambda: w.current_action == "Waiting") < 0.2
+    assert len(polls) == 1
+
+
+def test_reload_and_shutdown_wake_the_loop_immediately(running_watcher):
+    """Test that a reload request and shutdown are handled at once."""
+    w, _, thread = running_watcher
+    w.reload_config = MagicMock()
+
+    w.request_reload()
+    assert _wait_until(lambda: w.reload_config.called) < 0.2
+
+    w.stop()
+    assert _wait_until(lambda: not thread.is_alive()) < 0.2
+
+
+def test_filtered_jobs_are_dropped_before_notification(watcher_instance):
+    """Test that [Filters] rules run before any notification work."""
+    w = watcher_instance
+    w.notifier = MagicMock()
+    old = w.config.snapshot
+    w.config.snapshot = w.settings = new = old._replace(
+        Watcher=old.Watcher._replace(min_reward=2.0),
+        Filters=old.Filters._replace(
+            language_pairs="* > English", exclude_keywords="proofreading"
+        ),
+    )
+    w.apply_config(old, new)
+    entries = [
+        {"title": "Japanese to English | Reward: US$ 5.00", "link": "l1"},
+        {"title": "English to German | Reward: US$ 9.00", "link": "l2"},
+        {"title": "French to English | Proofreading | Reward: US$ 9.00", "link": "l3"},
+        {"title": "Korean to English | Reward: US$ 1.00", "link": "l4"},
+    ]
+
+    assert w._process_feed_entries(entries, "default") == 4
+
+    assert [n.url for n in _notified(w)] == ["l1"]
+    assert w.session_new_entries == 1
+    assert w.metrics.filtered_jobs.value(feed="default") == 3
+    assert "l2" in w.state.seen